@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 19:27:08 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Micro-benchmarks of the per-cell text helpers in utils.
+
+Every helper is timed over the cells of the tables in tests/fixtures, the
+same strings it sees in an extraction, and reported as microseconds per
+call. Run from the repository root:
+
+    python -m benchmarks.bench_helpers [--repeat N] [--output bench_output.txt]
+"""
+
+
+import argparse
+import glob
+import os
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+
+from src import utils
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "fixtures")
+
+FOOTNOTES = {0: '1', 1: '2', 2: '3'}
+
+# Helpers called once per cell, with the extra arguments they take
+HELPERS = [
+    ("unicode_text_cleaner", ()),
+    ("convert_and_parenthesize_superscripts", ()),
+    ("bracket_to_paranth", ()),
+    ("check_issuer_in_text", ()),
+    ("para_whitespace_stripper", ()),
+    ("three_zero_to_thousand", ()),
+    ("dollar_sign_to_dollar_word", ()),
+    ("unit_extractor", ()),
+    ("unit_analyser", ()),
+    ("unit_extracted_for_text", ()),
+    ("text_reducer", ()),
+    ("text_reducer2", ()),
+    ("ends_text_strip", ()),
+    ("check_single_digit_or_letter", ()),
+    ("out_paranth_footnote_into_paranth", (FOOTNOTES,)),
+    ("footnote_remover", (FOOTNOTES,)),
+    ("table_footnote_extractor", (FOOTNOTES,)),
+    ("tokenize_cell", ()),
+    ("convert_to_pattern", ()),
+    ("convert_to_pattern_without_comma", ()),
+    ("convert_to_pattern_words", ()),
+    ("convert_to_pattern_words_without_comma", ()),
+    ("other_missing_creater", ()),
+    ("unit_remover", ()),
+    ("general_parenth_remover", ()),
+    ("star_remover", ()),
+    ("single_digit_or_letter_in_parenth_remover", ()),
+    ("extract_single_digit_or_letter_in_parenth", ()),
+    ("dollar_dropper", ()),
+    ("convert_to_number", ()),
+    ("inner_cell_health_checker", ()),
+]
+
+
+def fixture_cells():
+    """Cleaned texts of every table cell in the fixtures"""
+    cells = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            soup = BeautifulSoup(f.read(), "lxml")
+        for cell in soup.find_all(["td", "th"]):
+            text = utils.unicode_text_cleaner(cell.get_text(" "))
+            if text:
+                cells.append(text)
+    return cells
+
+
+def _accepts(helper, cell, args):
+    # Some helpers raise on cells the extraction never passes them
+    try:
+        helper(cell, *args)
+    except Exception:
+        return False
+    return True
+
+
+def bench(cells, repeat=5, number=20):
+    """Best-of-``repeat`` microseconds per call for each helper in HELPERS, ``number`` passes over the cells each"""
+    results = []
+    for name, args in HELPERS:
+        helper = getattr(utils, name)
+        accepted = [cell for cell in cells if _accepts(helper, cell, args)]
+
+        def run():
+            for cell in accepted:
+                helper(cell, *args)
+
+        best = min(timeit.repeat(run, number=number, repeat=repeat))
+        results.append((name, best / number / len(accepted) * 1e6))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[2])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    cells = fixture_cells()
+    lines = [f"{len(cells)} cells, best of {args.repeat}", f"{'helper':<45}{'us/call':>10}"]
+    lines += [f"{name:<45}{micros:>10.2f}" for name, micros in bench(cells, args.repeat)]
+    report = "\n".join(lines)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
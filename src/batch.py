@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 16:20:37 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Batch fetching of section HTML and period end dates for many filings:
+asyncio workers with bounded concurrency, token-bucket rate limits for
+sec-api and EDGAR, and pooled keep-alive HTTP connections. Results are
+yielded as soon as each filing is complete so parsing can start while
+the remaining downloads are still running.
+"""
+
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional
+
+from .cache import normalize_filing_url
+from .clients import SecApiClient, get_client
+from .retry import DEFAULT_RETRY_POLICY, PERMANENT, THROTTLED, FetchFailed, RetryPolicy
+from .utils import _put_in_cache, fetch_period_end_date_from_document
+
+
+# Requests per second; EDGAR allows at most 10 per client under its fair access policy
+DEFAULT_API_RATE = 10.0
+DEFAULT_EDGAR_RATE = 10.0
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class TokenBucket:
+    """
+    Asyncio token bucket: ``rate`` tokens per second, at most ``burst`` banked.
+
+    ``acquire`` waits until a token is available, so all coroutines sharing
+    one bucket stay under the rate together. The rate adapts AIMD-style:
+    ``throttle`` halves it (down to ``min_rate``) when the server answers
+    429, ``recover`` adds ``recovery_step`` per success up to the
+    configured rate.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None,
+                 min_rate: Optional[float] = None, recovery_step: Optional[float] = None):
+        self.rate = float(rate)
+        self.max_rate = self.rate
+        self.min_rate = float(min_rate if min_rate is not None else self.rate / 16)
+        self.recovery_step = float(recovery_step if recovery_step is not None else self.rate / 50)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def throttle(self) -> None:
+        self.rate = max(self.min_rate, self.rate / 2)
+        # Drop banked tokens so the slowdown takes effect immediately
+        self._tokens = min(self._tokens, 0.0)
+
+    def recover(self) -> None:
+        self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+
+@dataclass
+class FetchResult:
+    """Raw inputs of one filing, with the API attempt count and final error of each request"""
+    filing_url: str
+    html_content: str = ''
+    period_report_date: str = ''
+    html_attempts: int = 0
+    period_attempts: int = 0
+    html_error: Optional[str] = None
+    period_error: Optional[str] = None
+    seconds: float = 0.0
+
+    @property
+    def error(self) -> Optional[str]:
+        errors = [f"{name}: {error}" for name, error in [('section', self.html_error), ('period', self.period_error)] if error]
+        return '; '.join(errors) or None
+
+    def to_extractor(self, **kwargs):
+        """RepurchaseExtractor ready for ``extract()``, without further network access"""
+        from .main import RepurchaseExtractor
+        extractor = RepurchaseExtractor.from_html(self.html_content, self.period_report_date,
+                                                  file_link_filing=self.filing_url, **kwargs)
+        extractor._record_fetch_logs({'attempts': self.html_attempts, 'error': self.html_error},
+                                     {'attempts': self.period_attempts, 'error': self.period_error})
+        return extractor
+
+
+class BatchFetcher:
+    """
+    Fetch section HTML and period end dates for many filings concurrently.
+
+    Parameters
+    ----------
+    client : SecApiClient, optional
+        Client for sec-api requests; its session is also used for EDGAR.
+        Defaults to the shared client for the ``SEC_API_KEY`` environment
+        variable.
+    section : str, optional
+        ExtractorApi section identifier. Defaults to "part2item2".
+    max_concurrency : int, optional
+        Number of filings in flight at once; also the size of the worker
+        thread pool.
+    api_rate, edgar_rate : float, optional
+        Request-rate caps (per second) for sec-api and for EDGAR.
+    cache : SectionCache, optional
+        Consulted before any request; successful responses are written back.
+    timeout : float, optional
+        Timeout in seconds of EDGAR requests; sec-api requests use the
+        client's own timeout.
+    retry_policy : RetryPolicy, optional
+        Retries of sec-api requests. A 429 also slows the shared sec-api
+        rate limiter down; successes speed it back up.
+    user_agent_env : str, optional
+        Environment variable holding the User-Agent EDGAR requires. While
+        it is unset, period end dates come from sec-api only. Defaults to
+        "SEC_USER_AGENT".
+
+    Examples
+    --------
+    >>> async def run(urls):
+    ...     async for result in BatchFetcher(max_concurrency=8).fetch(urls):
+    ...         extractor = result.to_extractor()
+    ...         extractor.extract()
+    """
+
+    def __init__(self, client: Optional[SecApiClient] = None, section: str = "part2item2",
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 api_rate: float = DEFAULT_API_RATE, edgar_rate: float = DEFAULT_EDGAR_RATE,
+                 cache=None, timeout: float = 60, retry_policy: Optional[RetryPolicy] = None,
+                 user_agent_env: str = "SEC_USER_AGENT"):
+        self.client = client if client is not None else get_client()
+        self.section = section
+        self.max_concurrency = max_concurrency
+        self.api_rate = api_rate
+        self.edgar_rate = edgar_rate
+        self.cache = cache
+        self.timeout = timeout
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.user_agent_env = user_agent_env
+        self.stats = {'filings': 0, 'api_requests': 0, 'edgar_requests': 0, 'cache_hits': 0,
+                      'retries': 0, 'throttled': 0, 'errors': 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key):
+        # Called from the worker threads as well as the event loop
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _fetch_section(self, filing_url):
+        self._count('api_requests')
+        return self.client.get_section(filing_url, self.section, "html")
+
+    def _fetch_period_from_edgar(self, filing_url):
+        self._count('edgar_requests')
+        return fetch_period_end_date_from_document(filing_url, user_agent_env=self.user_agent_env,
+                                                   timeout=self.timeout, session=self.client.session)
+
+    def _fetch_period_from_api(self, filing_url):
+        self._count('api_requests')
+        xbrl_json = self.client.xbrl_to_json(filing_url)
+        return xbrl_json['CoverPage']['DocumentPeriodEndDate']
+
+    async def _call_api(self, loop, executor, fn, filing_url):
+        """Run one sec-api request with retries; returns (result, attempts) or raises FetchFailed"""
+        attempt = 0
+        while True:
+            attempt += 1
+            await self._api_bucket.acquire()
+            try:
+                result = await loop.run_in_executor(executor, fn, filing_url)
+            except Exception as e:
+                kind = self.retry_policy.classify(e)
+                if kind == THROTTLED:
+                    self._count('throttled')
+                    self._api_bucket.throttle()
+                if kind == PERMANENT:
+                    raise FetchFailed(e, attempt, PERMANENT) from e
+                if attempt >= self.retry_policy.max_attempts:
+                    raise FetchFailed(e, attempt, 'exhausted') from e
+                self._count('retries')
+                await asyncio.sleep(self.retry_policy.backoff(attempt, e))
+            else:
+                self._api_bucket.recover()
+                return result, attempt
+
+    async def _fetch_one(self, loop, executor, filing_url):
+        started = time.perf_counter()
+        result = FetchResult(filing_url)
+
+        async def section():
+            # Cache lookups happen before acquiring a token so hits never wait on the limiter
+            if self.cache is not None:
+                cached_html = self.cache.get_section(filing_url, self.section)
+                if cached_html is not None:
+                    self._count('cache_hits')
+                    return cached_html, 0
+            # Written back only after the request, so a cache error is not taken for a failed fetch
+            html_content, attempts = await self._call_api(loop, executor, self._fetch_section, filing_url)
+            if self.cache is not None and html_content:
+                _put_in_cache(self.cache.put_section, filing_url, self.section, html_content)
+            return html_content, attempts
+
+        async def period():
+            if self.cache is not None:
+                cached_date = self.cache.get_period_date(filing_url)
+                if cached_date is not None:
+                    self._count('cache_hits')
+                    return cached_date, 0
+            # Inline XBRL cover page first; the XBRL-to-JSON conversion costs an API call.
+            # EDGAR requires a User-Agent, without one no request is sent or counted
+            period_date = None
+            if os.getenv(self.user_agent_env):
+                await self._edgar_bucket.acquire()
+                period_date = await loop.run_in_executor(executor, self._fetch_period_from_edgar, filing_url)
+            attempts = 0
+            if not period_date:
+                period_date, attempts = await self._call_api(loop, executor, self._fetch_period_from_api, filing_url)
+            if self.cache is not None and period_date:
+                _put_in_cache(self.cache.put_period_date, filing_url, period_date)
+            return period_date, attempts
+
+        html_outcome, period_outcome = await asyncio.gather(section(), period(), return_exceptions=True)
+        if isinstance(html_outcome, BaseException):
+            result.html_error = str(html_outcome)
+            result.html_attempts = getattr(html_outcome, 'attempts', 0)
+        else:
+            html_content, result.html_attempts = html_outcome
+            result.html_content = html_content or ''
+        if isinstance(period_outcome, BaseException):
+            result.period_error = str(period_outcome)
+            result.period_attempts = getattr(period_outcome, 'attempts', 0)
+        else:
+            period_date, result.period_attempts = period_outcome
+            result.period_report_date = period_date or ''
+        if result.error:
+            self._count('errors')
+        result.seconds = time.perf_counter() - started
+        self._count('filings')
+        return result
+
+    async def fetch(self, filing_urls: Iterable[str]) -> AsyncIterator[FetchResult]:
+        """Yield one FetchResult per filing URL, in completion order"""
+        loop = asyncio.get_running_loop()
+        self._api_bucket = TokenBucket(self.api_rate)
+        self._edgar_bucket = TokenBucket(self.edgar_rate)
+        pending = asyncio.Queue()
+        # Bounded so finished results wait for the consumer instead of piling up
+        results = asyncio.Queue(maxsize=self.max_concurrency)
+        done = object()
+
+        for filing_url in dict.fromkeys(normalize_filing_url(url) for url in filing_urls):
+            pending.put_nowait(filing_url)
+
+        async def worker(executor):
+            while True:
+                try:
+                    filing_url = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    await results.put(done)
+                    return
+                await results.put(await self._fetch_one(loop, executor, filing_url))
+
+        # Each filing runs its two requests in parallel, hence two threads per worker
+        with ThreadPoolExecutor(max_workers=2 * self.max_concurrency) as executor:
+            workers = [asyncio.create_task(worker(executor)) for _ in range(self.max_concurrency)]
+            try:
+                finished = 0
+                while finished < len(workers):
+                    item = await results.get()
+                    if item is done:
+                        finished += 1
+                    else:
+                        yield item
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+    def fetch_all(self, filing_urls: Iterable[str]) -> list:
+        """Blocking wrapper around ``fetch`` returning all results"""
+        async def collect():
+            return [result async for result in self.fetch(filing_urls)]
+        return asyncio.run(collect())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 10:12:03 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Persistent on-disk cache for the raw inputs of an extraction: the Part II
+Item 2 section HTML and the DocumentPeriodEndDate of a filing.
+"""
+
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def normalize_filing_url(filing_url: str) -> str:
+    """
+    Map the different spellings of a filing URL onto one canonical form.
+
+    The inline XBRL viewer link (``https://www.sec.gov/ix?doc=/Archives/...``)
+    and the plain archive link point to the same document, so both are
+    reduced to ``https://www.sec.gov/Archives/...``.
+    """
+    url = filing_url.strip()
+    if '/ix?doc=' in url:
+        base, doc = url.split('/ix?doc=', 1)
+        url = base + doc
+    return url
+
+
+class SectionCache:
+    """
+    Size-bounded LRU cache of section HTML and period end dates.
+
+    Entries live in a single SQLite file inside ``path`` and are addressed by
+    the SHA-256 of (kind, normalized filing URL, section). Payloads are
+    zlib-compressed; once the compressed total exceeds ``max_bytes`` the
+    least recently used entries are evicted.
+
+    Parameters
+    ----------
+    path : str
+        Directory holding the cache database. Created if missing.
+    max_bytes : int, optional
+        Upper bound on the total compressed payload size. Defaults to 512 MiB.
+    compress_level : int, optional
+        zlib compression level (0-9). Defaults to 6.
+
+    Examples
+    --------
+    >>> cache = SectionCache("~/.cache/sec-repurchase")
+    >>> extractor = RepurchaseExtractor(url, cache=cache)
+    >>> extractor.extract()
+    >>> cache.stats
+    {'hits': 0, 'misses': 2, 'writes': 2, 'evictions': 0}
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES, compress_level: int = 6):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+
+        os.makedirs(self.path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(self.path, 'sections.sqlite3'),
+            timeout=30,
+            check_same_thread=False,
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " kind TEXT NOT NULL,"
+            " filing_url TEXT NOT NULL,"
+            " section TEXT NOT NULL,"
+            " payload BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(kind: str, filing_url: str, section: str = "") -> str:
+        raw = "\x00".join([kind, normalize_filing_url(filing_url), section])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _get(self, kind, filing_url, section=""):
+        key = self.make_key(kind, filing_url, section)
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self.stats['hits'] += 1
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def _put(self, kind, filing_url, section, value):
+        key = self.make_key(kind, filing_url, section)
+        payload = zlib.compress(value.encode('utf-8'), self.compress_level)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, kind, normalize_filing_url(filing_url), section,
+                 sqlite3.Binary(payload), len(payload), time.time()),
+            )
+            self.stats['writes'] += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        # Drop least recently used entries until the compressed total fits
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_access ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            self.stats['evictions'] += 1
+
+    def get_section(self, filing_url: str, section: str = "part2item2") -> Optional[str]:
+        return self._get('section', filing_url, section)
+
+    def put_section(self, filing_url: str, section: str, html: str) -> None:
+        self._put('section', filing_url, section, html)
+
+    def get_period_date(self, filing_url: str) -> Optional[str]:
+        return self._get('period_date', filing_url)
+
+    def put_period_date(self, filing_url: str, period_date: str) -> None:
+        self._put('period_date', filing_url, "", period_date)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
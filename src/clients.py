@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 17:48:12 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Shared sec-api clients. One client per (API key, base URL) is kept for the
+lifetime of the process, so every extraction reuses the same requests
+session and its keep-alive connections instead of building new sec_api
+objects per call.
+"""
+
+
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_BASE_URL = "https://api.sec-api.io"
+DEFAULT_POOL_SIZE = 32
+
+
+def make_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """requests.Session keeping up to ``pool_size`` connections per host alive"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class ApiError(Exception):
+    """Non-200 sec-api response; the message matches the sec_api package"""
+    def __init__(self, status_code, text, retry_after=None):
+        self.status_code = status_code
+        self.retry_after = retry_after
+        super().__init__(f"API error: {status_code} - {text}")
+
+
+class SecApiClient:
+    """
+    Session-backed replacement for the sec_api ExtractorApi and XbrlApi calls we use.
+
+    Each call sends a single request; a non-200 response raises
+    ``ApiError``. Retrying is left to the caller (see ``src.retry``).
+    Safe to share across threads.
+
+    Parameters
+    ----------
+    api_key : str
+        sec-api key.
+    session : requests.Session, optional
+        Session to send requests with. Defaults to a pooled keep-alive session.
+    base_url : str, optional
+        API root, e.g. a local stand-in server. Defaults to the
+        ``SEC_API_BASE_URL`` environment variable, then to sec-api.io.
+    timeout : float, optional
+        Per-request timeout in seconds.
+    """
+
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None,
+                 base_url: Optional[str] = None, timeout: float = 60):
+        self.api_key = api_key
+        self.session = session if session is not None else make_session()
+        self.base_url = (base_url or os.getenv("SEC_API_BASE_URL") or DEFAULT_BASE_URL).rstrip('/')
+        self.timeout = timeout
+
+    def _get(self, path, params):
+        response = self.session.get(self.base_url + path, params=dict(params, token=self.api_key),
+                                    timeout=self.timeout)
+        if response.status_code != 200:
+            retry_after = response.headers.get('Retry-After', '')
+            raise ApiError(response.status_code, response.text,
+                           float(retry_after) if retry_after.replace('.', '', 1).isdigit() else None)
+        return response
+
+    def get_section(self, filing_url: str, section: str = "part2item2", return_type: str = "html") -> str:
+        """Section of a 10-Q/10-K, like ``ExtractorApi.get_section``"""
+        if not filing_url:
+            raise ValueError("filing_url must be present")
+        return self._get("/extractor", {'url': filing_url, 'item': section, 'type': return_type}).text
+
+    def xbrl_to_json(self, htm_url: str) -> dict:
+        """XBRL financial data of a filing as JSON, like ``XbrlApi.xbrl_to_json``"""
+        if not htm_url:
+            raise ValueError("htm_url must be present")
+        return self._get("/xbrl-to-json", {'htm-url': htm_url}).json()
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(api_key_env: str = "SEC_API_KEY", api_key: Optional[str] = None) -> SecApiClient:
+    """
+    Return the process-wide client for an API key, creating it on first use.
+
+    Raises
+    ------
+    ValueError
+        If no key is passed and the environment variable is not set.
+    """
+    api_key = api_key or os.getenv(api_key_env)
+    if not api_key:
+        raise ValueError(
+            f"Missing API key: please set the environment variable '{api_key_env}'"
+        )
+    key = (api_key, os.getenv("SEC_API_BASE_URL") or DEFAULT_BASE_URL)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = SecApiClient(api_key, base_url=key[1])
+        return client
+
+
+def close_clients() -> None:
+    """Close and forget all registered clients"""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 14:05:41 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Local replacement for ExtractorApi.get_section: finds the issuer purchases
+section (Part II Item 2 of a 10-Q, Item 5 of a 10-K) inside a filing
+document stored on disk.
+"""
+
+
+import html as html_lib
+import re
+from typing import Optional
+
+from .utils import read_html_source
+
+
+# Headings that open the section, by form type
+SECTION_START_PATTERNS = {
+    '10-Q': re.compile(
+        r'item\s*2\s*[.:\-–—]?\s*unregistered\s+sales?\s+of\s+equity\s+securities',
+        re.IGNORECASE),
+    '10-K': re.compile(
+        r'item\s*5\s*[.:\-–—]?\s*market\s+for\s+(the\s+)?(registrant|company)',
+        re.IGNORECASE),
+}
+
+# Headings of the items that follow the section, by form type
+SECTION_END_PATTERNS = {
+    '10-Q': re.compile(
+        r'item\s*(3\s*[.:\-–—]?\s*defaults\s+upon\s+senior'
+        r'|4\s*[.:\-–—]?\s*(mine\s+safety|submission\s+of\s+matters|\(?removed)'
+        r'|5\s*[.:\-–—]?\s*other\s+information'
+        r'|6\s*[.:\-–—]?\s*exhibits)',
+        re.IGNORECASE),
+    '10-K': re.compile(
+        r'item\s*(6\s*[.:\-–—]?\s*(\[?\s*reserved|selected\s+(consolidated\s+)?financial)'
+        r'|7\s*[.:\-–—]?\s*management)',
+        re.IGNORECASE),
+}
+
+TAG_RE = re.compile(r'<!--.*?-->|<[^>]*>', re.DOTALL)
+BLOCK_TAG_RE = re.compile(r'</?(div|p|br|tr|td|th|table|li|h[1-6]|center)\b', re.IGNORECASE)
+BLOCK_OPEN_RE = re.compile(r'<(div|p|h[1-6]|table|center)\b', re.IGNORECASE)
+TABLE_TAG_RE = re.compile(r'<(/?)table\b', re.IGNORECASE)
+DOCUMENT_RE = re.compile(r'<DOCUMENT>(.*?)</DOCUMENT>', re.DOTALL | re.IGNORECASE)
+DOC_TYPE_RE = re.compile(r'<TYPE>\s*([^\s<]+)', re.IGNORECASE)
+DOC_TEXT_RE = re.compile(r'<TEXT>(.*?)</TEXT>', re.DOTALL | re.IGNORECASE)
+
+
+def extract_primary_document(raw: str) -> str:
+    """
+    Return the main 10-Q/10-K document from an EDGAR full-submission .txt.
+
+    Input that is not an SGML submission is returned unchanged.
+    """
+    if '<DOCUMENT>' not in raw[:10000].upper():
+        return raw
+
+    first_text = None
+    for document in DOCUMENT_RE.finditer(raw):
+        body = document.group(1)
+        text_match = DOC_TEXT_RE.search(body)
+        if not text_match:
+            continue
+        if first_text is None:
+            first_text = text_match.group(1)
+        type_match = DOC_TYPE_RE.search(body)
+        if type_match and type_match.group(1).upper().startswith(('10-Q', '10-K')):
+            return text_match.group(1)
+
+    # EDGAR lists the primary document first
+    return first_text if first_text is not None else raw
+
+
+def _text_projection(document):
+    """Visible text of the document plus, per text segment, its offset in the text and in the HTML"""
+    pieces = []
+    text_offsets = []
+    html_offsets = []
+    text_len = 0
+    pos = 0
+    for tag in TAG_RE.finditer(document):
+        if tag.start() > pos:
+            segment = html_lib.unescape(document[pos:tag.start()]).replace('\xa0', ' ')
+            pieces.append(segment)
+            text_offsets.append(text_len)
+            html_offsets.append(pos)
+            text_len += len(segment)
+        if BLOCK_TAG_RE.match(tag.group()):
+            pieces.append(' ')
+            text_len += 1
+        pos = tag.end()
+    if pos < len(document):
+        pieces.append(html_lib.unescape(document[pos:]).replace('\xa0', ' '))
+        text_offsets.append(text_len)
+        html_offsets.append(pos)
+    return ''.join(pieces), text_offsets, html_offsets
+
+
+def _html_offset(text_pos, text_offsets, html_offsets):
+    """HTML offset of the text segment containing text_pos"""
+    lo, hi = 0, len(text_offsets) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if text_offsets[mid] <= text_pos:
+            lo = mid
+        else:
+            hi = mid - 1
+    return html_offsets[lo] if html_offsets else 0
+
+
+def _enclosing_block_start(document, html_pos):
+    """Start of the block element holding html_pos, widened to an enclosing <table> if any"""
+    start = 0
+    for block in BLOCK_OPEN_RE.finditer(document, 0, html_pos):
+        start = block.start()
+
+    # Headings laid out in a table cell: start at the outermost open table
+    depth = 0
+    outer_table = None
+    for tag in TABLE_TAG_RE.finditer(document, 0, html_pos):
+        if tag.group(1):
+            depth = max(depth - 1, 0)
+            if depth == 0:
+                outer_table = None
+        else:
+            if depth == 0:
+                outer_table = tag.start()
+            depth += 1
+    if outer_table is not None:
+        start = min(start, outer_table)
+    return start
+
+
+def _find_section(text, form_type):
+    """Text span (start, end) of the longest start-to-end heading run, skipping table-of-contents hits"""
+    start_re = SECTION_START_PATTERNS[form_type]
+    end_re = SECTION_END_PATTERNS[form_type]
+
+    best = None
+    for start_match in start_re.finditer(text):
+        end_match = end_re.search(text, start_match.end())
+        end = end_match.start() if end_match else len(text)
+        if best is None or end - start_match.start() > best[1] - best[0]:
+            best = (start_match.start(), end)
+    return best
+
+
+def locate_repurchase_section(document, form_type: Optional[str] = None) -> str:
+    """
+    Find the issuer purchases section in a locally stored filing.
+
+    Parameters
+    ----------
+    document : str, bytes, os.PathLike or file-like
+        A 10-Q/10-K ``.htm`` document or an EDGAR full-submission ``.txt``,
+        in any form accepted by ``read_html_source``.
+    form_type : str, optional
+        ``'10-Q'`` (Part II Item 2) or ``'10-K'`` (Item 5). Detected from the
+        headings when omitted.
+
+    Returns
+    -------
+    str
+        The HTML slice from the section heading up to the next item heading,
+        or ``''`` when the section cannot be found (the same value
+        ``fetch_repurchases_html_section`` returns on failure).
+
+    Notes
+    -----
+    - Table-of-contents entries are skipped by taking the candidate heading
+      with the longest distance to the following item heading.
+    """
+    document = extract_primary_document(read_html_source(document))
+    text, text_offsets, html_offsets = _text_projection(document)
+
+    form_types = [form_type.upper()[:4]] if form_type else ['10-Q', '10-K']
+    for candidate in form_types:
+        span = _find_section(text, candidate)
+        if span is None:
+            continue
+        start = _enclosing_block_start(document, _html_offset(span[0], text_offsets, html_offsets))
+        if span[1] >= len(text):
+            end = len(document)
+        else:
+            end = _enclosing_block_start(document, _html_offset(span[1], text_offsets, html_offsets))
+        if end <= start:
+            continue
+        return document[start:end]
+    return ''
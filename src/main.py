@@ -23,16 +23,38 @@ import calendar
 
 import datetime
 
+import time
+
 import os
 
 import copy 
 
+from concurrent.futures import ThreadPoolExecutor, wait
+
 from .utils import *
+from .cache import SectionCache
+from .locator import extract_primary_document, locate_repurchase_section
+from .scanner import DEFAULT_WINDOW_CHARS, compact_section
+from .vectorized import (clean_cells, convert_to_number_cells, dollar_extractor_cells, inner_cell_health_checker_cells,
+                         text_reducer2_cells, text_reducer_cells)
 
 from dotenv import load_dotenv
 load_dotenv()
 
 
+# Seconds both sec-api requests of one filing may take together
+DEFAULT_FETCH_TIMEOUT = 120
+
+# Cell transforms of _preprocess_table, before and after empty rows and columns are dropped;
+# clean_cells runs the cleanup steps over the whole table at once
+CELL_CLEANUP_STEPS = CellPipeline(convert_to_string_if_not_nan, unicode_text_cleaner,
+                                  convert_and_parenthesize_superscripts, bracket_to_paranth, check_issuer_in_text)
+CELL_NOTATION_STEPS = CellPipeline(para_whitespace_stripper, three_zero_to_thousand, dollar_sign_to_dollar_word)
+
+# BeautifulSoup backend for the section: 'lxml', 'html.parser' or 'html5lib'
+DEFAULT_PARSER = 'lxml'
+
+
 class ExtractionError(Exception):
     """Custom exception for extraction flow control"""
     def __init__(self, extraction_metadata, repurchase_data, message=""):
@@ -43,24 +65,111 @@ class ExtractionError(Exception):
 
 
 class RepurchaseExtractor:
-    def __init__(self, file_link_filing):
+    def __init__(self, file_link_filing, cache=None, fetch_timeout=DEFAULT_FETCH_TIMEOUT, parser=DEFAULT_PARSER):
         self.file_link_filing = file_link_filing
+        self.cache = cache
+        self.fetch_timeout = fetch_timeout
+        self.parser = parser
         self.extraction_metadata = {}
         self.repurchase_data = pd.DataFrame()
         self.html_content = None
         self.period_report_date = None
         self.period_year = None
         self.table = None
-        self.soup_before = None
-        self.soup_after = None
+        self._section_split = None
     
-    def _fetch_html_and_period_data(self):
-        """Fetch HTML content and period report date from SEC filing"""
-        self.html_content = fetch_repurchases_html_section(self.file_link_filing)
-        period_report_str = fetch_period_report_date(self.file_link_filing)
-        self.period_report_date = pd.to_datetime(period_report_str, format='%Y-%m-%d')
+    @property
+    def soup_before(self):
+        """Section text above the table of interest, parsed on first access"""
+        return self._section_split.soup_before if self._section_split is not None else None
+    
+    @property
+    def soup_after(self):
+        """Section text below the table of interest, parsed on first access"""
+        return self._section_split.soup_after if self._section_split is not None else None
+    
+    @classmethod
+    def from_html(cls, html, period_end_date, file_link_filing=None, **kwargs):
+        """Build an extractor from already-downloaded section HTML (str, bytes, path or file object)"""
+        extractor = cls(file_link_filing, **kwargs)
+        extractor.html_content = read_html_source(html)
+        extractor._set_period_report_date(period_end_date)
+        return extractor
+
+    @classmethod
+    def from_stream(cls, source, period_end_date, file_link_filing=None, window_chars=DEFAULT_WINDOW_CHARS, **kwargs):
+        """Build an extractor from a very large section, read in chunks and cut down to its candidate tables"""
+        return cls.from_html(compact_section(source, window_chars), period_end_date,
+                             file_link_filing=file_link_filing, **kwargs)
+    
+    @classmethod
+    def from_document(cls, document, period_end_date=None, form_type=None, file_link_filing=None, **kwargs):
+        """Build an extractor from a locally stored 10-Q/10-K document or full-submission .txt"""
+        document = extract_primary_document(read_html_source(document))
+        if period_end_date is None:
+            # Read the date from the inline XBRL cover page instead of calling XbrlApi
+            period_end_date = extract_period_end_date(document)
+            if period_end_date is None:
+                raise ValueError("No dei:DocumentPeriodEndDate found in the document; pass period_end_date explicitly")
+        section_html = locate_repurchase_section(document, form_type=form_type)
+        return cls.from_html(section_html, period_end_date, file_link_filing=file_link_filing, **kwargs)
+
+    def _set_period_report_date(self, period_report):
+        """Store the period end date given as 'YYYY-MM-DD' or a date-like object"""
+        if isinstance(period_report, str):
+            self.period_report_date = pd.to_datetime(period_report, format='%Y-%m-%d')
+        else:
+            self.period_report_date = pd.Timestamp(period_report)
         self.period_year = self.period_report_date.year
+
+    def _fetch_html_and_period_data(self):
+        """Fetch HTML content and period report date from SEC filing, both requests in parallel"""
+        html_log, period_log = {}, {}
+        executor = ThreadPoolExecutor(max_workers=2)
+        html_future = executor.submit(fetch_repurchases_html_section, self.file_link_filing, cache=self.cache, fetch_log=html_log)
+        period_future = executor.submit(fetch_period_report_date, self.file_link_filing, cache=self.cache, fetch_log=period_log)
+        
+        # Both requests share one deadline; whatever is still running after it counts as a failed fetch
+        done, not_done = wait([html_future, period_future], timeout=self.fetch_timeout)
+        executor.shutdown(wait=False, cancel_futures=True)
+        
+        if not_done:
+            self.extraction_metadata['fetch_timed_out'] = [name for name, future in [('html', html_future), ('period', period_future)] if future in not_done]
+            print(f"Fetch timed out after {self.fetch_timeout}s: {self.extraction_metadata['fetch_timed_out']}")
+            for future, log in [(html_future, html_log), (period_future, period_log)]:
+                if future in not_done:
+                    log['error'] = f"timed out after {self.fetch_timeout}s"
+        
+        self.html_content = html_future.result() if html_future in done else ''
+        period_report_str = period_future.result() if period_future in done else ''
+        self._set_period_report_date(period_report_str)
+        self._record_fetch_logs(html_log, period_log)
+    
+    def _record_fetch_logs(self, html_log, period_log):
+        """Store attempt counts and final errors of the section and period date requests"""
+        self.extraction_metadata['html_fetch_attempts'] = html_log.get('attempts', 0)
+        self.extraction_metadata['period_fetch_attempts'] = period_log.get('attempts', 0)
+        if html_log.get('error'):
+            self.extraction_metadata['html_fetch_error'] = html_log['error']
+        if period_log.get('error'):
+            self.extraction_metadata['period_fetch_error'] = period_log['error']
     
+    def _stop_no_repurchase_activity(self, reason, statement):
+        """Terminate a section that reports no repurchases, recording why ('statement' or 'degenerate_table')"""
+        self.extraction_metadata['self_term_re'] = 'no_repurchase_activity'
+        self.extraction_metadata['no_repurchase_reason'] = reason
+        if statement:
+            self.extraction_metadata['no_repurchase_statement'] = statement
+        raise ExtractionError(self.extraction_metadata, self.repurchase_data, "Section reports no repurchase activity")
+
+    def _stop_without_table_of_interest(self, section_text, self_term_re, message):
+        """Terminate a section without a table of interest, as no_repurchase_activity if its text says so"""
+        statement = no_repurchase_statement(section_text)
+        if statement:
+            self._stop_no_repurchase_activity('statement', statement)
+        self.extraction_metadata['self_term_re'] = self_term_re
+        raise ExtractionError(self.extraction_metadata, self.repurchase_data, message)
+
     def _identify_and_extract_table(self):
         """Identify the correct table and extract it from HTML"""
         # Check if HTML content is empty
@@ -68,19 +177,9 @@ class RepurchaseExtractor:
             self.extraction_metadata['self_term_re'] = 'len_html_zero'
             raise ExtractionError(self.extraction_metadata, self.repurchase_data, "No HTML content")
         
-        # Define typical words for repurchase tables
-        typical_words_list = [
-            'paid', 'total', 'part', 'announced', 'shares', 'plans', 'period', 
-            'purchases', 'number', 'share', 'under', 'publicly', 'yet', 'price', 
-            'programs', 'average', 'may', 'per', 'purchased', 'plan', 'program', 
-            'approximate', 'maximum', 'dollar', 'value', 'aggregate', 'except', 'dollars'
-        ]
-        typical_words_set = set(typical_words_list)
-        
-        # Parse HTML content
-        soup = BeautifulSoup(self.html_content, 'html.parser')
-        soup_org2 = copy.deepcopy(soup)
-        soup_org2_text = soup_org2.get_text(separator=' ', strip=True)
+        # Parse HTML content; this tree is the only parse of the section on the main path
+        soup = BeautifulSoup(self.html_content, self.parser)
+        soup_org2_text = soup.get_text(separator=' ', strip=True)
         
         # Process text with white_word_maker
         try:
@@ -96,50 +195,81 @@ class RepurchaseExtractor:
         self.extraction_metadata['num_tables'] = num_tables
         
         if num_tables == 0:
-            self.extraction_metadata['self_term_re'] = 'num_tables_zero'
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, "No tables found")
+            self._stop_without_table_of_interest(soup_org2_text, 'num_tables_zero', "No tables found")
         
         # Analyze tables
         tables_length_list = [len(xt) for xt in tables]
-        table_lengths = [len(str(table)) for table in tables]
         
         # Create table database
         table_db = pd.DataFrame({
             'len_table': tables_length_list
         }, index=range(len(tables)))
         
-        # Analyze each table
+        # Screen the tables cheapest signal first; shape analysis only runs on tables that
+        # can still pass one of the filters below (word_len > 6 is implied by word_inter_len >= 8)
+        
+        # Stage 1: visible text and its length
+        stage_started = time.perf_counter()
+        table_texts = []
+        short_text = []
+        for table in tables:
+            strings = list(table.stripped_strings)
+            table_texts.append(' '.join(strings))
+            short_text.append(sum(len(x) for x in strings) < 10)
+        self.extraction_metadata['screen_text_seconds'] = time.perf_counter() - stage_started
+        
+        # Stage 2: words
+        stage_started = time.perf_counter()
+        
+        # Word features of all tables at once
+        table_db = pd.concat([table_db, table_word_features(table_texts)], axis=1)
+        self.extraction_metadata['screen_words_seconds'] = time.perf_counter() - stage_started
+        
+        # Fast path: the table of interest needs 8 typical words, so without such a table stop before any shape analysis
+        if not (table_db['word_inter_len'] >= 8).any():
+            self._stop_without_table_of_interest(soup_org2_text, 'no_table_of_interest_found', "No table of interest found")
+        
+        # Stage 3: shape of the survivors; NaN marks tables pruned before this stage
+        stage_started = time.perf_counter()
         num_rows = []
         num_cols = []
         num_rows2 = []
         num_cols2 = []
         
-        for table in tables:
-            if len(table.get_text(strip=True)) < 10:
+        shape_fallbacks = 0
+        words_pruned = 0
+        
+        for table, is_short, word_len in zip(tables, short_text, table_db['word_len']):
+            if is_short:
                 num_rows.append(0)
                 num_cols.append(0)
                 num_rows2.append(0)
                 num_cols2.append(0)
                 continue
-                
-            table_str = str(table)
-            
-            try:
-                df_table = pd.read_html(table_str)[0]
-                df_table.replace("", np.nan, inplace=True)
-                df_table_cleaned = df_table.dropna(axis=0, how='all').dropna(axis=1, how='all')
-                
-                num_rows2.append(df_table_cleaned.shape[0])
-                num_cols2.append(df_table_cleaned.shape[1])
-                num_rows.append(df_table.shape[0])
-                num_cols.append(df_table.shape[1])
-                
-            except ValueError:
-                num_rows.append(0)
-                num_cols.append(0)
-                num_rows2.append(0)
-                num_cols2.append(0)
+            if word_len <= 6:
+                words_pruned += 1
+                num_rows.append(np.nan)
+                num_cols.append(np.nan)
+                num_rows2.append(np.nan)
+                num_cols2.append(np.nan)
                 continue
+            
+            # Count rows and columns on the parsed tree; read_html only for tables the walker can't model
+            shape = table_shape(table)
+            if shape is None:
+                shape_fallbacks += 1
+                shape = read_html_shape(table)
+            
+            num_rows.append(shape[0])
+            num_cols.append(shape[1])
+            num_rows2.append(shape[2])
+            num_cols2.append(shape[3])
+        
+        self.extraction_metadata['identify_shape_fallbacks'] = shape_fallbacks
+        self.extraction_metadata['screen_text_pruned'] = sum(short_text)
+        self.extraction_metadata['screen_words_pruned'] = words_pruned
+        self.extraction_metadata['screen_shape_measured'] = num_tables - sum(short_text) - words_pruned
+        self.extraction_metadata['screen_shape_seconds'] = time.perf_counter() - stage_started
         
         # Add analysis results to table_db
         table_db['num_rows'] = num_rows
@@ -147,29 +277,6 @@ class RepurchaseExtractor:
         table_db['num_rows2'] = num_rows2
         table_db['num_cols2'] = num_cols2
         
-        # Define filter words
-        months_full = ["january", "february", "march", "april", "may", "june", 
-                       "july", "august", "september", "october", "november", "december"]
-        months_abbr = ["jan", "feb", "mar", "apr", "may", "jun", 
-                       "jul", "aug", "sep", "oct", "nov", "dec"]
-        month_words = months_full + months_abbr
-        unit_words = ["thousand", "million", "billion", "thousands", "millions", "billions"]
-        filter_words = month_words + unit_words
-        
-        # Extract words from each table
-        word_lists = []
-        for table in tables:
-            text = table.get_text(separator=' ', strip=True)
-            words = re.split(r'[^a-zA-Z]+', text)
-            filtered_words = [word.lower() for word in words if len(word) > 2 and word.lower() not in filter_words]
-            word_lists.append(filtered_words)
-        
-        # Add word analysis to table_db
-        table_db['word_list'] = word_lists
-        table_db['word_inter_set'] = table_db['word_list'].apply(lambda words: list(set(words) & typical_words_set))
-        table_db['word_inter_len'] = table_db['word_inter_set'].apply(len)
-        table_db['word_len'] = table_db['word_list'].apply(len)
-        
         # Filter tables of interest
         filtered_tables = table_db[(table_db['num_rows2'] >= 4) &
                                    (table_db['num_cols2'] >= 5) &
@@ -180,8 +287,7 @@ class RepurchaseExtractor:
         
         # Determine table of interest
         if not table_indexes:
-            self.extraction_metadata['self_term_re'] = 'no_table_of_interest_found'
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, "No table of interest found")
+            self._stop_without_table_of_interest(soup_org2_text, 'no_table_of_interest_found', "No table of interest found")
         elif len(table_indexes) == 1:
             table_id = table_indexes[0]
             self.extraction_metadata['table_of_interest_id'] = table_id
@@ -201,6 +307,13 @@ class RepurchaseExtractor:
         if table_id is not None:
             print(f"Table ID set to: {table_id}")
         
+        # Pre-classifier, before any table processing: a table of interest whose cells outside the period
+        # labels hold only dashes or placeholders reports a quarter without purchases, which the table logic
+        # would only turn into '!o' rows. A table with any number in them (remaining authorization, shares
+        # withheld for taxes) is still extracted, even if the text says nothing was repurchased.
+        if not table_has_data_digits(tables[table_id]):
+            self._stop_no_repurchase_activity('degenerate_table', no_repurchase_statement(soup_org2_text))
+        
         # Handle other significant tables
         other_significant_tables = table_db[(table_db['num_cols2'] >= 3) & (table_db['word_len'] > 6)]
         other_table_indexes = other_significant_tables.index.tolist()
@@ -237,96 +350,36 @@ class RepurchaseExtractor:
                 other_loc = 1
             print(f"Other significant table found at index: {other_id}, location relative to table of interest: {'before' if other_loc == 0 else 'after'}")
         
-        # Handle other table removal if needed
-        if other_dum == 1:
-            soup_str = str(soup)
-            other_table = tables[other_id]
-            table_html = str(other_table)
-            
-            other_table_start = None
-            other_table_end = None
-            
-            try:
-                start_pattern = re.escape(table_html[:700])
-                start_match = re.search(start_pattern, soup_str)
-                
-                if start_match:
-                    other_table_start = start_match.start()
-                    other_table_end = other_table_start + len(table_html)
-                else:
-                    print("No match found for the table in the HTML content.")
-                    self.extraction_metadata['self_term_re'] = 'start_match_of_sig_wasnt_found'
-                    raise ExtractionError(self.extraction_metadata, self.repurchase_data, "Could not locate other significant table")
-                    
-            except Exception as e:
-                print("Error finding the table:", e)
-                self.extraction_metadata['error_term_re'] = "Error_finding_the_sig_table"
-                self.extraction_metadata['error_term_re_e'] = str(e)
-                raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"Error finding significant table: {e}")
-            
-            if other_table_start is not None and other_table_end is not None:
-                print(f"Start of the other table: {other_table_start}, End of the other table: {other_table_end}")
-            else:
-                print("Failed to locate the other table in the document.")
-                self.extraction_metadata['self_term_re'] = 'failed_to_locate_sig_table'
-                raise ExtractionError(self.extraction_metadata, self.repurchase_data, "Failed to locate other significant table")
-        
-        # Remove other table if needed
-        soup_org = soup
-        if other_dum == 1 and other_table_start and other_table_end:
-            if other_loc == 1:
-                soup_str = soup_str[:other_table_start]
-            elif other_loc == 0:
-                soup_str = soup_str[other_table_end+1:]
-            
-            soup = BeautifulSoup(soup_str, 'html.parser')
-            print("Updated HTML document with the other table removed.")
-        
-        # Locate the main table
-        soup_str = str(soup)
         table = tables[table_id]
-        table_html = str(table)
-        
-        table_start = None
-        table_end = None
         
-        try:
-            start_pattern = re.escape(table_html[:700])
-            start_match = re.search(start_pattern, soup_str)
-            
-            if start_match:
-                table_start = start_match.start()
-                table_end = table_start + len(table_html)
-            else:
-                print("No match found for the table in the HTML content.")
+        # Locate both tables by their position in the parse tree rather than searching the serialized section
+        if other_dum == 1:
+            other_table = tables[other_id]
+            if any(parent is other_table for parent in table.parents):
+                print("The table of interest is nested in the other significant table.")
                 self.extraction_metadata['self_term_re'] = 'start_match_of_table_wasnt_found'
                 raise ExtractionError(self.extraction_metadata, self.repurchase_data, "Could not locate main table")
-        except Exception as e:
-            print("Error finding the table:", e)
-            self.extraction_metadata['error_term_re'] = "Error_finding_the_table"
-            self.extraction_metadata['error_term_re_e'] = str(e)
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"Error finding main table: {e}")
-        
-        if table_start is not None and table_end is not None:
-            print(f"Start of the table: {table_start}, End of the table: {table_end}")
-        else:
-            print("Failed to locate the table in the document.")
-            self.extraction_metadata['self_term_re'] = 'failed_to_locate_table'
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, "Failed to locate main table")
-        
-        # Extract soup before and after table
-        parser_label = 'html.parser'
-        text_before_table = soup_str[:table_start]
-        text_after_table = soup_str[table_end:]
-        
-        self.soup_before = BeautifulSoup(text_before_table, parser_label)
-        self.soup_after = BeautifulSoup(text_after_table, parser_label)
+            
+            # Drop the other table along with everything beyond it, as seen from the table of interest
+            trim_soup_at_node(soup, other_table, keep='before' if other_loc == 1 else 'after')
+            print("Updated HTML document with the other table removed.")
         
-        # Preprocess and set the table
+        # Split the parsed tree at the table; the soups around it are only assembled when read
+        self._section_split = SectionSplit(soup, table, self.parser)
         self.table = preprocess_html(table)
     
 
 
+    def _apply_cell_steps(self, df, pipeline):
+        """Run a CellPipeline over df; a failing step becomes error_term_re and step timings accumulate in the metadata"""
+        timings = self.extraction_metadata.setdefault('preprocess_step_seconds', {})
+        try:
+            return pipeline.apply(df, timings)
+        except CellStepError as e:
+            self.extraction_metadata['error_term_re'] = e.step
+            self.extraction_metadata['error_term_re_e'] = str(e.cause)
+            raise ExtractionError(self.extraction_metadata, self.repurchase_data, str(e))
+
     def _preprocess_table(self):
         """Preprocess the table"""
         # Process the identified table
@@ -377,46 +430,12 @@ class RepurchaseExtractor:
         
         df_cop_in=df.copy()
 
+        # Text cleanup of every cell, whole table at once; timed per step like the per-cell pipeline
         try:
-            df=df.map(convert_to_string_if_not_nan)
-        except Exception as e:
-            self.extraction_metadata['error_term_re']="convert_to_string_if_not_nan"
-            self.extraction_metadata['error_term_re_e']=str(e)
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"convert_to_string_if_not_nan: {e}")
-            
-        try:
-            df=df.map(unicode_text_cleaner)
-        
-        except Exception as e:
-            self.extraction_metadata['error_term_re']="unicode_text_cleaner"
-            self.extraction_metadata['error_term_re_e']=str(e)
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"unicode_text_cleaner: {e}")
-        
-        
-        try:
-            df=df.map(convert_and_parenthesize_superscripts)
-        
-        except Exception as e:
-            self.extraction_metadata['error_term_re']="convert_and_parenthesize_superscripts"
-            self.extraction_metadata['error_term_re_e']=str(e)
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"convert_and_parenthesize_superscripts: {e}")
-        
-        
-        try:
-            df=df.map(bracket_to_paranth)
-        
-        except Exception as e:
-            self.extraction_metadata['error_term_re']="bracket_to_paranth"
-            self.extraction_metadata['error_term_re_e']=str(e)
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"bracket_to_paranth: {e}")
-        
-        try:
-            df=df.map(check_issuer_in_text)
-        
-        except Exception as e:
-            self.extraction_metadata['error_term_re']="check_issuer_in_text"
-            self.extraction_metadata['error_term_re_e']=str(e)
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"check_issuer_in_text: {e}")
+            df = clean_cells(df, self.extraction_metadata.setdefault('preprocess_step_seconds', {}))
+        except Exception:
+            # Rerun cell by cell to name the failing step
+            df = self._apply_cell_steps(df, CELL_CLEANUP_STEPS)
         
         # Replace empty strings with NaN
         df.replace("", np.nan, inplace=True)
@@ -429,36 +448,8 @@ class RepurchaseExtractor:
 
         
 
-        try:
-            df=df.map(para_whitespace_stripper)
-        
-        except Exception as e:
-            self.extraction_metadata['error_term_re']="para_whitespace_stripper"
-            self.extraction_metadata['error_term_re_e']=str(e)
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"para_whitespace_stripper: {e}")
-        
-
-        
-        # Assuming df is your original DataFrame and check_healthy_parentheses is defined as above
-        
-
-        try:
-            
-            df=df.map(three_zero_to_thousand)
-        
-        except Exception as e:
-            self.extraction_metadata['error_term_re']="three_zero_to_thousand"
-            self.extraction_metadata['error_term_re_e']=str(e)
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"three_zero_to_thousand: {e}")
-
-        try:
-            
-            df=df.map(dollar_sign_to_dollar_word)
-        
-        except Exception as e:
-            self.extraction_metadata['error_term_re']="dollar_sign_to_dollar_word"
-            self.extraction_metadata['error_term_re_e']=str(e)
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"dollar_sign_to_dollar_word: {e}")
+        # Notation rewrites of every cell, in one pass
+        df = self._apply_cell_steps(df, CELL_NOTATION_STEPS)
 
         return df
 
@@ -612,7 +603,7 @@ class RepurchaseExtractor:
         
         try:
             
-            df_reduced=df.map(text_reducer)
+            df_reduced=text_reducer_cells(df)
         
         except Exception as e:
             self.extraction_metadata['error_term_re']="text_reducer"
@@ -667,7 +658,7 @@ class RepurchaseExtractor:
                 df.index = range(df.shape[0])
                 
 
-            df_reduced=df.map(text_reducer)
+            df_reduced=text_reducer_cells(df)
             
             df_reduced.replace("", np.nan, inplace=True)
             
@@ -807,7 +798,7 @@ class RepurchaseExtractor:
             period_col_end_cand=max(period_col_span)
             
             
-            df_reduced=df.map(text_reducer)
+            df_reduced=text_reducer_cells(df)
             
             df_reduced.replace("", np.nan, inplace=True)
             
@@ -1301,7 +1292,7 @@ class RepurchaseExtractor:
         
         try:
             
-            df_reduced2=df.map(text_reducer2)
+            df_reduced2=text_reducer2_cells(df)
         
         except Exception as e:
             self.extraction_metadata['error_term_re']="text_reducer2"
@@ -1420,7 +1411,7 @@ class RepurchaseExtractor:
 
         try:
             
-            cand_footnotes_in_text_after = extract_potential_footnotes(self.soup_after)
+            cand_footnotes_in_text_after = extract_potential_footnotes(self._section_split.after_texts)
         
         except Exception as e:
             self.extraction_metadata['error_term_re']="extract_potential_footnotes"
@@ -1487,24 +1478,17 @@ class RepurchaseExtractor:
         try:
             
             
-            # Apply the function to each cell of the dataframe
-            df_words2 = df_lower.map(convert_to_pattern_words)
+            # Tokenize every cell once; the pattern and word views below are projections of the tokens
+            df_tokens = df_lower.map(tokenize_cell)
         
         except Exception as e:
+            # Reported under the first view built from the tokens
             self.extraction_metadata['error_term_re']="convert_to_pattern_words"
             self.extraction_metadata['error_term_re_e']=str(e)
             raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"convert_to_pattern_words: {e}")
         
-
-        try:
-            
-            
-            df_patterns=df_lower.map(convert_to_pattern) 
-        
-        except Exception as e:
-            self.extraction_metadata['error_term_re']="convert_to_pattern_words"
-            self.extraction_metadata['error_term_re_e']=str(e)
-            raise ExtractionError(self.extraction_metadata, self.repurchase_data, f"convert_to_pattern:{e}")
+        df_words2 = df_tokens.map(token_words)
+        df_patterns = df_tokens.map(token_patterns)
     
 
         interval_special=0
@@ -1534,7 +1518,7 @@ class RepurchaseExtractor:
             
             
         elif len(monthly_interval_rows) == 0:
-            df_patterns_temp=df_lower.map(convert_to_pattern_without_comma) 
+            df_patterns_temp=df_tokens.map(token_patterns_without_comma) 
             patterns_list=list(df_patterns_temp[0])
             pattern_dict = {}
             for i in range(len(patterns_list)):
@@ -1556,8 +1540,8 @@ class RepurchaseExtractor:
                 
                 selected_monthly_interval_rows = monthly_interval_rows[0]
                 selected_monthly_interval_pattern = monthly_interval_patterns[0]
-                df_patterns=df_lower.map(convert_to_pattern_without_comma) 
-                df_words2 = df_lower.map(convert_to_pattern_words_without_comma)
+                df_patterns=df_patterns_temp
+                df_words2 = df_tokens.map(token_words_without_comma)
                 
             if len(monthly_interval_rows) == 0:
                 
@@ -1580,8 +1564,8 @@ class RepurchaseExtractor:
                 if len(monthly_interval_rows) == 1:
                     selected_monthly_interval_rows = monthly_interval_rows[0]
                     selected_monthly_interval_pattern = monthly_interval_patterns[0]
-                    df_patterns=df_lower.map(convert_to_pattern_without_comma) 
-                    df_words2 = df_lower.map(convert_to_pattern_words_without_comma)
+                    df_patterns=df_patterns_temp
+                    df_words2 = df_tokens.map(token_words_without_comma)
                     interval_special=1
                     
             
@@ -2538,7 +2522,7 @@ class RepurchaseExtractor:
         
         df_cut_lower_unit_translated=df_cut_lower_unit.map(unit_analyser)
 
-        df_dollar=df_cut.map(dollar_extractor)
+        df_dollar=dollar_extractor_cells(df_cut)
 
         df_identify = pd.DataFrame(np.nan, index=[0, 1, 2], columns=df.columns)
 
@@ -2730,7 +2714,7 @@ class RepurchaseExtractor:
         above_unit_overwrite=0
         
         unit_in_text=None
-        text_before_table_cleaned=self.soup_before.get_text(separator=' ', strip=True)
+        text_before_table_cleaned=self._section_split.text_before
         unit_in_text= unit_extracted_for_text(text_before_table_cleaned)
         
         if unit_in_text:
@@ -2818,7 +2802,7 @@ class RepurchaseExtractor:
         
         
             
-        units_in_after_contents= extract_units_from_after_contents(self.soup_after)
+        units_in_after_contents= extract_units_from_after_contents(self._section_split.after_texts)
         
         too_many_str_after_units=0
         y_in_str_after_units=0
@@ -3386,7 +3370,7 @@ class RepurchaseExtractor:
             df_output.iloc[1:, 1:] = processed_subset
         
             try:
-                self.repurchase_data=df_output.map(convert_to_number)
+                self.repurchase_data=convert_to_number_cells(df_output)
             except Exception as e:
                 self.extraction_metadata['error_term_re']="convert_to_number"
                 self.extraction_metadata['error_term_re_e']=str(e)
@@ -3395,7 +3379,7 @@ class RepurchaseExtractor:
             
             subset = self.repurchase_data.iloc[1:, 1:]  
             try:
-                processed_subset = subset.applymap(inner_cell_health_checker)
+                processed_subset = inner_cell_health_checker_cells(subset)
             except Exception as e:
                 self.extraction_metadata['error_term_re']="inner_cell_health_checker"
                 self.extraction_metadata['error_term_re_e']=str(e)
@@ -3451,8 +3435,15 @@ class RepurchaseExtractor:
             self.extraction_metadata['self_term_re'] = np.nan
             self.extraction_metadata['error_term_re_e'] = np.nan
 
-            # Fetch HTML content and period data
-            self._fetch_html_and_period_data()
+            # Fetch HTML content and period data, unless built offline via from_html
+            if self.html_content is None:
+                self._fetch_html_and_period_data()
+            
+            # A failed download is worth a rerun, unlike a filing without a section
+            if self.extraction_metadata.get('html_fetch_error'):
+                self.extraction_metadata['error_term_re'] = 'fetch_failed'
+                self.extraction_metadata['error_term_re_e'] = self.extraction_metadata['html_fetch_error']
+                raise ExtractionError(self.extraction_metadata, self.repurchase_data, "Fetching the section failed")
             
             # Identify and extract the table
             self._identify_and_extract_table()
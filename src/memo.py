@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 19:29:48 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Opt-in memoization of the pure per-cell text helpers. The same cell values
+("$", "(1)", "N/A", month labels, the standard column headers) come back
+in nearly every table of every filing, so with memoization on, a helper
+computes each distinct string once per worker process and reuses the
+result for later tables and filings.
+
+Memoization is off by default. ``enable_cell_memo`` turns it on for the
+whole process with a bounded LRU cache per helper; ``cell_memo_stats``
+reports the hit rate of each cache so its size can be tuned.
+"""
+
+
+import functools
+from typing import Optional
+
+
+# Distinct cell strings remembered per helper
+DEFAULT_CELL_MEMO_SIZE = 8192
+
+_helpers = {}
+# Cache size while memoization is on, None while it is off
+_maxsize = None
+
+
+class _MemoizedHelper:
+    """A helper and, while memoization is on, its LRU-cached version"""
+
+    def __init__(self, func):
+        self.func = func
+        self.cached = None
+
+    def reset(self):
+        self.cached = functools.lru_cache(maxsize=_maxsize)(self.func) if _maxsize is not None else None
+
+
+def memoize_cell(func):
+    """
+    Make a one-argument cell helper memoizable.
+
+    Only ``str`` arguments are looked up in the cache; NaN and other values
+    always go to the helper. List results are returned as copies, so a
+    caller changing them does not change the cached value.
+    """
+    helper = _MemoizedHelper(func)
+    helper.reset()
+    _helpers[func.__name__] = helper
+
+    @functools.wraps(func)
+    def wrapper(value):
+        cached = helper.cached
+        if cached is None or type(value) is not str:
+            return func(value)
+        result = cached(value)
+        return list(result) if type(result) is list else result
+
+    return wrapper
+
+
+def enable_cell_memo(maxsize: int = DEFAULT_CELL_MEMO_SIZE):
+    """Memoize the helpers in this process, ``maxsize`` strings each; resets existing caches"""
+    global _maxsize
+    _maxsize = maxsize
+    for helper in _helpers.values():
+        helper.reset()
+
+
+def disable_cell_memo():
+    """Stop memoizing and free the caches"""
+    global _maxsize
+    _maxsize = None
+    for helper in _helpers.values():
+        helper.reset()
+
+
+def cell_memo_enabled() -> bool:
+    return _maxsize is not None
+
+
+def cell_memo_stats() -> Optional[dict]:
+    """
+    Cache statistics per helper name, or None while memoization is off.
+
+    Each entry has ``hits``, ``misses``, ``size``, ``maxsize`` and
+    ``hit_rate`` (hits over lookups, 0.0 before the first lookup).
+    """
+    if not cell_memo_enabled():
+        return None
+    stats = {}
+    for name, helper in _helpers.items():
+        info = helper.cached.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'maxsize': info.maxsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+        }
+    return stats
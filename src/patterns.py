@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 19:26:47 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Compiled regular expressions, translation tables and word maps used by the
+text helpers in utils. The helpers run once per table cell, so everything
+they match against is built here once at import instead of on every call.
+Each pattern keeps the exact expression and flags of the helper it came
+from; the helper names are given in the comments.
+"""
+
+
+import re
+
+
+# ---- whitespace and unicode cleanup -------------------------------------
+
+# unicode_text_cleaner, ends_text_strip, text_reducer, text_reducer2, unit_remover
+WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+# convert_and_parenthesize_superscripts: runs of superscript numerals, each
+# numeral written as its digit in parentheses
+SUPERSCRIPT_RUN_RE = re.compile(r'[¹²³⁴⁵⁶⁷⁸⁹]+')
+SUPERSCRIPT_PARENTHESIZED = {s: f'({d})' for s, d in zip('¹²³⁴⁵⁶⁷⁸⁹', '123456789')}
+
+
+# ---- parentheses --------------------------------------------------------
+
+# check_issuer_in_text
+ISSUER_RE = re.compile(r'Issuer', re.IGNORECASE)
+PAREN_CONTENT_RE = re.compile(r'\(([^)]*)\)')
+
+# para_whitespace_stripper
+OPEN_PAREN_SPACE_RE = re.compile(r'\(\s+')
+CLOSE_PAREN_SPACE_RE = re.compile(r'\s+\)')
+
+# text_reducer, text_reducer2; unit_extracted_for_text keeps the inner text
+PAREN_LAZY_RE = re.compile(r'\(.*?\)')
+PAREN_LAZY_GROUP_RE = re.compile(r'\((.*?)\)')
+
+# general_parenth_remover
+PAREN_CLAUSE_RE = re.compile(r'\([^()]*\)\s*([,\/&])?\s*')
+EDGE_SEPARATORS_RE = re.compile(r'^\s*[,\/&]+\s*|\s*[,\/&]+\s*$')
+
+# dollar_dropper
+EMPTY_DOLLAR_PAREN_RE = re.compile(r'\(\s*\$\s*\)')
+
+
+# ---- footnote marks -----------------------------------------------------
+
+# check_single_digit_or_letter
+FOOTNOTE_MARKS_ONLY_RE = re.compile(r'^(\([0-9a-zA-Z]\)([ ,/])?)+$')
+
+# single_digit_or_letter_in_parenth_remover, extract_single_digit_or_letter_in_parenth
+FOOTNOTE_MARK_CLAUSE_RE = re.compile(r'\(\s*([0-9]|[A-Za-z])\s*\)\s*([,\/&])?\s*')
+FOOTNOTE_MARK_RE = re.compile(r'\(\s*([0-9]|[A-Za-z])\s*\)')
+
+# extract_potential_footnotes
+FIRST_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]*([a-zA-Z0-9])')
+
+# out_paranth_footnote_into_paranth
+FOOTNOTE_WORD_SEPARATORS_RE = re.compile(r'([@(),])')
+ALNUM_RUN_SPLIT_RE = re.compile(r'(?<=[a-zA-Z])(?=[0-9])|(?<=[0-9])(?=[a-zA-Z])|[^a-zA-Z0-9]+')
+
+# footnote_remover
+EDGE_COMMA_RE = re.compile(r'^,|,$')
+
+
+# ---- units and notation -------------------------------------------------
+
+# unit_extractor
+UNIT_WORD_RE = re.compile(r"\b(thousands?|millions?|billions?)\b", re.IGNORECASE)
+PARENTHESIZED_UNIT_RE = re.compile(r"\(([^)]*?" + UNIT_WORD_RE.pattern + r"[^)]*?)\)", re.IGNORECASE)
+
+# text_reducer, text_reducer2
+UNIT_WORD_DESC_RE = re.compile(r'\b(billions?|millions?|thousands?)\b', re.IGNORECASE)
+NON_ALPHA_SPACE_RE = re.compile(r'[^a-zA-Z\s]')
+
+# unit_extracted_for_text
+UNIT_WORD_SINGULAR_RE = re.compile(r'\b(thousand|million|billion)s?\b', re.IGNORECASE)
+DIGIT_RE = re.compile(r'\d')
+
+# unit_remover: unit words, also when attached to a number
+UNIT_SUFFIX_RE = re.compile(r'(\b|\d)(thousand|thousands|million|millions|billion|billions)\b', re.IGNORECASE)
+
+# unit_analyser, unit_extracted_for_text, extract_units_from_after_contents
+NON_ALPHA_RE = re.compile(r'[^a-zA-Z]')
+
+# three_zero_to_thousand
+THREE_ZERO_PAREN_RE = re.compile(r'\(([^)]*000[^)]*)\)')
+NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+IN_THREE_ZERO_RE = re.compile(r'\bin\s*000[\'s,]*\b')
+
+# dollar_sign_to_dollar_word: "$ in" or "$s in"
+DOLLAR_IN_RE = re.compile(r'\$\s*(s\s*)?in', re.IGNORECASE)
+
+# unit_extracted_for_text, extract_units_from_after_contents
+UNIT_PLURAL_TO_SINGULAR = {
+    "thousands": "thousand",
+    "millions": "million",
+    "billions": "billion",
+    "dollars": "dollar",
+    "shares": "share",
+    "amounts": "amount"
+}
+UNIT_INDICATORS = ('in thousand', 'in million', 'in billion')
+
+# unit_analyser
+UNIT_ANALYSER_SINGULAR_MAP = {
+    **UNIT_PLURAL_TO_SINGULAR,
+    "numbers": "number",
+    "values": "value",
+    "figures": "figure",
+}
+
+
+# ---- date labels and placeholders ---------------------------------------
+
+# convert_to_pattern and its variants
+MONTH_NAME_RE = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December'
+    r'|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Sept)',
+    re.IGNORECASE,
+)
+DIGITS_RE = re.compile(r'\d+')
+NON_WORD_SPLIT_RE = re.compile(r'(\W+)')
+PATTERN_PUNCTUATION = frozenset([',', ':', '.', '-', '_', '–'])
+
+# other_missing_creater
+NOT_APPLICABLE_RE = re.compile(r'^n[/\-.,]?a$')
+ONLY_SYMBOLS_RE = re.compile(r'^[^a-zA-Z0-9]+$')
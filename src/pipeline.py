@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 18:48:37 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Producer/consumer batch extraction: a BatchFetcher running on its own
+event-loop thread fills a bounded prefetch queue, and a process pool
+parses the filings taken from it. While the pool is busy the queue fills
+up, then the fetcher stops pulling new filings, so neither stage runs
+ahead of the other by more than the queue size.
+"""
+
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+import pandas as pd
+
+from .batch import BatchFetcher, FetchResult
+from .memo import cell_memo_stats, enable_cell_memo
+
+
+_DONE = object()
+
+
+@dataclass
+class PipelineResult:
+    """Outputs of one filing; the soups are returned as HTML strings"""
+    filing_url: str
+    extraction_metadata: dict
+    repurchase_data: pd.DataFrame
+    soup_before_html: str = ''
+    soup_after_html: str = ''
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    # Cumulative for the worker that parsed the filing; None without cell memoization
+    cell_memo_stats: Optional[dict] = None
+
+
+def extract_fetched(fetch_result: FetchResult, extractor_kwargs: Optional[dict] = None) -> PipelineResult:
+    """Run the parsing stages on one fetched filing; executed in the worker processes"""
+    from .main import ExtractionError
+
+    started = time.perf_counter()
+    extractor = fetch_result.to_extractor(**(extractor_kwargs or {}))
+    try:
+        extractor.extract()
+    except ExtractionError:
+        # Metadata already holds the reason; ExtractionError itself does not survive pickling
+        pass
+    # Serialize the split parts directly; nothing needs the soups themselves here
+    section_split = extractor._section_split
+    soup_before_html, soup_after_html = section_split.html_parts() if section_split is not None else ('', '')
+    return PipelineResult(
+        filing_url=fetch_result.filing_url,
+        extraction_metadata=extractor.extraction_metadata,
+        repurchase_data=extractor.repurchase_data,
+        soup_before_html=soup_before_html,
+        soup_after_html=soup_after_html,
+        fetch_seconds=fetch_result.seconds,
+        parse_seconds=time.perf_counter() - started,
+        cell_memo_stats=cell_memo_stats(),
+    )
+
+
+class ExtractionPipeline:
+    """
+    Fetch and extract many filings with network I/O and parsing overlapped.
+
+    Parameters
+    ----------
+    fetcher : BatchFetcher, optional
+        Network stage. Defaults to a BatchFetcher with default settings.
+    cpu_workers : int, optional
+        Parsing processes. Defaults to ``os.cpu_count()``.
+    prefetch : int, optional
+        Fetched filings waiting for a parser, at most. Defaults to
+        ``4 * cpu_workers``.
+    extractor_kwargs : dict, optional
+        Extra RepurchaseExtractor arguments; must be picklable.
+    cell_memo_size : int, optional
+        Memoize the cell helpers in every parsing process, this many
+        strings per helper (see ``src.memo``). Off by default.
+
+    Examples
+    --------
+    >>> pipeline = ExtractionPipeline(BatchFetcher(max_concurrency=32), cpu_workers=8)
+    >>> for result in pipeline.run(filing_urls):
+    ...     print(result.filing_url, result.extraction_metadata.get('error_term_re'))
+    >>> pipeline.stats
+    """
+
+    def __init__(self, fetcher: Optional[BatchFetcher] = None, cpu_workers: Optional[int] = None,
+                 prefetch: Optional[int] = None, extractor_kwargs: Optional[dict] = None,
+                 cell_memo_size: Optional[int] = None):
+        self.fetcher = fetcher if fetcher is not None else BatchFetcher()
+        self.cpu_workers = cpu_workers or os.cpu_count() or 1
+        self.prefetch = prefetch or 4 * self.cpu_workers
+        self.extractor_kwargs = extractor_kwargs or {}
+        self.cell_memo_size = cell_memo_size
+        self.stats = {'fetched': 0, 'parsed': 0, 'queue_full_seconds': 0.0, 'queue_empty_seconds': 0.0}
+
+    def _produce(self, filing_urls, prefetched, stop):
+        """Producer thread: drive the fetcher's event loop and feed the prefetch queue"""
+        async def pump():
+            loop = asyncio.get_running_loop()
+            async for fetch_result in self.fetcher.fetch(filing_urls):
+                self.stats['fetched'] += 1
+                started = time.perf_counter()
+                # Blocking put off the loop thread: in-flight requests keep running while we wait
+                while not await loop.run_in_executor(None, self._put, prefetched, fetch_result, stop):
+                    pass
+                if stop.is_set():
+                    return
+                self.stats['queue_full_seconds'] += time.perf_counter() - started
+
+        try:
+            asyncio.run(pump())
+            outcome = _DONE
+        except BaseException as e:
+            outcome = e
+        while not self._put(prefetched, outcome, stop):
+            pass
+
+    @staticmethod
+    def _put(prefetched, item, stop):
+        # True once the item is queued, or once the consumer has gone away
+        try:
+            prefetched.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            return stop.is_set()
+
+    def run(self, filing_urls: Iterable[str]) -> Iterator[PipelineResult]:
+        """Yield one PipelineResult per filing, in completion order"""
+        prefetched = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+        producer = threading.Thread(target=self._produce, args=(list(filing_urls), prefetched, stop), daemon=True)
+        producer.start()
+
+        # Keep every process busy with one filing queued behind it
+        max_in_flight = 2 * self.cpu_workers
+        in_flight = set()
+        producing = True
+        try:
+            memo = dict(initializer=enable_cell_memo, initargs=(self.cell_memo_size,)) if self.cell_memo_size else {}
+            with ProcessPoolExecutor(max_workers=self.cpu_workers, **memo) as pool:
+                while producing or in_flight:
+                    while producing and len(in_flight) < max_in_flight:
+                        started = time.perf_counter()
+                        try:
+                            # Only block on the queue when no parse result could arrive meanwhile
+                            item = prefetched.get(block=not in_flight, timeout=None if not in_flight else 0)
+                        except queue.Empty:
+                            break
+                        self.stats['queue_empty_seconds'] += time.perf_counter() - started
+                        if item is _DONE:
+                            producing = False
+                        elif isinstance(item, BaseException):
+                            raise item
+                        else:
+                            in_flight.add(pool.submit(extract_fetched, item, self.extractor_kwargs))
+                    if not in_flight:
+                        continue
+                    done, in_flight = wait(in_flight, timeout=0.05, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self.stats['parsed'] += 1
+                        yield future.result()
+        finally:
+            stop.set()
+            producer.join()
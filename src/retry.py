@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 18:45:52 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Retry policy for sec-api requests: sorts failures into throttled,
+retryable and permanent, and spaces out retries with jittered
+exponential backoff.
+"""
+
+
+import random
+import threading
+import time
+from typing import Optional
+
+import requests
+
+from .clients import ApiError
+
+
+THROTTLED = 'throttled'
+RETRYABLE = 'retryable'
+PERMANENT = 'permanent'
+
+RETRYABLE_STATUS_CODES = {408, 500, 502, 503, 504}
+
+
+class FetchFailed(Exception):
+    """A request that failed permanently or ran out of attempts"""
+    def __init__(self, cause, attempts, kind):
+        self.cause = cause
+        self.attempts = attempts
+        self.kind = kind
+        super().__init__(f"{kind} after {attempts} attempt(s): {cause}")
+
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff with error classification.
+
+    Parameters
+    ----------
+    max_attempts : int, optional
+        Attempts per request, including the first one.
+    base_delay : float, optional
+        Upper bound of the first pause in seconds; doubles with each retry.
+    max_delay : float, optional
+        Cap on any single pause, including server-sent Retry-After values.
+    seed : int, optional
+        Seed for the jitter, for reproducible runs.
+
+    Notes
+    -----
+    - Pauses use "full jitter": uniform between 0 and the exponential
+      bound, which spreads out retries of many concurrent workers.
+    - HTTP 429 is reported as ``THROTTLED`` so callers that own a rate
+      limiter can slow it down.
+    """
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.5, max_delay: float = 30.0,
+                 seed: Optional[int] = None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def classify(exc: BaseException) -> str:
+        if isinstance(exc, ApiError):
+            if exc.status_code == 429:
+                return THROTTLED
+            return RETRYABLE if exc.status_code in RETRYABLE_STATUS_CODES else PERMANENT
+        if isinstance(exc, (requests.Timeout, requests.ConnectionError,
+                            requests.exceptions.ChunkedEncodingError)):
+            return RETRYABLE
+        return PERMANENT
+
+    def backoff(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """Pause in seconds before retry number ``attempt`` (1 for the first retry)"""
+        retry_after = getattr(exc, 'retry_after', None)
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        with self._lock:
+            return self._random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Run ``fn(*args, **kwargs)`` with retries.
+
+        Returns ``(result, attempts)``; raises ``FetchFailed`` wrapping the
+        last error.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return fn(*args, **kwargs), attempt
+            except Exception as e:
+                kind = self.classify(e)
+                if kind == PERMANENT:
+                    raise FetchFailed(e, attempt, PERMANENT) from e
+                if attempt >= self.max_attempts:
+                    raise FetchFailed(e, attempt, 'exhausted') from e
+                time.sleep(self.backoff(attempt, e))
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 19:07:26 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Streaming scan of very large sections. The HTML is fed to lxml's pull
+parser in chunks and every finished element is serialized and dropped
+from the tree right away, so the parser never holds more than the element
+being read. Only the candidate tables and a window of text on either side
+of them are kept; everything else is discarded.
+
+The kept parts come out as compact section HTML that RepurchaseExtractor
+processes exactly like the full section: tables that are dropped leave an
+empty ``<table></table>`` behind, so table counts and indexes do not
+change. Elements enclosing a table are written as separate start and end
+tags, which may be dropped independently; the split around the table of
+interest only looks at siblings, so the text before and after it comes
+out the same.
+"""
+
+
+import codecs
+import html as html_lib
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from lxml import etree
+
+from .utils import table_word_list
+
+
+# Text kept on each side of a candidate table, in characters
+DEFAULT_WINDOW_CHARS = 20000
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Both table filters of the extraction need more than six words
+MIN_CANDIDATE_WORDS = 7
+
+# Elements lxml adds around every section; they are not written out
+IMPLICIT_TAGS = ('html', 'body')
+PLACEHOLDER_TABLE = '<table></table>'
+
+
+def _cp1252_fallback(error):
+    # Bytes that are not UTF-8 are read as Windows-1252, which older EDGAR documents use
+    return error.object[error.start:error.end].decode('cp1252', errors='replace'), error.end
+
+
+codecs.register_error('sec_cp1252_fallback', _cp1252_fallback)
+
+
+@dataclass
+class _Token:
+    """One piece of the section in document order"""
+    html: str
+    text: str = ''
+    dropped: str = ''
+    table_index: Optional[int] = None
+    candidate: bool = False
+
+
+@dataclass
+class CandidateTable:
+    """A table that can pass the table filters, with the text around it"""
+    index: int
+    html: str
+    text_before: str
+    text_after: str
+
+
+def _read_chunks(source, chunk_size):
+    """Yield the source as text chunks; ``source`` as in ``read_html_source``"""
+    if isinstance(source, os.PathLike) or (
+        isinstance(source, str) and '<' not in source and os.path.isfile(source)
+    ):
+        with open(source, 'rb') as f:
+            yield from _read_chunks(f, chunk_size)
+        return
+
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='sec_cp1252_fallback')
+    if hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+    elif isinstance(source, (bytes, bytearray)):
+        for start in range(0, len(source), chunk_size):
+            yield decoder.decode(bytes(source[start:start + chunk_size]))
+    else:
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    yield decoder.decode(b'', final=True)
+
+
+def _start_tag(element):
+    attributes = ''.join(f' {name}="{html_lib.escape(value)}"' for name, value in element.attrib.items())
+    return f'<{element.tag}{attributes}>'
+
+
+def _text(text):
+    return _Token(html_lib.escape(text, quote=False), text) if text else None
+
+
+class _SectionTokenizer:
+    """
+    Turn pull-parser events into tokens, freeing each element once written.
+
+    Elements that contain a top-level table ("containers") are written as
+    separate start and end tags around their children; every other element
+    outside tables is written whole once it ends and its parent is known
+    to be a container. Children of elements not yet known to be containers
+    stay in the tree until that is decided.
+    """
+
+    def __init__(self):
+        self.containers = set()
+        self.texted = set()
+        self.written = {}
+        self.table_depth = 0
+        self.table_count = 0
+        self.table_start = 0
+
+    def _flush(self, parent, upto=None):
+        """Write the children of ``parent`` before ``upto`` with their tails, then drop them"""
+        if parent not in self.texted:
+            self.texted.add(parent)
+            token = _text(parent.text)
+            if token:
+                yield token
+        written = self.written.pop(parent, None)
+        for child in list(parent):
+            if child is upto:
+                break
+            if child is not written:
+                # Comments and elements buffered before the parent became a container
+                text = '' if not isinstance(child.tag, str) else ''.join(child.itertext())
+                yield _Token(etree.tostring(child, method='html', encoding='unicode', with_tail=False), text)
+            token = _text(child.tail)
+            if token:
+                yield token
+            parent.remove(child)
+
+    def _open_containers(self, table):
+        """At the start of a top-level table, mark every enclosing element as a container"""
+        path = []
+        node = table.getparent()
+        while node is not None and node not in self.containers:
+            path.append(node)
+            node = node.getparent()
+        for element in reversed(path):
+            yield from self._flush(element.getparent(), upto=element)
+            self.containers.add(element)
+            if element.tag not in IMPLICIT_TAGS:
+                yield _Token(_start_tag(element))
+        yield from self._flush(table.getparent(), upto=table)
+
+    def _table(self, table):
+        text = ' '.join(s.strip() for s in table.itertext() if s.strip())
+        candidate = len(table_word_list(text)) >= MIN_CANDIDATE_WORDS
+        nested = sum(1 for _ in table.iter('table'))
+        return _Token(etree.tostring(table, method='html', encoding='unicode', with_tail=False), text,
+                      dropped=PLACEHOLDER_TABLE * nested, table_index=self.table_start, candidate=candidate)
+
+    def handle(self, event, element):
+        if event == 'start':
+            if element.tag in IMPLICIT_TAGS and self.table_depth == 0:
+                self.containers.add(element)
+            elif element.tag == 'table':
+                if self.table_depth == 0:
+                    yield from self._open_containers(element)
+                    self.table_start = self.table_count
+                self.table_count += 1
+                self.table_depth += 1
+            return
+
+        if element.tag == 'table':
+            self.table_depth -= 1
+        if self.table_depth > 0:
+            return
+        parent = element.getparent()
+        if parent is None:
+            yield from self._flush(element)
+            return
+        if parent not in self.containers:
+            return
+
+        yield from self._flush(parent, upto=element)
+        if element in self.containers:
+            yield from self._flush(element)
+            if element.tag not in IMPLICIT_TAGS:
+                yield _Token(f'</{element.tag}>')
+            self.containers.discard(element)
+            self.texted.discard(element)
+        elif element.tag == 'table':
+            yield self._table(element)
+        else:
+            yield _Token(etree.tostring(element, method='html', encoding='unicode', with_tail=False),
+                         ''.join(element.itertext()))
+        self.written[parent] = element
+
+
+def _section_tokens(source, chunk_size=DEFAULT_CHUNK_SIZE) -> Iterator[_Token]:
+    parser = etree.HTMLPullParser(events=('start', 'end'))
+    tokenizer = _SectionTokenizer()
+    for chunk in _read_chunks(source, chunk_size):
+        if chunk:
+            parser.feed(chunk)
+        for event, element in parser.read_events():
+            yield from tokenizer.handle(event, element)
+    parser.close()
+    for event, element in parser.read_events():
+        yield from tokenizer.handle(event, element)
+
+
+def compact_section(source, window_chars: int = DEFAULT_WINDOW_CHARS,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Reduce a section to its candidate tables and the text around them.
+
+    Parameters
+    ----------
+    source : str, bytes, os.PathLike or file-like
+        Section HTML, a path to it or an open file; read ``chunk_size`` at a time.
+    window_chars : int, optional
+        Characters of text kept before and after each candidate table.
+    chunk_size : int, optional
+        Size of the reads from ``source``.
+
+    Returns
+    -------
+    str
+        HTML for ``RepurchaseExtractor.from_html``.
+    """
+    kept = []
+    before = deque()
+    before_chars = 0
+    after_chars = 0
+    for token in _section_tokens(source, chunk_size):
+        if token.candidate:
+            kept.extend(t.html for t in before)
+            before.clear()
+            before_chars = 0
+            kept.append(token.html)
+            after_chars = window_chars
+        elif after_chars > 0:
+            kept.append(token.html)
+            after_chars -= len(token.text)
+        else:
+            before.append(token)
+            before_chars += len(token.text)
+            while before_chars > window_chars and len(before) > 1:
+                dropped = before.popleft()
+                before_chars -= len(dropped.text)
+                kept.append(dropped.dropped)
+    kept.extend(t.dropped for t in before)
+    return ''.join(kept)
+
+
+def _window_text(tokens):
+    return ' '.join(' '.join(t.text for t in tokens).split())
+
+
+def scan_candidate_tables(source, window_chars: int = DEFAULT_WINDOW_CHARS,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[CandidateTable]:
+    """
+    Yield the candidate tables of a section with up to ``window_chars`` of text on each side.
+
+    Tables are yielded in document order, each as soon as the text after it
+    is complete. ``index`` counts nested tables like ``soup.find_all('table')``.
+    """
+    before = deque()
+    before_chars = 0
+    waiting = []
+    for token in _section_tokens(source, chunk_size):
+        for entry in waiting:
+            entry[2].append(token)
+            entry[3] -= len(token.text)
+        while waiting and waiting[0][3] <= 0:
+            table, text_before, after, _ = waiting.pop(0)
+            yield CandidateTable(table.table_index, table.html, text_before, _window_text(after))
+        if token.candidate:
+            waiting.append([token, _window_text(before), [], window_chars])
+        before.append(token)
+        before_chars += len(token.text)
+        while before_chars > window_chars and len(before) > 1:
+            before_chars -= len(before.popleft().text)
+    for table, text_before, after, _ in waiting:
+        yield CandidateTable(table.table_index, table.html, text_before, _window_text(after))
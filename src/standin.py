@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 18:38:55 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Local stand-in for the two sec-api endpoints the extractor uses, for load
+and throughput tests without network access or API quota.
+
+Responses come from a directory of recorded fixtures, named after the file
+name of the filing URL without its extension:
+
+    <name>.<section>.html  or  <name>.html   ->  /extractor
+    <name>.json                              ->  /xbrl-to-json
+
+Point the extractor at it with SEC_API_BASE_URL=http://127.0.0.1:<port>.
+
+Usage:
+    python -m src.standin FIXTURES_DIR --port 8765 --latency 0.2 --error-rate 0.01 --rate-limit 20
+"""
+
+
+import argparse
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+
+class _RateLimit:
+    """Thread-safe token bucket; ``take`` returns False when the request should get a 429"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class StandInServer:
+    """
+    Threaded HTTP server answering /extractor and /xbrl-to-json from fixtures.
+
+    Parameters
+    ----------
+    fixtures_dir : str
+        Directory holding the recorded responses.
+    host, port : optional
+        Address to bind. Port 0 picks a free port; see ``base_url``.
+    latency : float, optional
+        Seconds added to every response.
+    latency_jitter : float, optional
+        Extra uniformly distributed delay of up to this many seconds.
+    error_rate : float, optional
+        Probability of answering with HTTP 500.
+    rate_limit : float, optional
+        Requests per second served before answering HTTP 429, like sec-api
+        does when a key exceeds its quota. No limit by default.
+    throttle_rate : float, optional
+        Probability of a spurious HTTP 429 regardless of the request rate.
+    seed : int, optional
+        Seed for the injected latency and failures.
+
+    Examples
+    --------
+    With a directory ``recorded/`` holding ``crs-20250331.part2item2.html``
+    and ``crs-20250331.json`` (the layout in the module docstring):
+
+    >>> with StandInServer("recorded", latency=0.1, rate_limit=20) as server:
+    ...     client = SecApiClient("any-key", base_url=server.base_url)
+    ...     client.get_section("https://www.sec.gov/Archives/.../crs-20250331.htm")
+    """
+
+    def __init__(self, fixtures_dir: str, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, latency_jitter: float = 0.0, error_rate: float = 0.0,
+                 rate_limit: Optional[float] = None, throttle_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        self.fixtures_dir = fixtures_dir
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit = _RateLimit(rate_limit) if rate_limit else None
+        self.stats = {'requests': 0, 'ok': 0, 'not_found': 0, 'errors': 0, 'throttled': 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+        handler = type('StandInHandler', (_Handler,), {'standin': self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _draw(self):
+        # One lock-guarded draw per request keeps seeded runs reproducible
+        with self._lock:
+            return self._random.random(), self._random.random(), self._random.random()
+
+    def _fixture(self, filing_url, suffixes):
+        name = os.path.splitext(os.path.basename(urlparse(filing_url).path))[0]
+        for suffix in suffixes:
+            path = os.path.join(self.fixtures_dir, name + suffix)
+            if os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    return f.read()
+        return None
+
+    def respond(self, path, query):
+        """Status, content type and body for one request"""
+        self._count('requests')
+        jitter, error_draw, throttle_draw = self._draw()
+        delay = self.latency + jitter * self.latency_jitter
+        if delay:
+            time.sleep(delay)
+
+        if (self.rate_limit is not None and not self.rate_limit.take()) or throttle_draw < self.throttle_rate:
+            self._count('throttled')
+            return 429, 'application/json', b'{"status": 429, "error": "Too many requests"}'
+        if error_draw < self.error_rate:
+            self._count('errors')
+            return 500, 'application/json', b'{"status": 500, "error": "Internal server error"}'
+
+        if path == '/extractor':
+            section = query.get('item', ['part2item2'])[0]
+            body = self._fixture(query.get('url', [''])[0], [f'.{section}.html', '.html'])
+            content_type = 'text/html; charset=utf-8'
+        elif path == '/xbrl-to-json':
+            body = self._fixture(query.get('htm-url', [''])[0], ['.json'])
+            content_type = 'application/json'
+        else:
+            body = None
+        if body is None:
+            self._count('not_found')
+            return 404, 'application/json', b'{"status": 404, "error": "Filing not found"}'
+        self._count('ok')
+        return 200, content_type, body
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    standin = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        status, content_type, body = self.standin.respond(url.path.rstrip('/'), parse_qs(url.query))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve recorded sec-api responses locally.")
+    parser.add_argument('fixtures_dir')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--latency-jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=None)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = StandInServer(args.fixtures_dir, host=args.host, port=args.port, latency=args.latency,
+                           latency_jitter=args.latency_jitter, error_rate=args.error_rate,
+                           rate_limit=args.rate_limit, throttle_rate=args.throttle_rate, seed=args.seed)
+    print(f"Serving {args.fixtures_dir} at {server.base_url} (set SEC_API_BASE_URL to use it)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(server.stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,20 +7,17 @@ Created on Tue Oct 14 13:21:39 2025
 """
 
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString
+from bs4.element import PreformattedString
 import pandas as pd
 import numpy as np
 import re
 
-from sec_api import QueryApi
-from sec_api import ExtractorApi
-from sec_api import RenderApi
-from sec_api import XbrlApi
-
 
 from collections import Counter
 
 import calendar
+import datetime
 
 
 import os
@@ -32,8 +29,20 @@ import copy
 
 
 import os
-from typing import Optional
-from sec_api import QueryApi, ExtractorApi  # assuming you're using sec-api.com
+from typing import NamedTuple, Optional
+
+import codecs
+import sqlite3
+import functools
+import html as html_lib
+import time
+import requests
+
+from .cache import normalize_filing_url
+from .memo import memoize_cell
+from .patterns import *
+from .clients import get_client
+from .retry import DEFAULT_RETRY_POLICY, FetchFailed
 
 
 def add_row_to_dataframe(data_dict, dataframe):
@@ -43,29 +52,25 @@ def add_row_to_dataframe(data_dict, dataframe):
     return pd.concat([dataframe, new_row], ignore_index=True)
 
 
+@memoize_cell
 def unit_extractor(text):
     if pd.isna(text):
         return text  # Return None if text is NaN
 
-    # Search for units in the text
-    units_regex = r"\b(thousands?|millions?|billions?)\b"
-    
-    # Check if the unit is within parentheses
-    parenthetical_regex = r"\(([^)]*?" + units_regex + r"[^)]*?)\)"
-    
     # First, try finding the unit inside parentheses
-    paren_match = re.search(parenthetical_regex, text, re.IGNORECASE)
+    paren_match = PARENTHESIZED_UNIT_RE.search(text)
     if paren_match:
         return paren_match.group(1)  # Return just the content inside the parentheses
     
     # If not inside parentheses, check for the presence of unit anywhere in the text
-    unit_match = re.search(units_regex, text, re.IGNORECASE)
+    unit_match = UNIT_WORD_RE.search(text)
     if unit_match:
         return text  # Return the whole text if the unit isn't specifically within parentheses
 
     return np.nan  # Return None if no unit is found
 
 
+@memoize_cell
 def unit_analyser(text):
     # Return the text if it is NaN
     if pd.isna(text):
@@ -75,7 +80,7 @@ def unit_analyser(text):
     except_exist = 0
 
     # Replace every non-alphabetic character with a whitespace
-    cleaned_text = re.sub(r'[^a-zA-Z]', ' ', text)
+    cleaned_text = NON_ALPHA_RE.sub(' ', text)
     
     # Split the cleaned text into words
     words = cleaned_text.split()
@@ -84,18 +89,7 @@ def unit_analyser(text):
         return f'y{len(words)}'
     
     # Mapping of plural words to their singular forms
-    singular_map = {
-        "thousands": "thousand",
-        "millions": "million",
-        "billions": "billion",
-        "dollars": "dollar",
-        "shares": "share",
-        "amounts": "amount",
-        "numbers": "number",
-        "values": "value",
-        "figures": "figure",
-        
-    }
+    singular_map = UNIT_ANALYSER_SINGULAR_MAP
     
     units = {'thousand', 'million', 'billion'}
     
@@ -253,6 +247,429 @@ def preprocess_html(t):
 
 
 
+def detach_following(soup, node):
+    """
+    Detach ``node`` and return the detached top-level nodes that followed it, in order.
+
+    Equivalent to reparsing ``str(soup)`` cut at the end of ``node``: the
+    returned nodes are the following siblings of ``node`` and then those of
+    each of its ancestors. ``soup`` keeps everything that preceded ``node``,
+    so nothing is serialized or parsed again.
+    """
+    following = []
+    current = node
+    while current is not None and current is not soup:
+        following.extend(current.next_siblings)
+        current = current.parent
+
+    node.extract()
+    for sibling in following:
+        sibling.extract()
+    return following
+
+
+def trim_soup_at_node(soup, node, keep='before'):
+    """
+    Drop ``node`` and everything on one side of it from a parsed document.
+
+    The tree counterpart of cutting ``str(soup)`` at the start or the end
+    of ``node``: with ``keep='before'`` the node and all content following
+    it in document order are removed, with ``keep='after'`` the node and all
+    content preceding it. Ancestors of ``node`` stay in place.
+
+    Parameters
+    ----------
+    soup : bs4.BeautifulSoup
+        The parsed section. Modified in place.
+    node : bs4.Tag
+        A tag inside ``soup``, e.g. a second significant table.
+    keep : {'before', 'after'}, optional
+        Which side of ``node`` to keep.
+
+    Returns
+    -------
+    bs4.BeautifulSoup
+        ``soup`` itself.
+    """
+    if keep not in ('before', 'after'):
+        raise ValueError(f"keep must be 'before' or 'after', got {keep!r}")
+    dropped = []
+    current = node
+    while current is not None and current is not soup:
+        dropped.extend(current.next_siblings if keep == 'before' else current.previous_siblings)
+        current = current.parent
+
+    node.extract()
+    for sibling in dropped:
+        sibling.extract()
+    return soup
+
+
+class SectionSplit:
+    """
+    The section around the table of interest, with its parts built on demand.
+
+    The tree is cut at ``node`` on construction (see ``detach_following``),
+    but the "after" soup is only assembled when ``soup_after`` is first
+    read. The plain texts the extraction uses, ``text_before`` and
+    ``after_texts``, are cached on their own and never require the soups.
+    Pickled, the split keeps the cached texts plus both parts as one HTML
+    string and the offset between them; the soups are then reparsed from
+    that string on first access.
+
+    Parameters
+    ----------
+    soup : bs4.BeautifulSoup
+        The parsed section. Modified in place and kept as the "before" part.
+    node : bs4.Tag
+        The table of interest.
+    parser : str, optional
+        BeautifulSoup backend of soups built later.
+    """
+
+    def __init__(self, soup, node, parser='html.parser'):
+        self.parser = parser
+        self._after_nodes = detach_following(soup, node)
+        self._soup_before = soup
+        self._soup_after = None
+        self._html = None
+        self._offset = None
+        self._text_before = None
+        self._after_texts = None
+
+    @property
+    def soup_before(self):
+        if self._soup_before is None:
+            self._soup_before = BeautifulSoup(self._html[:self._offset], self.parser)
+        return self._soup_before
+
+    @property
+    def soup_after(self):
+        if self._soup_after is None:
+            if self._after_nodes is not None:
+                self._soup_after = BeautifulSoup('', self.parser)
+                for sibling in self._after_nodes:
+                    self._soup_after.append(sibling)
+            else:
+                # html.parser keeps the top-level nodes flat, as they were before pickling
+                self._soup_after = BeautifulSoup(self._html[self._offset:], 'html.parser')
+            self._after_nodes = None
+        return self._soup_after
+
+    @property
+    def text_before(self):
+        """``soup_before.get_text(separator=' ', strip=True)``"""
+        if self._text_before is None:
+            self._text_before = self.soup_before.get_text(separator=' ', strip=True)
+        return self._text_before
+
+    @property
+    def after_texts(self):
+        """Text of each top-level node of ``soup_after``"""
+        if self._after_texts is None:
+            nodes = self._after_nodes if self._after_nodes is not None else self.soup_after.contents
+            self._after_texts = [x.get_text(separator=' ', strip=True) for x in nodes]
+        return self._after_texts
+
+    def html_parts(self):
+        """``(html_before, html_after)`` without building any soup"""
+        if self._html is not None and self._soup_before is None and self._soup_after is None:
+            return self._html[:self._offset], self._html[self._offset:]
+        nodes = self._after_nodes if self._after_nodes is not None else self.soup_after.contents
+        return str(self.soup_before), ''.join(str(x) for x in nodes)
+
+    def __getstate__(self):
+        html_before, html_after = self.html_parts()
+        return {'parser': self.parser, 'html': html_before + html_after, 'offset': len(html_before),
+                'text_before': self._text_before, 'after_texts': self._after_texts}
+
+    def __setstate__(self, state):
+        self.parser = state['parser']
+        self._html = state['html']
+        self._offset = state['offset']
+        self._text_before = state['text_before']
+        self._after_texts = state['after_texts']
+        self._soup_before = None
+        self._soup_after = None
+        self._after_nodes = None
+
+
+
+# Words left out of the table word features: month names and unit words
+TABLE_MONTH_WORDS = ["january", "february", "march", "april", "may", "june",
+                     "july", "august", "september", "october", "november", "december",
+                     "jan", "feb", "mar", "apr", "may", "jun",
+                     "jul", "aug", "sep", "oct", "nov", "dec"]
+TABLE_UNIT_WORDS = ["thousand", "million", "billion", "thousands", "millions", "billions"]
+TABLE_FILTER_WORDS = frozenset(TABLE_MONTH_WORDS + TABLE_UNIT_WORDS)
+
+# Words typical of repurchase tables; their overlap with a table's words picks the table of interest
+TYPICAL_TABLE_WORDS = frozenset([
+    'paid', 'total', 'part', 'announced', 'shares', 'plans', 'period',
+    'purchases', 'number', 'share', 'under', 'publicly', 'yet', 'price',
+    'programs', 'average', 'may', 'per', 'purchased', 'plan', 'program',
+    'approximate', 'maximum', 'dollar', 'value', 'aggregate', 'except', 'dollars'
+])
+
+# Runs of three or more letters, i.e. the pieces of re.split(r'[^a-zA-Z]+', text) longer than two
+TABLE_WORD_RE = re.compile(r'[a-zA-Z]{3,}')
+# The same on lowercased text, skipping the filter words inside the regex engine
+TABLE_KEPT_WORD_RE = re.compile(r'(?<![a-z])(?!(?:%s)(?![a-z]))[a-z]{3,}'
+                                % '|'.join(sorted(TABLE_FILTER_WORDS, key=len, reverse=True)))
+
+
+def table_word_list(text):
+    """Lowercased words of a table's text longer than two letters, without month and unit words"""
+    if text.isascii():
+        return TABLE_KEPT_WORD_RE.findall(text.lower())
+    # Lowercasing some non-ASCII letters yields ASCII ones, so split before lowercasing
+    words = ' '.join(TABLE_WORD_RE.findall(text)).lower().split()
+    return [word for word in words if word not in TABLE_FILTER_WORDS]
+
+
+def table_word_features(texts, vocabulary=TYPICAL_TABLE_WORDS, index=None):
+    """
+    Word features of many tables at once, as the columns of the table database.
+
+    Parameters
+    ----------
+    texts : iterable of str
+        Visible text of each table, e.g. ``' '.join(table.stripped_strings)``.
+        Tables of several sections can be passed together for corpus-level
+        statistics.
+    vocabulary : frozenset, optional
+        Words counted in ``word_inter_set``/``word_inter_len``.
+    index : sequence, optional
+        Index of the returned frame. Defaults to 0..n-1, the table ids.
+
+    Returns
+    -------
+    pandas.DataFrame
+        ``word_list`` (filtered words), ``word_inter_set`` (distinct words
+        from ``vocabulary``), ``word_inter_len`` and ``word_len``.
+    """
+    word_lists = [table_word_list(text) for text in texts]
+    word_inter_sets = [list(set(words) & vocabulary) for words in word_lists]
+    return pd.DataFrame({
+        'word_list': word_lists,
+        'word_inter_set': word_inter_sets,
+        'word_inter_len': [len(words) for words in word_inter_sets],
+        'word_len': [len(words) for words in word_lists],
+    }, index=index)
+
+
+
+# Statements that no shares were bought back in the period
+NO_REPURCHASE_RE = re.compile(
+    r"\b(?:did|does|do|has|have|had)\s+not\s+(?:re)?purchased?\s+any\b"
+    r"|\bno\s+(?:shares|equity\s+securities)\s+(?:of\s+(?:the\s+)?(?:company|registrant)?'?s?\s*[a-z\s]{0,30}?)?"
+    r"(?:were|was|have\s+been|had\s+been)\s+(?:re)?purchased\b"
+    r"|\b(?:there\s+were|made|had|were)\s+no\s+(?:share\s+|stock\s+)?(?:re)?purchases\b",
+    re.IGNORECASE)
+# A section that only says "None." or "Not applicable." besides its heading
+NONE_SECTION_RE = re.compile(r"\b(?:none|not\s+applicable)\b\.?\s*$", re.IGNORECASE)
+NONE_SECTION_MAX_CHARS = 300
+
+
+def no_repurchase_statement(text):
+    """The phrase of a section's text saying that nothing was repurchased, or None"""
+    match = NO_REPURCHASE_RE.search(text)
+    if match:
+        return ' '.join(match.group(0).split())
+    if len(text) <= NONE_SECTION_MAX_CHARS:
+        match = NONE_SECTION_RE.search(text)
+        if match:
+            return ' '.join(match.group(0).split())
+    return None
+
+
+def table_has_data_digits(table):
+    """
+    Whether a parsed table holds a digit anywhere but in its period labels.
+
+    The first filled cell of each row (the period or row label) is skipped,
+    as are footnote marks such as "(1)", "(a)", "¹" or <sup> text. Units,
+    dollar signs and footnotes next to a number do not hide it: "$359.7
+    million" and "200,000(1)" both count. A table of interest without such
+    a digit holds only dashes or placeholders besides its headers.
+    """
+    for row in table.find_all('tr'):
+        texts = []
+        for cell in row.find_all(['td', 'th']):
+            text = ' '.join(x.strip() for x in cell.find_all(string=True) if x.parent.name != 'sup').strip()
+            if text:
+                texts.append(text)
+        for text in texts[1:]:
+            if DIGIT_RE.search(FOOTNOTE_MARK_RE.sub('', SUPERSCRIPT_RUN_RE.sub('', text))):
+                return True
+    return False
+
+
+
+# Strings pd.read_html turns into NaN (pandas' default na_values)
+READ_HTML_NA_STRINGS = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+])
+
+# Same whitespace folding as pandas.io.html._remove_whitespace
+read_html_whitespace_regex = re.compile(r"[\r\n]+|\s{2,}")
+
+# Content whose text lxml and BeautifulSoup disagree on, or that read_html hides.
+# Nested tables are parsed into frames of their own, which can make read_html fail.
+SHAPE_FALLBACK_TAGS = ('table', 'script', 'style', 'template', 'noscript')
+
+
+def read_html_shape(table):
+    """
+    Shape of ``pd.read_html(str(table))[0]`` before and after dropping all-NaN rows and columns.
+
+    Returns ``(num_rows, num_cols, num_rows2, num_cols2)``; all zeros when
+    read_html finds nothing to read.
+    """
+    try:
+        df_table = pd.read_html(str(table))[0]
+    except ValueError:
+        return 0, 0, 0, 0
+    df_table.replace("", np.nan, inplace=True)
+    df_table_cleaned = df_table.dropna(axis=0, how='all').dropna(axis=1, how='all')
+    return df_table.shape[0], df_table.shape[1], df_table_cleaned.shape[0], df_table_cleaned.shape[1]
+
+
+def _read_html_cell_text(cell):
+    # lxml's text_content(), with the newline read_html puts after each <br>
+    pieces = []
+    for node in cell.descendants:
+        if isinstance(node, NavigableString):
+            if not isinstance(node, PreformattedString):
+                pieces.append(str(node))
+        elif node.name == 'br':
+            pieces.append('\n')
+    return read_html_whitespace_regex.sub(" ", ''.join(pieces).strip())
+
+
+def _within(node, table, names):
+    # True if an ancestor of node below table is one of names
+    for parent in node.parents:
+        if parent is table:
+            return False
+        if parent.name in names:
+            return True
+    return False
+
+
+def table_shape(table):
+    """
+    Compute ``read_html_shape(table)`` by walking the parsed <table> node.
+
+    Follows the lxml flavour of ``pd.read_html``: rows are the
+    thead/tbody/tfoot rows it selects, leading all-<th> rows become the
+    header, colspan and rowspan are expanded, ragged rows are padded and
+    pandas' default NA strings count as missing.
+
+    Parameters
+    ----------
+    table : bs4.Tag
+        A <table> element.
+
+    Returns
+    -------
+    tuple of int or None
+        ``(num_rows, num_cols, num_rows2, num_cols2)``, or ``None`` for
+        tables this walker does not model exactly (nested tables, several
+        header rows, hidden or script content, rows without cells,
+        malformed spans).
+        Callers should then use ``read_html_shape``.
+    """
+    for node in table.find_all(True):
+        if node.name in SHAPE_FALLBACK_TAGS or 'display:none' in node.get('style', '').replace(' ', ''):
+            return None
+    if 'display:none' in table.get('style', '').replace(' ', ''):
+        return None
+
+    all_rows = table.find_all('tr')
+    head_rows = []
+    for thead in table.find_all('thead'):
+        head_rows.extend(thead.find_all('tr', recursive=False))
+        if thead.find_all(['td', 'th'], recursive=False):
+            head_rows.append(thead)
+    body_rows = ([tr for tr in all_rows if _within(tr, table, ('tbody',))]
+                 + table.find_all('tr', recursive=False))
+    foot_rows = [tr for tr in all_rows if _within(tr, table, ('tfoot',))]
+
+    def cells(row):
+        return row.find_all(['td', 'th'], recursive=False)
+
+    if not head_rows:
+        while body_rows and all(cell.name == 'th' for cell in cells(body_rows[0])):
+            head_rows.append(body_rows.pop(0))
+    # Each expanded row is a list of (not NA, not blank) flags per cell
+    try:
+        sections = []
+        for rows in (head_rows, body_rows, foot_rows):
+            expanded = []
+            remainder = []
+            for tr in rows:
+                flags = []
+                next_remainder = []
+                index = 0
+                for cell in cells(tr):
+                    while remainder and remainder[0][0] <= index:
+                        prev_i, prev_flag, prev_rowspan = remainder.pop(0)
+                        flags.append(prev_flag)
+                        if prev_rowspan > 1:
+                            next_remainder.append((prev_i, prev_flag, prev_rowspan - 1))
+                        index += 1
+                    text = _read_html_cell_text(cell)
+                    flag = (text not in READ_HTML_NA_STRINGS, bool(text))
+                    rowspan = int(cell.get('rowspan') or 1)
+                    colspan = int(cell.get('colspan') or 1)
+                    for _ in range(colspan):
+                        flags.append(flag)
+                        if rowspan > 1:
+                            next_remainder.append((index, flag, rowspan - 1))
+                        index += 1
+                for prev_i, prev_flag, prev_rowspan in remainder:
+                    flags.append(prev_flag)
+                    if prev_rowspan > 1:
+                        next_remainder.append((prev_i, prev_flag, prev_rowspan - 1))
+                expanded.append(flags)
+                remainder = next_remainder
+            while remainder:
+                next_remainder = []
+                flags = []
+                for prev_i, prev_flag, prev_rowspan in remainder:
+                    flags.append(prev_flag)
+                    if prev_rowspan > 1:
+                        next_remainder.append((prev_i, prev_flag, prev_rowspan - 1))
+                expanded.append(flags)
+                remainder = next_remainder
+            sections.append(expanded)
+    except (TypeError, ValueError):
+        return None
+
+    # Several header rows (rowspans included) give read_html a MultiIndex header
+    head, body, foot = sections
+    if len(head) > 1:
+        return None
+    expanded = head + body + foot
+    num_cols = max((len(flags) for flags in expanded), default=0)
+    if num_cols == 0:
+        return None
+    if num_cols == 1:
+        # read_html's parser skips blank single-field lines, header included
+        expanded = [flags for flags in expanded if flags and flags[0][1]]
+        if not expanded:
+            return None
+    data_rows = expanded[1:] if head else expanded
+
+    valid = [[flag[0] for flag in flags] + [False] * (num_cols - len(flags)) for flags in data_rows]
+    num_rows2 = sum(1 for flags in valid if any(flags))
+    num_cols2 = sum(1 for col in range(num_cols) if any(flags[col] for flags in valid))
+    return len(data_rows), num_cols, num_rows2, num_cols2
+
+
+
 def convert_to_string_if_not_nan(t):
     # Check if the input is NaN
     if pd.isna(t):
@@ -270,26 +687,21 @@ def unicode_text_cleaner(t):
     t = t.replace('\u00a0', ' ').replace('\u200b', ' ').replace('\u200c', ' ')
 
     # Replace consecutive whitespaces with a single space
-    t = re.sub(r"\s+", " ", t)
+    t = WHITESPACE_RUN_RE.sub(" ", t)
     t=t.strip()
     return (t)
 
 
+def _parenthesize_superscripts(match):
+    # Translate superscript to regular digits and wrap each digit with parentheses
+    return ''.join(SUPERSCRIPT_PARENTHESIZED[digit] for digit in match.group())
+
+
 def convert_and_parenthesize_superscripts(text):
     if pd.isna(text):
         return text
-    # Map of superscript numerals to their normal digit counterparts
-    superscript_map = str.maketrans('¹²³⁴⁵⁶⁷⁸⁹', '123456789')
-    
-    # Function to convert superscripts in a match to parenthesized digits
-    def replace_with_parentheses(match):
-        # Translate superscript to regular digits and wrap each digit with parentheses
-        return ''.join(f'({digit})' for digit in match.group().translate(superscript_map))
-    
     # Regex to find sequences of superscript characters
-    converted_text = re.sub(r'[¹²³⁴⁵⁶⁷⁸⁹]+', replace_with_parentheses, text)
-    
-    return converted_text
+    return SUPERSCRIPT_RUN_RE.sub(_parenthesize_superscripts, text)
 
 
                 
@@ -299,9 +711,9 @@ def check_issuer_in_text(text):
         return text
     
     # Search for 'Issuer' in the text using regular expression for case-insensitivity
-    if re.search(r'Issuer', text, re.IGNORECASE):
+    if ISSUER_RE.search(text):
         # Check if there is a parenthesis in the text
-        match = re.search(r'\(([^)]*)\)', text)
+        match = PAREN_CONTENT_RE.search(text)
         if match:
             # Return the content inside the parenthesis
             return match.group(0)
@@ -316,10 +728,10 @@ def para_whitespace_stripper(text):
     if pd.isna(text):
         return text  # Return NaN if the input is NaN
     # Pattern to find and remove spaces after an opening parenthesis
-    text = re.sub(r'\(\s+', '(', text)
+    text = OPEN_PAREN_SPACE_RE.sub('(', text)
     
     # Pattern to find and remove spaces before a closing parenthesis
-    text = re.sub(r'\s+\)', ')', text)
+    text = CLOSE_PAREN_SPACE_RE.sub(')', text)
     
     return text
 
@@ -373,26 +785,27 @@ def three_zero_to_thousand(text):
 
 
 # version 2
+def _replace_with_thousand(match):
+    # Extract the text inside the parentheses
+    inside_text = match.group(1)
+    
+    # Remove non-alphabetic and non-digit characters and check if it is 000s or 000
+    cleaned_text = NON_ALNUM_RE.sub('', inside_text)
+    if cleaned_text in ['000s', '000']:
+        return '(thousand)'
+    else:
+        return f'({inside_text})'  # return original text if it does not match
+
+
 def three_zero_to_thousand(text):
     if pd.isna(text):
         return text
 
     # Regular expression to match 000s, 000's, 000,s within parentheses
-    def replace_with_thousand(match):
-        # Extract the text inside the parentheses
-        inside_text = match.group(1)
-        
-        # Remove non-alphabetic and non-digit characters and check if it is 000s or 000
-        cleaned_text = re.sub(r'[^a-zA-Z0-9]', '', inside_text)
-        if cleaned_text in ['000s', '000']:
-            return '(thousand)'
-        else:
-            return f'({inside_text})'  # return original text if it does not match
-
-    text = re.sub(r'\(([^)]*000[^)]*)\)', replace_with_thousand, text)
+    text = THREE_ZERO_PAREN_RE.sub(_replace_with_thousand, text)
 
     # Regular expression to match "in 000s", "in 000's", "in 000,s"
-    text = re.sub(r'\bin\s*000[\'s,]*\b', 'in thousand', text)
+    text = IN_THREE_ZERO_RE.sub('in thousand', text)
 
     return text
 
@@ -403,32 +816,102 @@ def dollar_sign_to_dollar_word(text):
     if pd.isna(text):
         return text
 
-    # Regular expression to match $ or $s followed immediately by "in" (ignoring whitespace)
-    match = re.search(r'\$\s*in|\$\s*s\s*in', text, re.IGNORECASE)
-    
-    if match:
-        # Replace $ or $s followed by "in" with "dollar"
-        text = re.sub(r'\$\s*(s\s*)?in', 'dollar in', text, flags=re.IGNORECASE)
-    
-    return text
+    # Replace $ or $s followed immediately by "in" (ignoring whitespace) with "dollar in"
+    return DOLLAR_IN_RE.sub('dollar in', text)
+
+
 
+class CellStepError(Exception):
+    """A transform that failed inside ``CellPipeline.apply``; ``step`` is its function name"""
+    def __init__(self, step, cause):
+        self.step = step
+        self.cause = cause
+        super().__init__(f"{step}: {cause}")
 
 
+class CellPipeline:
+    """
+    Per-cell transforms fused into a single traversal of a DataFrame.
+
+    ``apply`` runs every step on a cell before moving to the next cell,
+    which gives the same values as one ``df.map`` per step (the steps take
+    and return single cell values) with one DataFrame allocated instead of
+    one per step.
+
+    Parameters
+    ----------
+    *steps : callable
+        Cell transforms, applied in order. Their ``__name__`` identifies
+        them in errors and timings.
+
+    Examples
+    --------
+    >>> pipeline = CellPipeline(convert_to_string_if_not_nan, unicode_text_cleaner)
+    >>> timings = {}
+    >>> df = pipeline.apply(df, timings)
+    """
+
+    def __init__(self, *steps):
+        self.steps = steps
+
+    @property
+    def names(self):
+        return [step.__name__ for step in self.steps]
+
+    def apply(self, df, timings=None):
+        """
+        Return ``df`` with all steps applied to every cell.
+
+        Seconds spent in each step are added to ``timings`` when a dict is
+        given. Raises ``CellStepError`` naming the step that failed.
+        """
+        steps = self.steps
+        current = [None]
+        if timings is None:
+            def run(value):
+                for step in steps:
+                    current[0] = step
+                    value = step(value)
+                return value
+        else:
+            elapsed = [0.0] * len(steps)
+            clock = time.perf_counter
+
+            def run(value):
+                for i, step in enumerate(steps):
+                    current[0] = step
+                    started = clock()
+                    value = step(value)
+                    elapsed[i] += clock() - started
+                return value
+
+        try:
+            return df.map(run)
+        except Exception as e:
+            raise CellStepError(current[0].__name__, e) from e
+        finally:
+            if timings is not None:
+                for name, seconds in zip(self.names, elapsed):
+                    timings[name] = timings.get(name, 0.0) + seconds
+
+
+
+@memoize_cell
 def text_reducer(text):
     if pd.isna(text):
         return text
 
     # Remove content inside parentheses
-    text = re.sub(r'\(.*?\)', '', text)
+    text = PAREN_LAZY_RE.sub('', text)
 
     # Remove non-alphabet characters
-    text = re.sub(r'[^a-zA-Z\s]', '', text)
+    text = NON_ALPHA_SPACE_RE.sub('', text)
 
     # Remove specific substrings (corrected to handle optional plural 's')
-    text = re.sub(r'\b(billions?|millions?|thousands?)\b', '', text, flags=re.IGNORECASE)
+    text = UNIT_WORD_DESC_RE.sub('', text)
 
     # Collapse multiple whitespace characters into a single space
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RUN_RE.sub(' ', text)
 
     # Return the processed text, stripped of leading/trailing whitespace
     return text.strip()
@@ -454,12 +937,9 @@ def check_single_digit_or_letter(text):
     # Strip whitespace from the text
     stripped_text = text.strip()
 
-    # Regex to match one or more footnote-like patterns within the text, allowing for various separators
-    footnote_pattern = r'^(\([0-9a-zA-Z]\)([ ,/])?)+$'
-
     # Match multiple single-digit or single-letter footnotes within parentheses, potentially separated
     # by spaces, commas, or slashes
-    return bool(re.match(footnote_pattern, stripped_text))
+    return bool(FOOTNOTE_MARKS_ONLY_RE.match(stripped_text))
 
 
 
@@ -505,16 +985,16 @@ def text_reducer2(text):
         return text
 
     # Remove content inside parentheses
-    text = re.sub(r'\(.*?\)', ' ', text)
+    text = PAREN_LAZY_RE.sub(' ', text)
 
     # Remove non-alphabet characters
-    text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+    text = NON_ALPHA_SPACE_RE.sub(' ', text)
 
     # Remove specific substrings (corrected to handle optional plural 's')
-    text = re.sub(r'\b(billions?|millions?|thousands?)\b', ' ', text, flags=re.IGNORECASE)
+    text = UNIT_WORD_DESC_RE.sub(' ', text)
 
     # Collapse multiple whitespace characters into a single space
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RUN_RE.sub(' ', text)
 
     # Return the processed text, stripped of leading/trailing whitespace
     return text.strip()
@@ -539,17 +1019,24 @@ def white_word_maker(text):
 
 
 #footnote handling
+def contents_texts(soup):
+    """Texts of the top-level nodes of a soup; a list of texts is returned as is"""
+    if isinstance(soup, (list, tuple)):
+        return soup
+    return [x.get_text(separator=' ', strip=True) for x in soup.contents]
+
+
 def extract_potential_footnotes(soup):
+    # Either the soup below the table or the texts of its top-level nodes (SectionSplit.after_texts)
     di = {}
     
-    for idx, x in enumerate(soup.contents):
-        y = x.get_text(separator=' ', strip=True)
+    for idx, y in enumerate(contents_texts(soup)):
         
         if not y:
             continue
         
         # Find the first alphanumeric character after ignoring non-alphanumeric characters
-        match = re.search(r'[^a-zA-Z0-9]*([a-zA-Z0-9])', y)
+        match = FIRST_ALNUM_RE.search(y)
         
         if match:
             footnote = match.group(1)
@@ -628,15 +1115,15 @@ def out_paranth_footnote_into_paranth(text, footnotes):
     text = str(text).strip()
 
     # Replace multiple whitespaces with a single '@' symbol
-    text = re.sub(r'\s+', '@', text)
+    text = WHITESPACE_RUN_RE.sub('@', text)
 
     # Split text into words around '@', '(', ')', and ',' and keep these characters as separate elements
     words = []
-    parts = re.split(r'([@(),])', text)  # Split and keep '@', '(', ')', and ','
+    parts = FOOTNOTE_WORD_SEPARATORS_RE.split(text)  # Split and keep '@', '(', ')', and ','
     for part in parts:
         if part not in ['@', '(', ')', ',']:
             # Split further by non-alphabetic and non-digit characters, preserving numbers and letters together
-            sub_parts = re.split(r'(?<=[a-zA-Z])(?=[0-9])|(?<=[0-9])(?=[a-zA-Z])|[^a-zA-Z0-9]+', part)
+            sub_parts = ALNUM_RUN_SPLIT_RE.split(part)
             words.extend(sub for sub in sub_parts if sub)
         else:
             words.append(part)
@@ -695,19 +1182,28 @@ def out_paranth_footnote_into_paranth(text, footnotes):
     return processed_text
 
 
+@functools.lru_cache(maxsize=64)
+def _footnote_values_regex(footnote_values):
+    return re.compile(r'\(\s*(' + '|'.join(re.escape(fn) for fn in footnote_values) + r')\s*\)')
+
+
+def footnote_values_regex(footnotes):
+    """Compiled pattern for the footnote marks of ``footnotes`` in parentheses, built once per set of marks"""
+    return _footnote_values_regex(frozenset(footnotes.values()))
+
+
 def footnote_remover(text, footnotes):
     if pd.isna(text):
         return text
 
-    # Create a pattern from the footnote values that detects them within parentheses with optional spaces
-    footnote_values = set(footnotes.values())  # Extracting values to ensure uniqueness
-    pattern = r'\(\s*(' + '|'.join(re.escape(fn) for fn in footnote_values) + r')\s*\)'
+    # A pattern from the footnote values that detects them within parentheses with optional spaces
+    pattern = footnote_values_regex(footnotes)
     
     # Use regular expression to find and replace footnotes found in the text
-    new_text, count = re.subn(pattern, '', text)
+    new_text, count = pattern.subn('', text)
     
     # Remove any leading or trailing commas after removing footnotes
-    new_text = re.sub(r'^,|,$', '', new_text.strip())
+    new_text = EDGE_COMMA_RE.sub('', new_text.strip())
     
     
     
@@ -722,12 +1218,11 @@ def table_footnote_extractor(text, footnotes):
     if pd.isna(text):
         return text  # Return None if text is NaN
 
-    # Create a pattern from the footnote values to detect them within parentheses
-    footnote_values = set(footnotes.values())  # Ensure unique footnote values
-    pattern = r'\(\s*(' + '|'.join(re.escape(fn) for fn in footnote_values) + r')\s*\)'
+    # A pattern from the footnote values to detect them within parentheses
+    pattern = footnote_values_regex(footnotes)
 
     # Find all matches for the pattern in the text
-    matches = re.findall(pattern, text)
+    matches = pattern.findall(text)
 
     # If matches are found, return them; otherwise, return None
     return matches if matches else None
@@ -737,164 +1232,102 @@ def table_footnote_extractor(text, footnotes):
 def ends_text_strip(text):
     if pd.isna(text):
         return text
-    text = re.sub(r"\s+", " ", text)
+    text = WHITESPACE_RUN_RE.sub(" ", text)
     text = text.lower()
     return text.strip()
 
 
 
-# Define the function to convert a string into its pattern representation
-def convert_to_pattern(text):
-    if pd.isna(text) or text.strip() == '':
-        return []
-    # Define regex patterns for different components
-    month_pattern = r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Sept)'
-    digit_pattern = r'\d+'
-    
-    # Initialize the result pattern list
-    result_pattern = []
-    
-    # Split the text into parts and convert each part to its pattern
-    parts = re.split(r'(\W+)', text)  # Split by non-word characters
-    for part in parts:
-        matched = False
-        part = part.strip()  # Strip each part to remove leading/trailing whitespace
-        
-        # Check for month names
-        if re.fullmatch(month_pattern, part, re.IGNORECASE):
-            result_pattern.append('month_name')
-            matched = True
-        # Check for numbers and categorize based on the range
-        elif re.fullmatch(digit_pattern, part):
-            num = int(part)  # Convert part to integer
-            if 1990 <= num <= 2025:
-                result_pattern.append('num_label_y')
-            elif 1 <= num <= 32:
-                result_pattern.append('num_label_dm')
-            else:
-                result_pattern.append('a number')
-            matched = True
+class CellToken(NamedTuple):
+    """One piece of a cell's text; ``kind`` is one of CELL_TOKEN_KINDS"""
+    kind: str
+    text: str
 
-        # For any unmatched parts, just add them as is, if they're not empty
-        if not matched and part:
-            result_pattern.append(part)
-    
-    return result_pattern
 
+CELL_TOKEN_KINDS = ('month_name', 'num_label_y', 'num_label_dm', 'number', 'word', 'punctuation')
 
+# Numbers in this range are read as years; the range is fixed, not tied to the filing date
+YEAR_LABEL_RANGE = (1990, 2025)
 
-def convert_to_pattern_without_comma(text):
-    char_list=[',',':','.','-','_','–']
+# Labels of the typed tokens in pattern views; words and punctuation stand for themselves
+CELL_TOKEN_LABELS = {'month_name': 'month_name', 'num_label_y': 'num_label_y',
+                     'num_label_dm': 'num_label_dm', 'number': 'a number'}
+
+
+@memoize_cell
+def tokenize_cell(text):
+    """
+    Typed tokens of a cell, the single pass behind convert_to_pattern and its variants.
+
+    The text is split into runs of word characters and runs of other
+    characters; each run is stripped and empty runs are dropped. Month names
+    and abbreviations become ``month_name`` tokens, digit runs become
+    ``num_label_y`` (years in YEAR_LABEL_RANGE), ``num_label_dm`` (1 to 32)
+    or ``number`` tokens, other word runs ``word`` and the rest
+    ``punctuation``. Empty and missing cells have no tokens.
+    """
     if pd.isna(text) or text.strip() == '':
-        return []
-    # Define regex patterns for different components
-    month_pattern = r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Sept)'
-    digit_pattern = r'\d+'
-    
-    # Initialize the result pattern list
-    result_pattern = []
-    
-    # Split the text into parts and convert each part to its pattern
-    parts = re.split(r'(\W+)', text)  # Split by non-word characters
-    for part in parts:
-        matched = False
+        return ()
+    first_year, last_year = YEAR_LABEL_RANGE
+    tokens = []
+    # re.split with a capturing group alternates word runs and separator runs
+    for i, part in enumerate(NON_WORD_SPLIT_RE.split(text)):
         part = part.strip()  # Strip each part to remove leading/trailing whitespace
-        
-        # Check for month names
-        if re.fullmatch(month_pattern, part, re.IGNORECASE):
-            result_pattern.append('month_name')
-            matched = True
-        # Check for numbers and categorize based on the range
-        elif re.fullmatch(digit_pattern, part):
-            num = int(part)  # Convert part to integer
-            if 1990 <= num <= 2025:
-                result_pattern.append('num_label_y')
+        if not part:
+            continue
+        if MONTH_NAME_RE.fullmatch(part):
+            kind = 'month_name'
+        elif DIGITS_RE.fullmatch(part):
+            num = int(part)
+            if first_year <= num <= last_year:
+                kind = 'num_label_y'
             elif 1 <= num <= 32:
-                result_pattern.append('num_label_dm')
+                kind = 'num_label_dm'
             else:
-                result_pattern.append('a number')
-            matched = True
+                kind = 'number'
+        else:
+            kind = 'punctuation' if i % 2 else 'word'
+        tokens.append(CellToken(kind, part))
+    return tuple(tokens)
 
-        # For any unmatched parts, just add them as is, if they're not empty
-        if not matched and part:
-            result_pattern.append(part)
-    results_pattern=[item for item in result_pattern if item not in char_list]
-    return results_pattern
 
+def token_patterns(tokens):
+    """Pattern view: labels for months and numbers, the text of everything else"""
+    return [CELL_TOKEN_LABELS.get(token.kind, token.text) for token in tokens]
 
 
+def token_patterns_without_comma(tokens):
+    """Pattern view without the separators in PATTERN_PUNCTUATION"""
+    return [label for label in token_patterns(tokens) if label not in PATTERN_PUNCTUATION]
+
+
+def token_words(tokens):
+    """Word view: the text of every token"""
+    return [token.text for token in tokens]
+
+
+def token_words_without_comma(tokens):
+    """Word view without the separators in PATTERN_PUNCTUATION"""
+    return [token.text for token in tokens if token.text not in PATTERN_PUNCTUATION]
+
+
+# Define the function to convert a string into its pattern representation
+@memoize_cell
+def convert_to_pattern(text):
+    return token_patterns(tokenize_cell(text))
 
-def convert_to_pattern_words(text):
-    if pd.isna(text) or text.strip() == '':
-        return []
-    # Define regex patterns for different components
-    month_pattern = r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Sept)'
-    digit_pattern = r'\d+'
-    
-    # Initialize the result pattern words list
-    result_words = []
-    
-    # Split the text into parts and match each part with its corresponding word
-    parts = re.split(r'(\W+)', text)  # Split by non-word characters
-    for part in parts:
-        part = part.strip()  # Strip each part to remove leading/trailing whitespace
-        
-        # Check for month names
-        if re.fullmatch(month_pattern, part, re.IGNORECASE):
-            result_words.append(part)  # Append the actual month name
-        # Check for numbers and categorize based on the range
-        elif re.fullmatch(digit_pattern, part):
-            num = int(part)  # Convert part to integer
-            if 1990 <= num <= 2025:
-                result_words.append(part)  # Append the year
-            elif 1 <= num <= 32:
-                result_words.append(part)  # Append the day or month number
-            else:
-                result_words.append(part)  # Append the number
-        # For any unmatched parts, just add them as is, if they're not empty
-        elif part:
-            result_words.append(part)
-    
-    return result_words
 
+def convert_to_pattern_without_comma(text):
+    return token_patterns_without_comma(tokenize_cell(text))
 
 
+@memoize_cell
+def convert_to_pattern_words(text):
+    return token_words(tokenize_cell(text))
+
 
 def convert_to_pattern_words_without_comma(text):
-    char_list=[',',':','.','-','_','–']
-    if pd.isna(text) or text.strip() == '':
-        return []
-    # Define regex patterns for different components
-    month_pattern = r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Sept)'
-    digit_pattern = r'\d+'
-    
-    # Initialize the result pattern words list
-    result_words = []
-    
-    # Split the text into parts and match each part with its corresponding word
-    parts = re.split(r'(\W+)', text)  # Split by non-word characters
-    for part in parts:
-        part = part.strip()  # Strip each part to remove leading/trailing whitespace
-        
-        # Check for month names
-        if re.fullmatch(month_pattern, part, re.IGNORECASE):
-            result_words.append(part)  # Append the actual month name
-        # Check for numbers and categorize based on the range
-        elif re.fullmatch(digit_pattern, part):
-            num = int(part)  # Convert part to integer
-            if 1990 <= num <= 2025:
-                result_words.append(part)  # Append the year
-            elif 1 <= num <= 32:
-                result_words.append(part)  # Append the day or month number
-            else:
-                result_words.append(part)  # Append the number
-        # For any unmatched parts, just add them as is, if they're not empty
-        elif part:
-            result_words.append(part)
-            
-    results_words=[item for item in result_words if item not in char_list]
-    
-    return results_words
+    return token_words_without_comma(tokenize_cell(text))
 
 
 
@@ -957,17 +1390,10 @@ def process_text(text, singular_map):
 
 
 def unit_extracted_for_text(text):
-    # Regular expression to find content inside parentheses
-    singular_map = {
-        "thousands": "thousand",
-        "millions": "million",
-        "billions": "billion",
-        "dollars": "dollar",
-        "shares": "share",
-        "amounts": "amount"
-    }
+    singular_map = UNIT_PLURAL_TO_SINGULAR
     
-    parenthetical_contents = re.finditer(r'\((.*?)\)', text)
+    # Regular expression to find content inside parentheses
+    parenthetical_contents = PAREN_LAZY_GROUP_RE.finditer(text)
     
 
     
@@ -976,20 +1402,20 @@ def unit_extracted_for_text(text):
         inner_text = content.group(1)
         
         # Check for digits and required units
-        if re.search(r'\d', inner_text):  # Ignore if digits are present
+        if DIGIT_RE.search(inner_text):  # Ignore if digits are present
             continue
         
-        if not re.search(r'\b(thousand|million|billion)s?\b', inner_text, re.IGNORECASE):
+        if not UNIT_WORD_SINGULAR_RE.search(inner_text):
             continue  # Ignore if no relevant units are found
         
         y=inner_text
         # Split the text using non-alphabetic characters and rejoin with a whitespace
-        y = ' '.join(re.split(r'[^a-zA-Z]', y))
+        y = NON_ALPHA_RE.sub(' ', y)
 
         processed_text = process_text(y, singular_map)
 
         # Search for unit indicators in the processed text
-        if any(unit in processed_text for unit in ['in thousand', 'in million', 'in billion']):
+        if any(unit in processed_text for unit in UNIT_INDICATORS):
             words = processed_text.split()
             initial_size = len(words)
             
@@ -1012,28 +1438,19 @@ def unit_extracted_for_text(text):
 
 # Function to extract units mentioned in the text below the table
 def extract_units_from_after_contents(soup_after):
-    singular_map = {
-        "thousands": "thousand",
-        "millions": "million",
-        "billions": "billion",
-        "dollars": "dollar",
-        "shares": "share",
-        "amounts": "amount"
-    }
+    singular_map = UNIT_PLURAL_TO_SINGULAR
 
-    after_contents = soup_after.contents
     unit_in_after_contents = {}
 
-    for idx, x in enumerate(after_contents):
-        y = x.get_text(separator=' ', strip=True)
+    for idx, y in enumerate(contents_texts(soup_after)):
         
         # Split the text using non-alphabetic characters and rejoin with a whitespace
-        y = ' '.join(re.split(r'[^a-zA-Z]', y))
+        y = NON_ALPHA_RE.sub(' ', y)
 
         processed_text = process_text(y, singular_map)
 
         # Search for unit indicators in the processed text
-        if any(unit in processed_text for unit in ['in thousand', 'in million', 'in billion']):
+        if any(unit in processed_text for unit in UNIT_INDICATORS):
             words = processed_text.split()
             initial_size = len(words)
             
@@ -1072,11 +1489,11 @@ def other_missing_creater(text):
     text_norm = text.strip().lower()
     
     # Check for common "not applicable" patterns
-    if re.match(r'^n[/\-.,]?a$', text_norm):
+    if NOT_APPLICABLE_RE.match(text_norm):
         return '!o'
     
     # Check for strings consisting only of non-alphanumeric characters
-    if re.match(r'^[^a-zA-Z0-9]+$', text_norm):
+    if ONLY_SYMBOLS_RE.match(text_norm):
         unique_chars = set(text_norm)
         if len(unique_chars) <= 2:  # Only one or two unique non-alphanumeric characters
             return '!o'
@@ -1098,14 +1515,11 @@ def unit_remover(text):
     
     original_text = text.strip()
     
-    # Update regex pattern to handle unit words attached to numbers
-    units_pattern = r'(\b|\d)(thousand|thousands|million|millions|billion|billions)\b'
-    
-    # Replace unit words with a single space
-    text = re.sub(units_pattern, r'\1 ', text, flags=re.IGNORECASE)
+    # Replace unit words, also when attached to numbers, with a single space
+    text = UNIT_SUFFIX_RE.sub(r'\1 ', text)
     
     # Remove extra whitespaces
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = WHITESPACE_RUN_RE.sub(' ', text).strip()
     
     # If the resulting text is empty and the original text was not, return a placeholder
     if len(original_text) > 0 and len(text) == 0:
@@ -1126,18 +1540,16 @@ def general_parenth_remover(text):
     text = text.strip()
     original_text = text
     
-    # Regex pattern to match any content inside parentheses, possibly followed by specific punctuation
-    pattern = r'\([^()]*\)\s*([,\/&])?\s*'
-
-    # Use a loop to continuously apply the regex substitution until no more matches are found
+    # Match any content inside parentheses, possibly followed by specific punctuation;
+    # apply the substitution until no more matches are found
     while True:
-        new_text = re.sub(pattern, '', text)
+        new_text = PAREN_CLAUSE_RE.sub('', text)
         if new_text == text:  # If no change, break the loop
             break
         text = new_text  # Update text with the new changes
     
     # Remove leading/trailing punctuation that might have been left after removing parentheses
-    text = re.sub(r'^\s*[,\/&]+\s*|\s*[,\/&]+\s*$', '', text)
+    text = EDGE_SEPARATORS_RE.sub('', text)
 
     # If removing parentheses empties the text and it was not empty originally, return a placeholder
     if len(original_text) > 0 and len(text.strip()) == 0:
@@ -1157,8 +1569,8 @@ def star_remover(text):
     text = text.strip()
     original_text = text
     
-    # Regex pattern to remove all '*' characters
-    text = re.sub(r'\*', '', text)
+    # Remove all '*' characters
+    text = text.replace('*', '')
     
     # If removing '*' empties the text and it was not empty originally, return a placeholder
     if len(original_text) > 0 and len(text.strip()) == 0:
@@ -1178,12 +1590,10 @@ def single_digit_or_letter_in_parenth_remover(text):
         return text
     text=text.strip()
     org_text=text
-    # Regex pattern to match single digits or letters inside parentheses, possibly followed by specific punctuation
-    pattern = r'\(\s*([0-9]|[A-Za-z])\s*\)\s*([,\/&])?\s*'
-    
-    # Use a loop to continuously apply the regex substitution until no more matches are found
+    # Match single digits or letters inside parentheses, possibly followed by specific punctuation;
+    # apply the substitution until no more matches are found
     while True:
-        new_text = re.sub(pattern, '', text)
+        new_text = FOOTNOTE_MARK_CLAUSE_RE.sub('', text)
         if new_text == text:  # If no change, break the loop
             break
         text = new_text  # Update text with the new changes
@@ -1206,11 +1616,8 @@ def extract_single_digit_or_letter_in_parenth(text):
         return []
 
     text = text.strip()
-    # Regex pattern to match single digits or letters inside parentheses
-    pattern = r'\(\s*([0-9]|[A-Za-z])\s*\)'
-
-    # Use regex.findall to extract all matches
-    extracted_items = re.findall(pattern, text)
+    # Extract all single digits or letters inside parentheses
+    extracted_items = FOOTNOTE_MARK_RE.findall(text)
 
     # The extracted_items list will contain the characters found inside parentheses
     return extracted_items
@@ -1227,10 +1634,22 @@ def extract_single_digit_or_letter_in_parenth(text):
 # ************ new functions ********
 
 
+def _put_in_cache(put, *args):
+    # A cache that cannot be written (disk full, locked database) must not lose what was fetched
+    try:
+        put(*args)
+    except (sqlite3.Error, OSError) as e:
+        print(f"[cache] Error writing to the cache: {e}")
+
+
 def fetch_repurchases_html_section(
     filing_url: str,
     section: str = "part2item2",
     api_key_env: str = "SEC_API_KEY",
+    cache=None,
+    client=None,
+    retry_policy=None,
+    fetch_log: Optional[dict] = None,
 ) -> Optional[str]:
     """
     Fetch the HTML content of a specific section (e.g., 'part2item2')
@@ -1245,6 +1664,18 @@ def fetch_repurchases_html_section(
     api_key_env : str, optional
         Name of the environment variable that stores the SEC API key.
         Defaults to "SEC_API_KEY".
+    cache : SectionCache, optional
+        On-disk cache consulted before calling the API. Successful
+        responses are written back to it.
+    client : SecApiClient, optional
+        Client to call the API with. Defaults to the shared client for the
+        key in ``api_key_env``.
+    retry_policy : RetryPolicy, optional
+        How throttling, timeouts and server errors are retried. Defaults to
+        ``DEFAULT_RETRY_POLICY``.
+    fetch_log : dict, optional
+        Receives the number of API ``'attempts'`` and, if the request
+        finally failed, the ``'error'`` message.
 
     Returns
     -------
@@ -1272,23 +1703,33 @@ def fetch_repurchases_html_section(
         export SEC_API_KEY="your_key_here"
     - This avoids hardcoding secrets in the repository.
     - For GitHub, store the key in `.env` (untracked) or as an Actions secret.
+    - A cache hit never touches the network, so no API key is needed for it.
     """
-    api_key = os.getenv(api_key_env)
-    if not api_key:
-        raise ValueError(
-            f"Missing API key: please set the environment variable '{api_key_env}'"
-        )
+    fetch_log = fetch_log if fetch_log is not None else {}
+    fetch_log['attempts'] = 0
+
+    if cache is not None:
+        cached_html = cache.get_section(filing_url, section)
+        if cached_html is not None:
+            return cached_html
+
+    if client is None:
+        client = get_client(api_key_env)
 
-    query_api = QueryApi(api_key=api_key)
-    extractor_api = ExtractorApi(api_key)
+    retry_policy = retry_policy or DEFAULT_RETRY_POLICY
 
     try:
-        html_content = extractor_api.get_section(filing_url, section, "html")
-        return html_content
-    except Exception as e:
+        html_content, fetch_log['attempts'] = retry_policy.call(client.get_section, filing_url, section, "html")
+    except FetchFailed as e:
+        fetch_log['attempts'] = e.attempts
+        fetch_log['error'] = str(e)
         print(f"[fetch_repurchases_html_section] Error fetching section: {e}")
         return ''
 
+    if cache is not None and html_content:
+        _put_in_cache(cache.put_section, filing_url, section, html_content)
+    return html_content
+
 
 
 
@@ -1296,6 +1737,45 @@ def fetch_repurchases_html_section(
 
 
 
+def read_html_source(source) -> str:
+    """
+    Return section HTML as text from a string, bytes, file path or file object.
+
+    Parameters
+    ----------
+    source : str, bytes, os.PathLike or file-like
+        Raw HTML, a path to an ``.htm``/``.html`` file on disk, or an open
+        (text or binary) file object.
+
+    Returns
+    -------
+    str
+        The decoded HTML. Bytes are decoded as UTF-8, falling back to
+        Windows-1252, which older EDGAR documents use.
+
+    Notes
+    -----
+    - A plain string is treated as a path only if it contains no ``<`` and
+      names an existing file; anything else is taken to be HTML.
+    """
+    if hasattr(source, 'read'):
+        source = source.read()
+    elif isinstance(source, os.PathLike) or (
+        isinstance(source, str) and '<' not in source and os.path.isfile(source)
+    ):
+        with open(source, 'rb') as f:
+            source = f.read()
+
+    if isinstance(source, (bytes, bytearray)):
+        try:
+            return bytes(source).decode('utf-8')
+        except UnicodeDecodeError:
+            return bytes(source).decode('cp1252', errors='replace')
+    return source
+
+
+
+
 def reset_integer_index_and_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Reset the index and/or columns of a DataFrame to consecutive integers 
@@ -1341,6 +1821,7 @@ def reset_integer_index_and_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+@memoize_cell
 def dollar_dropper(text):
     if pd.isna(text):
         return text  # Return as is if the input is NaN
@@ -1349,7 +1830,7 @@ def dollar_dropper(text):
         return text
     org_text=text.strip()
     # Remove any standalone $ within parentheses, potentially surrounded by spaces
-    text = re.sub(r'\(\s*\$\s*\)', '', text)
+    text = EMPTY_DOLLAR_PAREN_RE.sub('', text)
     # Remove all remaining dollar signs
     text = text.replace('$', '')
     # Strip leading and trailing whitespace
@@ -1398,6 +1879,7 @@ def label_score(text):
 
                         
                         
+@memoize_cell
 def convert_to_number(text):
     if pd.isna(text):
         return text  # Return as is if the input is NaN
@@ -1473,30 +1955,177 @@ def days_in_month(year, month):
         
        
         
+# Inline XBRL cover page tag carrying the period end date
+ix_period_end_date_regex = re.compile(
+    r'<ix:nonNumeric\b[^>]*\bname\s*=\s*["\']dei:DocumentPeriodEndDate["\'][^>]*>(.*?)</ix:nonNumeric>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Ways a full cover page date is written; month-only or year-only values are not period end dates
+period_end_date_formats = ('%B %d, %Y', '%b %d, %Y', '%B %d %Y', '%b %d %Y', '%d %B %Y', '%d %b %Y',
+                           '%Y-%m-%d', '%m/%d/%Y')
+
+
+def extract_period_end_date(document_html: str) -> Optional[str]:
+    """
+    Read dei:DocumentPeriodEndDate from the inline XBRL of a filing document.
+
+    Parameters
+    ----------
+    document_html : str
+        HTML of the full 10-Q/10-K document (not just the Item 2 section,
+        which does not carry the cover page tags).
+
+    Returns
+    -------
+    Optional[str]
+        The date as 'YYYY-MM-DD', or `None` if the tag is missing or does not
+        hold a full day, month and year (e.g. "March 2024").
+
+    Examples
+    --------
+    >>> extract_period_end_date('<ix:nonNumeric name="dei:DocumentPeriodEndDate" '
+    ...                         'contextRef="c-1">March&#160;31, 2025</ix:nonNumeric>')
+    '2025-03-31'
+    """
+    match = ix_period_end_date_regex.search(document_html)
+    if not match:
+        return None
+
+    # The value may be split over nested tags and carry entities such as &#160;
+    value = re.sub(r'<[^>]*>', ' ', match.group(1))
+    value = html_lib.unescape(value).replace('\u00a0', ' ')
+    value = re.sub(r'\s+', ' ', value).strip()
+
+    # "Sept." and "Dec." style abbreviations
+    value = re.sub(r'\b(Sept|[A-Za-z]{3})\.', lambda m: m.group(1)[:3], value)
+    value = re.sub(r'\bSept\b', 'Sep', value, flags=re.IGNORECASE)
+
+    for date_format in period_end_date_formats:
+        try:
+            return datetime.datetime.strptime(value, date_format).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return None
+
+
+def fetch_period_end_date_from_document(
+    filing_url: str,
+    user_agent_env: str = "SEC_USER_AGENT",
+    max_bytes: int = 4 * 1024 * 1024,
+    timeout: float = 30,
+    session=None,
+) -> Optional[str]:
+    """
+    Stream a filing document from EDGAR until its DocumentPeriodEndDate tag appears.
+
+    The cover page tags sit near the top of an inline XBRL document, so the
+    download usually stops after the first chunks. EDGAR requests do not
+    count against the sec-api quota.
+
+    Parameters
+    ----------
+    filing_url : str
+        URL of the filing document (plain or inline viewer form).
+    user_agent_env : str, optional
+        Environment variable holding the User-Agent EDGAR requires
+        (e.g. "Jane Doe jane@example.com"). Defaults to "SEC_USER_AGENT".
+    max_bytes : int, optional
+        Stop reading after this many bytes. Defaults to 4 MiB.
+    timeout : float, optional
+        Per-request timeout in seconds.
+    session : requests.Session, optional
+        Session to send the request with, so batch callers reuse
+        keep-alive connections. Defaults to a one-off request.
+
+    Returns
+    -------
+    Optional[str]
+        The date as 'YYYY-MM-DD', or `None` if no User-Agent is configured,
+        the download fails or the tag is not found.
+    """
+    user_agent = os.getenv(user_agent_env)
+    if not user_agent:
+        return None
+
+    try:
+        http = session if session is not None else requests
+        with http.get(normalize_filing_url(filing_url), headers={'User-Agent': user_agent},
+                          stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            buffer = ''
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                searched = len(buffer)
+                buffer += decoder.decode(chunk)
+                # Re-scan a small overlap so a tag split across chunks is still found
+                period_date = extract_period_end_date(buffer[max(0, searched - 4096):])
+                if period_date:
+                    return period_date
+                if len(buffer) >= max_bytes:
+                    break
+    except Exception as e:
+        print(f"[fetch_period_end_date_from_document] Error fetching document: {e}")
+    return None
+
+
+
+
 def fetch_period_report_date(
     filing_url: str,
     api_key_env: str = "SEC_API_KEY",
+    cache=None,
+    document_html: Optional[str] = None,
+    client=None,
+    retry_policy=None,
+    fetch_log: Optional[dict] = None,
 ) -> Optional[str]:
-    
-    api_key = os.getenv(api_key_env)
-    if not api_key:
-        raise ValueError(
-            f"Missing API key: please set the environment variable '{api_key_env}'"
-        )
+    """
+    Return the DocumentPeriodEndDate of a filing as 'YYYY-MM-DD'.
+
+    The date is read from the inline XBRL cover page of the filing
+    (``document_html`` if given, otherwise streamed from EDGAR). The
+    sec-api XBRL-to-JSON conversion is only called when that fails, through
+    ``client`` or the shared client for the key in ``api_key_env``, and
+    retried according to ``retry_policy``. Returns '' if every source
+    fails; ``fetch_log`` then holds the ``'error'``, and the number of
+    API ``'attempts'`` in any case.
+    """
+    fetch_log = fetch_log if fetch_log is not None else {}
+    fetch_log['attempts'] = 0
+    if cache is not None:
+        cached_date = cache.get_period_date(filing_url)
+        if cached_date is not None:
+            return cached_date
+
+    if document_html is not None:
+        period_date = extract_period_end_date(document_html)
+    else:
+        period_date = fetch_period_end_date_from_document(filing_url)
+    if period_date:
+        if cache is not None:
+            _put_in_cache(cache.put_period_date, filing_url, period_date)
+        return period_date
 
-    xbrlApi = XbrlApi(api_key)
-    
+    if client is None:
+        client = get_client(api_key_env)
 
+    retry_policy = retry_policy or DEFAULT_RETRY_POLICY
 
     try:
-        xbrl_json = xbrlApi.xbrl_to_json(
-            htm_url=filing_url
-        )
+        xbrl_json, fetch_log['attempts'] = retry_policy.call(client.xbrl_to_json, htm_url=filing_url)
         
-        return xbrl_json['CoverPage']['DocumentPeriodEndDate']
+        period_date = xbrl_json['CoverPage']['DocumentPeriodEndDate']
     except Exception as e:
+        if isinstance(e, FetchFailed):
+            fetch_log['attempts'] = e.attempts
+        fetch_log['error'] = str(e)
         print(f"Error fetching period_report_date {e}")
         return ''
+
+    if cache is not None and period_date:
+        _put_in_cache(cache.put_period_date, filing_url, period_date)
+    return period_date
         
         
         
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 19:32:12 2026
+
+@author: SEC Repurchase Data Extractor Team
+
+Whole-table versions of the hot per-cell cleaners in utils. Each function
+takes a DataFrame and returns exactly what ``df.map`` with the per-cell
+function returns: the same values and the same column dtypes.
+
+The tables are small, so ``df.map`` spends most of its time dispatching
+per column and per cell rather than doing string work. Here the cells of
+the whole table are handled at once instead. The string cleaners join all
+cells into one buffer, separated by a character none of their patterns
+match, and run each replacement a single time over the buffer. The checks
+run as one NumPy pass over the flattened cells.
+
+A table the fast path cannot handle exactly goes through ``df.map`` with
+the per-cell function, errors included: a cell that is neither a string
+nor missing, or a cell containing the separator.
+"""
+
+
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from .patterns import ISSUER_RE, SUPERSCRIPT_RUN_RE, UNIT_WORD_DESC_RE, WHITESPACE_RUN_RE
+from .utils import (_parenthesize_superscripts, bracket_to_paranth, check_issuer_in_text,
+                    convert_and_parenthesize_superscripts, convert_to_number, convert_to_string_if_not_nan,
+                    dollar_extractor, inner_cell_health_checker, text_reducer, text_reducer2, unicode_text_cleaner)
+
+
+# Joins the cells in the buffer; no pattern below matches it ("." and "\s" do not)
+CELL_SEPARATOR = '\x00'
+
+# text_reducer patterns, kept from crossing into the next cell
+PAREN_IN_CELL_RE = re.compile(r'\([^\x00\n]*?\)')
+NON_ALPHA_IN_CELL_RE = re.compile(r'[^a-zA-Z\s\x00]')
+
+PLACEHOLDERS = np.array(['!p', '!P', '!d', '!u', '!o', '!s'], dtype=object)
+
+_is_str = np.frompyfunc(lambda value: type(value) is str, 1, 1)
+
+
+def _flat_cells(df):
+    values = df.to_numpy(dtype=object).ravel()
+    return values, pd.isna(values)
+
+
+def _like_map(df, values):
+    """A frame shaped and labelled like df holding the flattened values, with df.map's dtype inference"""
+    cells = values.reshape(df.shape)
+    frame = pd.DataFrame(cells, index=df.index, columns=df.columns, dtype=object)
+    # A column holding a string stays object; only the others can be converted
+    for i in np.flatnonzero(~_is_str(cells).astype(bool).any(axis=0)):
+        frame.isetitem(i, frame.iloc[:, i].infer_objects())
+    return frame
+
+
+def _string_buffer(values, missing):
+    """
+    The cells joined by CELL_SEPARATOR with missing cells as ''; None if a
+    present cell is not a string or contains the separator.
+    """
+    present = values[~missing]
+    if not _is_str(present).all():
+        return None
+    texts = values.copy()
+    texts[missing] = ''
+    buffer = CELL_SEPARATOR.join(texts.tolist())
+    if buffer.count(CELL_SEPARATOR) != len(texts) - 1:
+        return None
+    return buffer
+
+
+def _split_buffer(buffer, values, missing):
+    """The stripped cells of the buffer; missing cells keep their original value"""
+    out = np.empty(len(values), dtype=object)
+    out[:] = [cell.strip() for cell in buffer.split(CELL_SEPARATOR)]
+    out[missing] = values[missing]
+    return out
+
+
+CLEANUP_STEPS = (convert_to_string_if_not_nan, unicode_text_cleaner, convert_and_parenthesize_superscripts,
+                 bracket_to_paranth, check_issuer_in_text)
+
+
+def _add_time(timings, step, started):
+    """Add the seconds since ``started`` to the entry of ``step``; returns the new start"""
+    now = time.perf_counter()
+    if timings is not None:
+        timings[step.__name__] = timings.get(step.__name__, 0.0) + now - started
+    return now
+
+
+def _clean_cells_per_cell(df, timings):
+    started = time.perf_counter()
+    for step in CLEANUP_STEPS:
+        df = df.map(step)
+        started = _add_time(timings, step, started)
+    return df
+
+
+def clean_cells(df, timings=None):
+    """
+    ``df.map`` of convert_to_string_if_not_nan, unicode_text_cleaner,
+    convert_and_parenthesize_superscripts, bracket_to_paranth and
+    check_issuer_in_text, in that order.
+
+    Seconds spent in each step are added to ``timings`` under the step's
+    name when a dict is given, as ``CellPipeline.apply`` does. Joining the
+    cells into the buffer counts towards the first step and splitting it
+    back into a frame towards the last.
+    """
+    if df.size == 0:
+        return _clean_cells_per_cell(df, timings)
+    started = time.perf_counter()
+    values, missing = _flat_cells(df)
+    # Numbers from read_html become their str(), as in convert_to_string_if_not_nan
+    numbers = ~missing & ~_is_str(values).astype(bool)
+    if numbers.any():
+        values = values.copy()
+        values[numbers] = [str(value) for value in values[numbers]]
+    buffer = _string_buffer(values, missing)
+    if buffer is None:
+        return _clean_cells_per_cell(df, timings)
+    started = _add_time(timings, convert_to_string_if_not_nan, started)
+
+    buffer = buffer.replace('\u00a0', ' ').replace('\u200b', ' ').replace('\u200c', ' ')
+    buffer = WHITESPACE_RUN_RE.sub(' ', buffer)
+    started = _add_time(timings, unicode_text_cleaner, started)
+    buffer = SUPERSCRIPT_RUN_RE.sub(_parenthesize_superscripts, buffer)
+    started = _add_time(timings, convert_and_parenthesize_superscripts, started)
+    buffer = buffer.replace('[', '(').replace(']', ')')
+    started = _add_time(timings, bracket_to_paranth, started)
+    cells = _split_buffer(buffer, values, missing)
+    if ISSUER_RE.search(buffer):
+        # Rare; the check depends on the whole cleaned cell
+        present = ~missing
+        cells[present] = [check_issuer_in_text(cell) for cell in cells[present]]
+    cleaned = _like_map(df, cells)
+    _add_time(timings, check_issuer_in_text, started)
+    return cleaned
+
+
+def _reduce_cells(df, per_cell, removed):
+    values, missing = _flat_cells(df)
+    buffer = _string_buffer(values, missing) if df.size else None
+    if buffer is None:
+        return df.map(per_cell)
+    buffer = PAREN_IN_CELL_RE.sub(removed, buffer)
+    buffer = NON_ALPHA_IN_CELL_RE.sub(removed, buffer)
+    buffer = UNIT_WORD_DESC_RE.sub(removed, buffer)
+    buffer = WHITESPACE_RUN_RE.sub(' ', buffer)
+    return _like_map(df, _split_buffer(buffer, values, missing))
+
+
+def text_reducer_cells(df):
+    """``df.map(text_reducer)``"""
+    return _reduce_cells(df, text_reducer, '')
+
+
+def text_reducer2_cells(df):
+    """``df.map(text_reducer2)``"""
+    return _reduce_cells(df, text_reducer2, ' ')
+
+
+def dollar_extractor_cells(df):
+    """``df.map(dollar_extractor)``: 1 where a cell holds a dollar sign, else 0"""
+    values, missing = _flat_cells(df)
+    buffer = _string_buffer(values, missing) if df.size else None
+    if buffer is None:
+        return df.map(dollar_extractor)
+    if '$' not in buffer:
+        flags = np.zeros(len(values), dtype=np.int64)
+    else:
+        flags = np.fromiter(('$' in cell for cell in buffer.split(CELL_SEPARATOR)), dtype=np.int64,
+                            count=len(values))
+    return pd.DataFrame(flags.reshape(df.shape), index=df.index, columns=df.columns)
+
+
+def _number(text):
+    try:
+        return float(text)
+    except ValueError:
+        try:
+            return float(text.replace(',', ''))
+        except ValueError:
+            return text
+
+
+_to_number = np.frompyfunc(_number, 1, 1)
+
+
+def convert_to_number_cells(df):
+    """``df.map(convert_to_number)``: strings that read as numbers, commas allowed, become floats"""
+    if df.size == 0:
+        return df.map(convert_to_number)
+    values, missing = _flat_cells(df)
+    strings = ~missing & _is_str(values).astype(bool)
+    out = values.copy()
+    if strings.any():
+        out[strings] = _to_number(values[strings])
+    return _like_map(df, out)
+
+
+def inner_cell_health_checker_cells(df):
+    """``df.map(inner_cell_health_checker)``: 1 for missing, non-string and placeholder cells, else 0"""
+    if df.size == 0:
+        return df.map(inner_cell_health_checker)
+    values, missing = _flat_cells(df)
+    healthy = missing | ~_is_str(values).astype(bool) | np.isin(values, PLACEHOLDERS)
+    return pd.DataFrame(healthy.astype(np.int64).reshape(df.shape), index=df.index, columns=df.columns)
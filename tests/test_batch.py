@@ -0,0 +1,102 @@
+"""
+Tests for the batch fetcher
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from unittest import mock
+
+from src.batch import BatchFetcher, TokenBucket
+from src.cache import SectionCache
+from src.clients import SecApiClient
+
+
+class FakeSession:
+    """Answers sec-api requests after a delay and records peak concurrency"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        with self._lock:
+            self.calls.append((url, params))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        response = mock.MagicMock(status_code=200)
+        if url.endswith("/extractor"):
+            response.text = f"<table>{params['url']}</table>"
+        elif url.endswith("/xbrl-to-json"):
+            response.json.return_value = {'CoverPage': {'DocumentPeriodEndDate': '2025-03-31'}}
+        return response
+
+    def close(self):
+        pass
+
+
+URLS = [f"https://www.sec.gov/Archives/edgar/data/{i}/doc.htm" for i in range(12)]
+
+
+def test_batch_fetch_bounds_concurrency_and_streams_results(monkeypatch):
+    monkeypatch.delenv("SEC_USER_AGENT", raising=False)
+    session = FakeSession()
+    fetcher = BatchFetcher(SecApiClient("test-key", session=session), max_concurrency=4, api_rate=1000)
+
+    results = fetcher.fetch_all(URLS)
+
+    assert sorted(result.filing_url for result in results) == sorted(URLS)
+    assert all(result.error is None for result in results)
+    assert all(result.html_content == f"<table>{result.filing_url}</table>" for result in results)
+    assert all(result.period_report_date == '2025-03-31' for result in results)
+    # Four filings in flight, each with its section and cover page request
+    assert session.peak <= 8
+    assert fetcher.stats['api_requests'] == 24
+    # No User-Agent, so EDGAR is neither asked nor counted
+    assert fetcher.stats['edgar_requests'] == 0
+
+
+def test_cache_hits_skip_the_network(tmp_path, monkeypatch):
+    monkeypatch.delenv("SEC_USER_AGENT", raising=False)
+    cache = SectionCache(str(tmp_path))
+    for url in URLS[:3]:
+        cache.put_section(url, "part2item2", "<table>cached</table>")
+        cache.put_period_date(url, "2024-12-31")
+    session = FakeSession(delay=0)
+
+    results = BatchFetcher(SecApiClient("test-key", session=session), cache=cache).fetch_all(URLS[:3])
+
+    assert [result.html_content for result in results] == ["<table>cached</table>"] * 3
+    assert session.calls == []
+
+
+def test_failing_cache_write_keeps_fetched_values(tmp_path, monkeypatch):
+    monkeypatch.delenv("SEC_USER_AGENT", raising=False)
+    cache = SectionCache(str(tmp_path))
+    monkeypatch.setattr(cache, "put_section", mock.Mock(side_effect=sqlite3.OperationalError("database is locked")))
+    monkeypatch.setattr(cache, "put_period_date", mock.Mock(side_effect=sqlite3.OperationalError("database is locked")))
+
+    [result] = BatchFetcher(SecApiClient("test-key", session=FakeSession(delay=0)), cache=cache).fetch_all(URLS[:1])
+
+    assert result.error is None
+    assert (result.html_content, result.html_attempts) == (f"<table>{URLS[0]}</table>", 1)
+    assert result.period_report_date == '2025-03-31'
+    assert cache.put_section.call_count == 1 and cache.put_period_date.call_count == 1
+
+
+def test_token_bucket_caps_request_rate():
+    async def take(bucket, n):
+        started = time.monotonic()
+        for _ in range(n):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    # Burst of 5 is free, the next 5 arrive at 50 per second
+    assert asyncio.run(take(TokenBucket(rate=50, burst=5), 10)) >= 0.08
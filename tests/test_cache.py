@@ -0,0 +1,75 @@
+"""
+Tests for the on-disk section cache
+"""
+
+import os
+import sqlite3
+from unittest import mock
+
+from src.cache import SectionCache, normalize_filing_url
+from src import utils
+
+
+URL = "https://www.sec.gov/Archives/edgar/data/17843/000001784325000011/crs-20250331.htm"
+
+
+def test_round_trip_and_counters(tmp_path):
+    cache = SectionCache(str(tmp_path))
+    assert cache.get_section(URL) is None
+    cache.put_section(URL, "part2item2", "<p>Item 2</p>")
+    cache.put_period_date(URL, "2025-03-31")
+
+    assert cache.get_section(URL, "part2item2") == "<p>Item 2</p>"
+    assert cache.get_period_date(URL) == "2025-03-31"
+    assert cache.stats == {'hits': 2, 'misses': 1, 'writes': 2, 'evictions': 0}
+    assert len(cache) == 2
+
+
+def test_viewer_and_archive_urls_share_entries(tmp_path):
+    cache = SectionCache(str(tmp_path))
+    viewer_url = URL.replace("https://www.sec.gov/", "https://www.sec.gov/ix?doc=/")
+    assert normalize_filing_url(viewer_url) == URL
+    cache.put_section(viewer_url, "part2item2", "<table></table>")
+    assert cache.get_section(URL) == "<table></table>"
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    # Random hex compresses to roughly half, so two entries fit and three do not
+    cache = SectionCache(str(tmp_path), max_bytes=1600)
+    cache.put_section("a", "part2item2", os.urandom(600).hex())
+    cache.put_section("b", "part2item2", os.urandom(600).hex())
+    cache.get_section("a")
+    cache.put_section("c", "part2item2", os.urandom(600).hex())
+
+    assert cache.get_section("b") is None
+    assert cache.get_section("a") is not None
+    assert cache.stats['evictions'] == 1
+    assert cache.size_bytes <= 1600
+
+
+def test_fetch_helpers_skip_api_on_hit(tmp_path, monkeypatch):
+    monkeypatch.delenv("SEC_API_KEY", raising=False)
+    cache = SectionCache(str(tmp_path))
+    cache.put_section(URL, "part2item2", "<p>cached</p>")
+    cache.put_period_date(URL, "2025-03-31")
+
+    with mock.patch.object(utils, "get_client") as get_client:
+        assert utils.fetch_repurchases_html_section(URL, cache=cache) == "<p>cached</p>"
+        assert utils.fetch_period_report_date(URL, cache=cache) == "2025-03-31"
+    get_client.assert_not_called()
+
+
+def test_failing_cache_write_keeps_fetched_values(tmp_path, monkeypatch):
+    monkeypatch.setenv("SEC_API_KEY", "test-key")
+    cache = SectionCache(str(tmp_path))
+    monkeypatch.setattr(cache, "put_section", mock.Mock(side_effect=sqlite3.OperationalError("database or disk is full")))
+    monkeypatch.setattr(cache, "put_period_date", mock.Mock(side_effect=sqlite3.OperationalError("database is locked")))
+
+    with mock.patch.object(utils, "get_client") as get_client:
+        get_client.return_value.get_section.return_value = "<p>fetched</p>"
+        get_client.return_value.xbrl_to_json.return_value = {'CoverPage': {'DocumentPeriodEndDate': '2025-03-31'}}
+        assert utils.fetch_repurchases_html_section(URL, cache=cache) == "<p>fetched</p>"
+        assert utils.fetch_period_report_date(URL, cache=cache, document_html="<html></html>") == "2025-03-31"
+        document = '<ix:nonNumeric name="dei:DocumentPeriodEndDate">March 31, 2025</ix:nonNumeric>'
+        assert utils.fetch_period_report_date(URL, cache=cache, document_html=document) == "2025-03-31"
+    assert cache.put_section.call_count == 1 and cache.put_period_date.call_count == 2
@@ -0,0 +1,56 @@
+"""
+Tests for the shared sec-api clients
+"""
+
+import threading
+from unittest import mock
+
+import pytest
+
+from src.clients import ApiError, SecApiClient, close_clients, get_client
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    monkeypatch.delenv("SEC_API_BASE_URL", raising=False)
+    close_clients()
+    yield
+    close_clients()
+
+
+def test_one_client_per_key_across_threads(monkeypatch):
+    monkeypatch.setenv("SEC_API_KEY", "key-a")
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(get_client())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in seen}) == 1
+    assert get_client(api_key="key-b") is not seen[0]
+
+
+def test_missing_key_raises(monkeypatch):
+    monkeypatch.delenv("SEC_API_KEY", raising=False)
+    with pytest.raises(ValueError, match="SEC_API_KEY"):
+        get_client()
+
+
+def test_base_url_override_and_api_errors(monkeypatch):
+    monkeypatch.setenv("SEC_API_BASE_URL", "http://127.0.0.1:8765/")
+    session = mock.MagicMock()
+    session.get.return_value = mock.MagicMock(status_code=200, text="<table></table>")
+    client = SecApiClient("key-a", session=session)
+
+    assert client.get_section("https://www.sec.gov/a.htm") == "<table></table>"
+    url = session.get.call_args[0][0]
+    params = session.get.call_args[1]['params']
+    assert url == "http://127.0.0.1:8765/extractor"
+    assert params == {'url': "https://www.sec.gov/a.htm", 'item': "part2item2", 'type': "html", 'token': "key-a"}
+
+    session.get.return_value = mock.MagicMock(status_code=429, text="slow down", headers={'Retry-After': '2'})
+    with pytest.raises(ApiError, match="API error: 429") as excinfo:
+        client.xbrl_to_json("https://www.sec.gov/a.htm")
+    assert excinfo.value.status_code == 429
+    assert excinfo.value.retry_after == 2.0
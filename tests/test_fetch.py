@@ -0,0 +1,44 @@
+"""
+Tests for fetching the section HTML and period end date of a filing
+"""
+
+import time
+from unittest import mock
+
+from src import main
+from src.main import RepurchaseExtractor
+
+
+URL = "https://www.sec.gov/Archives/edgar/data/17843/000001784325000011/crs-20250331.htm"
+
+
+def slow(value, seconds):
+    def fetch(*args, **kwargs):
+        time.sleep(seconds)
+        return value
+    return fetch
+
+
+def test_section_and_period_date_are_fetched_concurrently():
+    with mock.patch.object(main, "fetch_repurchases_html_section", slow("<table></table>", 0.3)), \
+         mock.patch.object(main, "fetch_period_report_date", slow("2025-03-31", 0.3)):
+        extractor = RepurchaseExtractor(URL)
+        started = time.perf_counter()
+        extractor._fetch_html_and_period_data()
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.55
+    assert extractor.html_content == "<table></table>"
+    assert extractor.period_year == 2025
+    assert 'fetch_timed_out' not in extractor.extraction_metadata
+
+
+def test_shared_timeout_marks_slow_request_as_failed():
+    with mock.patch.object(main, "fetch_repurchases_html_section", slow("<table></table>", 1.0)), \
+         mock.patch.object(main, "fetch_period_report_date", slow("2025-03-31", 0.0)):
+        extractor = RepurchaseExtractor(URL, fetch_timeout=0.2)
+        extractor._fetch_html_and_period_data()
+
+    assert extractor.html_content == ''
+    assert extractor.period_year == 2025
+    assert extractor.extraction_metadata['fetch_timed_out'] == ['html']
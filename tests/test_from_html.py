@@ -0,0 +1,140 @@
+"""
+Tests for the offline RepurchaseExtractor.from_html entry point
+"""
+
+import io
+import os
+import pathlib
+import warnings
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from src.main import RepurchaseExtractor
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+CRS_HTML = os.path.join(FIXTURES, "crs_part2item2.html")
+
+
+@pytest.fixture(autouse=True)
+def quiet_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("source", [
+    CRS_HTML,
+    pathlib.Path(CRS_HTML),
+    read_bytes(CRS_HTML),
+    read_bytes(CRS_HTML).decode("utf-8"),
+    io.BytesIO(read_bytes(CRS_HTML)),
+])
+def test_from_html_accepts_all_source_types(source):
+    extractor = RepurchaseExtractor.from_html(source, "2025-03-31")
+    assert extractor.html_content == read_bytes(CRS_HTML).decode("utf-8")
+    assert extractor.period_year == 2025
+
+
+def test_from_html_extracts_without_network(monkeypatch):
+    monkeypatch.delenv("SEC_API_KEY", raising=False)
+    extractor = RepurchaseExtractor.from_html(CRS_HTML, pd.Timestamp("2025-03-31"))
+    extractor.extract()
+
+    data = extractor.repurchase_data
+    assert extractor.extraction_metadata['num_monthly_intervals'] == 3
+    assert list(data['row_label']) == [
+        "January 1-31, 2025", "February 1-28, 2025", "March 1-31, 2025", "Quarter ended March 31, 2025",
+    ]
+    assert list(data['tot_shares']) == ['!o', '!o', 200.0, 200.0]
+    assert list(data['remaining_auth']) == [359.7, 359.7, 322.2, 322.2]
+    assert "$400.0 million" in extractor.soup_before.get_text(separator=' ', strip=True)
+
+
+@pytest.mark.parametrize("section, self_term_re", [
+    ("<p>Item 2. Unregistered Sales of Equity Securities and Use of Proceeds</p>"
+     "<p>The Company did not repurchase any shares of its common stock during the quarter.</p>",
+     'no_repurchase_activity'),
+    ("<p>Item 2. Unregistered Sales of Equity Securities and Use of Proceeds</p><p>None.</p>",
+     'no_repurchase_activity'),
+    ("<p>Issuer Purchases of Equity Securities</p><p>There were no repurchases of our common stock.</p>"
+     "<table><tr><td>Plan</td><td>Authorized</td></tr><tr><td>2019 program</td><td>$500 million</td></tr></table>",
+     'no_repurchase_activity'),
+    ("<p>Item 2. Recent sales of unregistered securities are described in Note 9.</p>"
+     "<table><tr><td>Plan</td><td>Authorized</td></tr><tr><td>2019 program</td><td>$500 million</td></tr></table>",
+     'no_table_of_interest_found'),
+])
+def test_sections_without_table_of_interest_stop_before_shape_analysis(section, self_term_re):
+    extractor = RepurchaseExtractor.from_html(section, "2024-03-31")
+    extractor.extract()
+
+    assert extractor.extraction_metadata['self_term_re'] == self_term_re
+    assert ('no_repurchase_statement' in extractor.extraction_metadata) == (self_term_re == 'no_repurchase_activity')
+    assert 'screen_shape_measured' not in extractor.extraction_metadata
+    assert extractor.repurchase_data.empty
+
+
+def crs_table_variant(replacements):
+    crs_html = read_bytes(CRS_HTML).decode("utf-8")
+    start, end = crs_html.index('<table'), crs_html.rindex('</table>')
+    table = crs_html[start:end]
+    for old, new in replacements:
+        table = table.replace(old, new)
+    return crs_html[:start] + table + crs_html[end:]
+
+
+DASHED_PURCHASES = [('200,000', '—'), ('187.32', '—')]
+
+
+def test_table_without_numbers_stops_before_preprocessing(monkeypatch):
+    section = crs_table_variant(DASHED_PURCHASES + [('359.7', '—'), ('322.2', '—<sup>1</sup>')])
+    preprocess = mock.Mock(side_effect=AssertionError("table was preprocessed"))
+    monkeypatch.setattr(RepurchaseExtractor, "_preprocess_table", preprocess)
+
+    extractor = RepurchaseExtractor.from_html(section, "2025-03-31")
+    extractor.extract()
+
+    assert extractor.extraction_metadata['self_term_re'] == 'no_repurchase_activity'
+    assert extractor.extraction_metadata['no_repurchase_reason'] == 'degenerate_table'
+    assert extractor.repurchase_data.empty
+
+
+def test_dashed_purchases_keep_remaining_authorization():
+    section = crs_table_variant(DASHED_PURCHASES + [('359.7', '359.7 million'), ('322.2', '322.2 million')])
+
+    extractor = RepurchaseExtractor.from_html(section, "2025-03-31")
+    extractor.extract()
+
+    assert pd.isna(extractor.extraction_metadata['self_term_re'])
+    assert list(extractor.repurchase_data['tot_shares']) == ['!o'] * 4
+    assert list(extractor.repurchase_data['remaining_auth']) == [359.7, 359.7, 322.2, 322.2]
+
+
+@pytest.mark.parametrize("footnoted", ['200,000(1)', '200,000 (a)', '200,000¹'])
+def test_footnoted_numbers_are_extracted(footnoted):
+    section = crs_table_variant([('200,000', footnoted), ('187.32', '—'), ('359.7', '—'), ('322.2', '—')])
+
+    extractor = RepurchaseExtractor.from_html(section, "2025-03-31")
+    extractor.extract()
+
+    assert pd.isna(extractor.extraction_metadata['self_term_re'])
+    assert list(extractor.repurchase_data['tot_shares']) == ['!o', '!o', 200.0, 200.0]
+
+
+def test_table_with_numbers_is_extracted_despite_statement():
+    # The text says nothing was bought under the program, but the table still reports remaining authorization
+    section = read_bytes(CRS_HTML).decode("utf-8").replace(
+        "the Company purchased 200,000 shares", "no shares were repurchased")
+
+    extractor = RepurchaseExtractor.from_html(section, "2025-03-31")
+    extractor.extract()
+
+    assert pd.isna(extractor.extraction_metadata['self_term_re'])
+    assert list(extractor.repurchase_data['remaining_auth']) == [359.7, 359.7, 322.2, 322.2]
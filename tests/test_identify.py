@@ -0,0 +1,234 @@
+"""
+Tests for the table identification helpers
+"""
+
+import pickle
+import random
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.utils import (TABLE_FILTER_WORDS, TYPICAL_TABLE_WORDS, SectionSplit, extract_potential_footnotes,
+                       read_html_shape, table_shape, table_word_features, table_word_list,
+                       trim_soup_at_node)
+
+
+NESTED = (
+    "<html><body><p>Intro &amp; authorization</p>"
+    "<table><tr><td><div>Layout cell<table id='target'><tr><td>Jan</td><td>100</td></tr></table>"
+    "(1) Footnote in cell</div><span>trailing</span></td></tr></table>"
+    "<p>(2) Second footnote</p>\n<div>Item 3. Defaults</div></body></html>"
+)
+
+
+def reparsed_split(html, index):
+    soup = BeautifulSoup(html, 'html.parser')
+    serialized = str(soup)
+    table_html = str(soup.find_all('table')[index])
+    start = serialized.find(table_html)
+    return (BeautifulSoup(serialized[:start], 'html.parser'),
+            BeautifulSoup(serialized[start + len(table_html):], 'html.parser'))
+
+
+@pytest.mark.parametrize("index", [0, 1])
+def test_split_matches_reparsed_slices(index):
+    expected_before, expected_after = reparsed_split(NESTED, index)
+    soup = BeautifulSoup(NESTED, 'html.parser')
+    table = soup.find_all('table')[index]
+
+    section_split = SectionSplit(soup, table)
+
+    assert section_split.text_before == expected_before.get_text(separator=' ', strip=True)
+    assert ([node.get_text(separator=' ', strip=True) for node in section_split.soup_after.contents]
+            == [node.get_text(separator=' ', strip=True) for node in expected_after.contents])
+    assert table.parent is None
+
+
+
+
+def test_section_split_texts_do_not_build_the_after_soup():
+    soup = BeautifulSoup(NESTED, 'html.parser')
+    section_split = SectionSplit(soup, soup.find(id='target'))
+    expected_before, expected_after = reparsed_split(NESTED, 1)
+
+    assert section_split.after_texts == [x.get_text(separator=' ', strip=True) for x in expected_after.contents]
+    assert section_split._soup_after is None
+    assert extract_potential_footnotes(section_split.after_texts) == extract_potential_footnotes(section_split.soup_after)
+    assert section_split.html_parts()[1] == str(section_split.soup_after)
+
+
+def test_section_split_pickles_as_html_and_offset():
+    soup = BeautifulSoup(NESTED, 'html.parser')
+    section_split = SectionSplit(soup, soup.find(id='target'))
+    text_before = section_split.text_before
+
+    restored = pickle.loads(pickle.dumps(section_split))
+
+    assert restored._soup_before is None and restored._soup_after is None
+    assert restored.text_before == text_before
+    assert restored.after_texts == section_split.after_texts
+    assert restored.soup_before.get_text(separator=' ', strip=True) == text_before
+    assert ([x.get_text(separator=' ', strip=True) for x in restored.soup_after.contents]
+            == section_split.after_texts)
+
+
+TWO_TABLES = (
+    "<html><body><p>Authorization</p><table><tr><td>Program</td><td>1,000</td></tr></table>"
+    "<div><p>Between</p><table><tr><td>Jan</td><td>100</td></tr></table><p>(1) Note</p></div>"
+    "<p>Exhibits</p></body></html>"
+)
+
+
+@pytest.mark.parametrize("index, keep, expected", [
+    (0, 'after', "Between Jan 100 (1) Note Exhibits"),
+    (1, 'before', "Authorization Program 1,000 Between"),
+])
+def test_trim_drops_node_and_one_side(index, keep, expected):
+    soup = BeautifulSoup(TWO_TABLES, 'html.parser')
+    table = soup.find_all('table')[index]
+
+    trim_soup_at_node(soup, table, keep=keep)
+
+    assert soup.get_text(separator=' ', strip=True) == expected
+    assert table.parent is None
+
+
+SHAPE_CASES = [
+    # Plain grid with an empty spacer column
+    "<table><tr><td>Period</td><td></td><td>Shares</td></tr><tr><td>January</td><td></td><td>1,000</td></tr></table>",
+    # Header row of <th>, colspan and rowspan
+    "<table><tr><th>Period</th><th colspan='2'>Total shares</th></tr>"
+    "<tr><td rowspan='2'>Q1</td><td>100</td><td>N/A</td></tr><tr><td>200</td><td>-</td></tr></table>",
+    # thead/tbody/tfoot with ragged rows and NA strings
+    "<table><thead><tr><td>Month</td><td>Price</td><td>Count</td></tr></thead>"
+    "<tbody><tr><td>Feb</td><td>n/a</td></tr><tr><td>NA</td><td>&nbsp;</td><td>nan</td></tr></tbody>"
+    "<tfoot><tr><td>Total</td><td>10.5</td><td>7</td></tr></tfoot></table>",
+    # Line breaks inside cells and a single-column layout table with blank rows
+    "<table><tr><td>N<br>A</td><td>x</td></tr><tr><td> </td><td>y</td></tr></table>",
+    "<table><tr><td>Authorized program</td></tr><tr><td> </td></tr><tr><td>Expires 2026</td></tr></table>",
+]
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+@pytest.mark.parametrize("html", SHAPE_CASES)
+def test_table_shape_matches_read_html(html, parser):
+    table = BeautifulSoup(html, parser).find('table')
+    assert table_shape(table) == read_html_shape(table)
+
+
+def random_table(rng):
+    texts = ['', ' ', 'N/A', 'x', '12', '&nbsp;', 'a<br>b', 'NA<br>', 'nan', '<span>q</span>', '<!-- c -->', '-']
+
+    def cell():
+        attrs = ''
+        if rng.random() < 0.15:
+            attrs += f' colspan="{rng.choice([1, 2, 3, "0"])}"'
+        if rng.random() < 0.1:
+            attrs += f' rowspan="{rng.choice([1, 2, 3])}"'
+        tag = rng.choice(['td', 'td', 'td', 'th'])
+        return f'<{tag}{attrs}>{rng.choice(texts)}</{tag}>'
+
+    def rows(n):
+        return ''.join('<tr>' + ''.join(cell() for _ in range(rng.randint(0, 6))) + '</tr>' for _ in range(n))
+
+    parts = []
+    if rng.random() < 0.2:
+        parts.append('<thead>' + rows(rng.randint(0, 2)) + '</thead>')
+    body = rows(rng.randint(0, 7))
+    parts.append('<tbody>' + body + '</tbody>' if rng.random() < 0.5 else body)
+    if rng.random() < 0.1:
+        parts.append('<tfoot>' + rows(rng.randint(0, 2)) + '</tfoot>')
+    return '<div><table>' + ''.join(parts) + '</table></div>'
+
+
+def test_table_shape_matches_read_html_on_random_tables():
+    rng = random.Random(0)
+    checked = 0
+    for _ in range(400):
+        table = BeautifulSoup(random_table(rng), 'lxml').find('table')
+        if len(table.get_text(strip=True)) < 10:
+            continue
+        shape = table_shape(table)
+        if shape is not None:
+            checked += 1
+            assert shape == read_html_shape(table)
+    assert checked > 150
+
+
+def test_screening_prunes_before_measuring_shapes():
+    import contextlib
+    import io
+    import os
+
+    from src.main import RepurchaseExtractor
+
+    with open(os.path.join(os.path.dirname(__file__), "fixtures", "dfs_part2item2.html")) as f:
+        section = f.read()
+    empty = "<table><tr><td>&#160;</td><td>$</td></tr></table>"
+    layout = "<table><tr><td>Item 2. Unregistered Sales of Equity Securities</td><td>25</td></tr></table>"
+    extractor = RepurchaseExtractor.from_html(empty * 3 + layout * 2 + section, "2024-03-31")
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor._identify_and_extract_table()
+
+    metadata = extractor.extraction_metadata
+    assert metadata['screen_text_pruned'] == 3
+    assert metadata['screen_words_pruned'] == 2
+    assert metadata['screen_shape_measured'] == 1
+    assert all(metadata[f'screen_{stage}_seconds'] >= 0 for stage in ('text', 'words', 'shape'))
+    assert extractor.table is not None
+
+
+def split_word_list(text):
+    # The rule table_word_list replaces
+    words = re.split(r'[^a-zA-Z]+', text)
+    return [word.lower() for word in words if len(word) > 2 and word.lower() not in TABLE_FILTER_WORDS]
+
+
+def test_table_word_list_matches_split_rule():
+    rng = random.Random(7)
+    pieces = ["Total", "Number", "of", "Shares", "JANUARY", "Jan.", "millions", "Maximum", "dollar", "2024",
+              "$1,000", "(1)", "\u2014", "na\u00efve", "Mayor", "\u0130D", "\u212aey", "x", "_per_", "plan-2"]
+    for _ in range(300):
+        text = rng.choice([" ", "", "\n", "/"]).join(rng.choice(pieces) for _ in range(rng.randint(0, 30)))
+        assert table_word_list(text) == split_word_list(text), text
+
+
+def test_table_word_features_for_several_tables():
+    features = table_word_features(["Total Number of Shares Purchased in January",
+                                    "Item 2. Unregistered Sales", ""])
+
+    assert list(features.index) == [0, 1, 2]
+    assert features['word_list'][0] == ['total', 'number', 'shares', 'purchased']
+    assert sorted(features['word_inter_set'][0]) == ['number', 'purchased', 'shares', 'total']
+    assert list(features['word_inter_len']) == [4, 0, 0]
+    assert list(features['word_len']) == [4, 3, 0]
+    assert set(features['word_inter_set'][0]) <= TYPICAL_TABLE_WORDS
+
+
+@pytest.mark.parametrize("fixture, other_loc", [("acme_10k_item5.html", "after"), ("beta_10k_item5.html", "before")])
+def test_other_significant_table_is_removed_without_reparsing(monkeypatch, fixture, other_loc):
+    import bs4
+    import contextlib
+    import io
+    import os
+
+    from src.main import RepurchaseExtractor
+
+    parsed, serialized = [], []
+    init, decode = bs4.BeautifulSoup.__init__, bs4.BeautifulSoup.decode
+    monkeypatch.setattr(bs4.BeautifulSoup, '__init__',
+                        lambda self, markup='', *args, **kwargs: parsed.append(len(markup)) or init(self, markup, *args, **kwargs))
+    monkeypatch.setattr(bs4.BeautifulSoup, 'decode',
+                        lambda self, *args, **kwargs: serialized.append(1) or decode(self, *args, **kwargs))
+
+    path = os.path.join(os.path.dirname(__file__), "fixtures", fixture)
+    extractor = RepurchaseExtractor.from_html(path, "2023-12-31")
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor._identify_and_extract_table()
+
+    assert extractor.extraction_metadata['num_other_sig_tables'] == 1
+    other_id = extractor.extraction_metadata['unique_other_sig_table_id']
+    assert (other_id > extractor.extraction_metadata['table_of_interest_id']) == (other_loc == "after")
+    assert parsed == [len(extractor.html_content)]
+    assert serialized == []
@@ -0,0 +1,62 @@
+"""
+Tests for the local Part II Item 2 / Item 5 section locator
+"""
+
+import os
+import warnings
+
+from src.locator import extract_primary_document, locate_repurchase_section
+from src.main import RepurchaseExtractor
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def fixture_text(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_locates_10q_section_and_skips_table_of_contents():
+    section = locate_repurchase_section(os.path.join(FIXTURES, "crs-20250331.htm"))
+    assert section == fixture_text("crs_part2item2.html").strip()
+
+
+def test_full_submission_uses_primary_document():
+    submission = fixture_text("0000017843-25-000011.txt")
+    assert "crs-20250331" in extract_primary_document(submission)
+    assert locate_repurchase_section(submission) == fixture_text("crs_part2item2.html").strip()
+
+
+def test_locates_10k_item5():
+    item5 = fixture_text("acme_10k_item5.html").strip()
+    document = (
+        "<html><body><div><span>Item 5. Market for Registrant&#8217;s Common Equity</span></div>"
+        "<div><span>Item 6. [Reserved]</span></div>"
+        "<div><span>PART II</span></div>" + item5
+        + "<div><span>Item 6. [Reserved]</span></div>"
+        "<div><span>Item 7. Management&#8217;s Discussion and Analysis</span></div></body></html>"
+    )
+    assert locate_repurchase_section(document, form_type="10-K") == item5
+    assert locate_repurchase_section(document) == item5
+
+
+def test_missing_section_returns_empty_string():
+    assert locate_repurchase_section("<html><body><p>Item 1. Business</p></body></html>") == ''
+
+
+def test_from_document_matches_from_html():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        local = RepurchaseExtractor.from_document(os.path.join(FIXTURES, "0000017843-25-000011.txt"), "2025-03-31")
+        local.extract()
+        reference = RepurchaseExtractor.from_html(os.path.join(FIXTURES, "crs_part2item2.html"), "2025-03-31")
+        reference.extract()
+    assert local.repurchase_data.equals(reference.repurchase_data)
+
+
+def test_from_document_reads_period_end_date_from_inline_xbrl():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        extractor = RepurchaseExtractor.from_document(os.path.join(FIXTURES, "crs-20250331.htm"))
+    assert extractor.period_report_date.strftime('%Y-%m-%d') == '2025-03-31'
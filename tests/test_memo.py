@@ -0,0 +1,79 @@
+"""
+Tests for the opt-in memoization of cell helpers
+"""
+
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+from src import memo
+from src.main import RepurchaseExtractor
+from src.utils import convert_to_pattern, text_reducer
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture
+def memoized():
+    memo.enable_cell_memo(maxsize=4)
+    yield
+    memo.disable_cell_memo()
+
+
+def extract(fixture, period_date):
+    extractor = RepurchaseExtractor.from_html(os.path.join(FIXTURES, fixture), period_date)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        extractor.extract()
+    return extractor.repurchase_data
+
+
+def test_off_by_default():
+    assert not memo.cell_memo_enabled()
+    assert memo.cell_memo_stats() is None
+    assert text_reducer("Total (1)") == "Total"
+
+
+def test_repeated_cells_are_hits(memoized):
+    for _ in range(3):
+        assert text_reducer("Shares purchased (in thousands)") == "Shares purchased"
+    assert text_reducer(np.nan) is np.nan
+
+    stats = memo.cell_memo_stats()['text_reducer']
+    # NaN is not looked up
+    assert (stats['hits'], stats['misses'], stats['size']) == (2, 1, 1)
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+
+def test_cache_is_bounded(memoized):
+    for i in range(10):
+        text_reducer(f"Row {i}")
+
+    assert memo.cell_memo_stats()['text_reducer']['size'] == 4
+
+
+def test_list_results_are_copies(memoized):
+    first = convert_to_pattern("January 2024")
+    first.append("changed")
+
+    assert convert_to_pattern("January 2024") == ['month_name', 'num_label_y']
+    assert memo.cell_memo_stats()['convert_to_pattern']['hits'] == 1
+
+
+def test_extraction_is_unchanged_and_reuses_cells_across_filings():
+    expected = extract("dfs_part2item2.html", "2024-03-31")
+    memo.enable_cell_memo()
+    try:
+        first = extract("dfs_part2item2.html", "2024-03-31")
+        misses = memo.cell_memo_stats()['unit_extractor']['misses']
+        second = extract("dfs_part2item2.html", "2024-03-31")
+        stats = memo.cell_memo_stats()['unit_extractor']
+    finally:
+        memo.disable_cell_memo()
+
+    assert first.equals(expected) and second.equals(expected)
+    # The second filing's cells were all seen in the first
+    assert stats['misses'] == misses and stats['hits'] > 0
@@ -0,0 +1,54 @@
+"""
+Parity of the extraction across BeautifulSoup parser backends
+"""
+
+import importlib.util
+import os
+import warnings
+
+import pytest
+
+from src.main import RepurchaseExtractor
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+CORPUS = [
+    ("crs_part2item2.html", "2025-03-31"),
+    ("dfs_part2item2.html", "2024-03-31"),
+    ("acme_10k_item5.html", "2023-12-31"),
+    ("beta_10k_item5.html", "2023-12-31"),
+]
+BACKENDS = [
+    "lxml",
+    pytest.param("html5lib", marks=pytest.mark.skipif(importlib.util.find_spec("html5lib") is None,
+                                                      reason="html5lib not installed")),
+]
+
+
+def run(fixture, period_date, parser):
+    extractor = RepurchaseExtractor.from_html(os.path.join(FIXTURES, fixture), period_date, parser=parser)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        extractor.extract()
+    return extractor
+
+
+def comparable_metadata(extractor):
+    # Stage timings differ from run to run
+    return {key: value for key, value in extractor.extraction_metadata.items() if not key.endswith('_seconds')}
+
+
+@pytest.mark.parametrize("parser", BACKENDS)
+@pytest.mark.parametrize("fixture, period_date", CORPUS)
+def test_backend_matches_html_parser(fixture, period_date, parser):
+    expected = run(fixture, period_date, "html.parser")
+    extractor = run(fixture, period_date, parser)
+
+    assert extractor.repurchase_data.equals(expected.repurchase_data)
+    assert str(comparable_metadata(extractor)) == str(comparable_metadata(expected))
+    assert (extractor.soup_before.get_text(separator=' ', strip=True)
+            == expected.soup_before.get_text(separator=' ', strip=True))
+
+
+def test_lxml_is_the_default():
+    assert RepurchaseExtractor("https://example.test/a.htm").parser == "lxml"
@@ -0,0 +1,61 @@
+"""
+Tests for reading DocumentPeriodEndDate from inline XBRL
+"""
+
+from unittest import mock
+
+import pytest
+
+from src import utils
+
+
+@pytest.mark.parametrize("tag, expected", [
+    ('<ix:nonNumeric name="dei:DocumentPeriodEndDate" contextRef="c-1">March&#160;31, 2025</ix:nonNumeric>', '2025-03-31'),
+    ("<ix:nonnumeric contextref='c-1' name='dei:DocumentPeriodEndDate'><span>Dec 31,</span> <span>2023</span></ix:nonnumeric>", '2023-12-31'),
+    ('<ix:nonNumeric name="dei:DocumentPeriodEndDate" contextRef="c-1">2024-06-29</ix:nonNumeric>', '2024-06-29'),
+    ('<ix:nonNumeric name="dei:DocumentType" contextRef="c-1">10-Q</ix:nonNumeric>', None),
+    ('<ix:nonNumeric name="dei:DocumentPeriodEndDate" contextRef="c-1">the quarter</ix:nonNumeric>', None),
+    ('<ix:nonNumeric name="dei:DocumentPeriodEndDate" contextRef="c-1">Sept. 30, 2024</ix:nonNumeric>', '2024-09-30'),
+    ('<ix:nonNumeric name="dei:DocumentPeriodEndDate" contextRef="c-1">03/31/2025</ix:nonNumeric>', '2025-03-31'),
+    # Without a day these are not period end dates
+    ('<ix:nonNumeric name="dei:DocumentPeriodEndDate" contextRef="c-1">March 2024</ix:nonNumeric>', None),
+    ('<ix:nonNumeric name="dei:DocumentPeriodEndDate" contextRef="c-1">2024</ix:nonNumeric>', None),
+])
+def test_extract_period_end_date(tag, expected):
+    assert utils.extract_period_end_date("<html><body>" + tag + "</body></html>") == expected
+
+
+def test_xbrl_api_is_only_a_fallback(monkeypatch):
+    monkeypatch.setenv("SEC_API_KEY", "test-key")
+    document = '<ix:nonNumeric name="dei:DocumentPeriodEndDate">March 31, 2025</ix:nonNumeric>'
+
+    with mock.patch.object(utils, "get_client") as get_client:
+        assert utils.fetch_period_report_date("https://example.test/a.htm", document_html=document) == '2025-03-31'
+        get_client.assert_not_called()
+
+        get_client.return_value.xbrl_to_json.return_value = {'CoverPage': {'DocumentPeriodEndDate': '2024-12-31'}}
+        assert utils.fetch_period_report_date("https://example.test/a.htm", document_html="<html></html>") == '2024-12-31'
+        get_client.return_value.xbrl_to_json.assert_called_once()
+
+
+def test_partial_document_date_falls_back_to_xbrl_api(monkeypatch):
+    monkeypatch.setenv("SEC_API_KEY", "test-key")
+    document = '<ix:nonNumeric name="dei:DocumentPeriodEndDate">March 2024</ix:nonNumeric>'
+
+    with mock.patch.object(utils, "get_client") as get_client:
+        get_client.return_value.xbrl_to_json.return_value = {'CoverPage': {'DocumentPeriodEndDate': '2024-03-31'}}
+        assert utils.fetch_period_report_date("https://example.test/a.htm", document_html=document) == '2024-03-31'
+        get_client.return_value.xbrl_to_json.assert_called_once()
+
+
+def test_streamed_document_stops_at_tag(monkeypatch):
+    monkeypatch.setenv("SEC_USER_AGENT", "Research Bot research@example.com")
+    chunks = [b'<html><body>' + b' ' * 70000, b'<ix:nonNumeric name="dei:Document', b'PeriodEndDate">June 30, 2024</ix:nonNumeric>', b'x' * 10]
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    response.iter_content.return_value = iter(chunks)
+
+    with mock.patch.object(utils.requests, "get", return_value=response) as get:
+        assert utils.fetch_period_end_date_from_document("https://www.sec.gov/ix?doc=/Archives/a.htm") == '2024-06-30'
+    assert get.call_args[0][0] == "https://www.sec.gov/Archives/a.htm"
+    assert get.call_args[1]['headers'] == {'User-Agent': "Research Bot research@example.com"}
@@ -0,0 +1,55 @@
+"""
+Tests for the prefetching extraction pipeline
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from src.batch import BatchFetcher
+from src.clients import SecApiClient
+from src.main import RepurchaseExtractor
+from src.pipeline import ExtractionPipeline
+from src.standin import StandInServer
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+FILINGS = {
+    "crs-20250331": ("crs_part2item2.html", "2025-03-31"),
+    "dfs-20240331": ("dfs_part2item2.html", "2024-03-31"),
+}
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("SEC_USER_AGENT", raising=False)
+    for name, (section_file, period_date) in FILINGS.items():
+        shutil.copy(os.path.join(FIXTURES, section_file), tmp_path / f"{name}.part2item2.html")
+        (tmp_path / f"{name}.json").write_text(json.dumps({'CoverPage': {'DocumentPeriodEndDate': period_date}}))
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize("cell_memo_size", [None, 1024])
+def test_pipeline_matches_single_filing_extraction(fixtures_dir, cell_memo_size):
+    urls = [f"https://www.sec.gov/Archives/edgar/data/{i}/{name}.htm" for i in range(3) for name in FILINGS]
+    with StandInServer(fixtures_dir, latency=0.01) as server:
+        fetcher = BatchFetcher(SecApiClient("any-key", base_url=server.base_url), max_concurrency=4)
+        pipeline = ExtractionPipeline(fetcher, cpu_workers=2, prefetch=2, cell_memo_size=cell_memo_size)
+        results = {result.filing_url: result for result in pipeline.run(urls)}
+
+    assert sorted(results) == sorted(urls)
+    assert pipeline.stats['fetched'] == pipeline.stats['parsed'] == len(urls)
+    for name, (section_file, period_date) in FILINGS.items():
+        expected = RepurchaseExtractor.from_html(os.path.join(FIXTURES, section_file), period_date)
+        expected.extract()
+        result = results[f"https://www.sec.gov/Archives/edgar/data/0/{name}.htm"]
+        assert result.repurchase_data.equals(expected.repurchase_data)
+        assert result.soup_before_html == str(expected.soup_before)
+        assert result.extraction_metadata['html_fetch_attempts'] == 1
+    for result in results.values():
+        if cell_memo_size is None:
+            assert result.cell_memo_stats is None
+        else:
+            assert result.cell_memo_stats['text_reducer']['maxsize'] == cell_memo_size
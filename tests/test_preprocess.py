@@ -0,0 +1,119 @@
+"""
+Tests for the cell cleanup helpers of table preprocessing
+"""
+
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks import bench_helpers
+from src.main import CELL_CLEANUP_STEPS, CELL_NOTATION_STEPS, RepurchaseExtractor
+from src.utils import (CELL_TOKEN_KINDS, CellPipeline, CellStepError, convert_and_parenthesize_superscripts,
+                       convert_to_pattern, convert_to_pattern_without_comma, convert_to_pattern_words,
+                       convert_to_pattern_words_without_comma, footnote_remover, footnote_values_regex,
+                       table_footnote_extractor, token_patterns, token_words, tokenize_cell)
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+CELLS = pd.DataFrame({
+    0: ["January 1 – 31, 2024", np.nan, "Total [1]", "  $ 12.50 "],
+    1: ["1,234²", "(in 000's)", "\xa0", 5],
+    2: ["Issuer Purchases", "$ 000", np.nan, "Oct 1"],
+})
+
+
+@pytest.mark.parametrize("pipeline", [CELL_CLEANUP_STEPS, CELL_NOTATION_STEPS])
+def test_pipeline_matches_one_map_per_step(pipeline):
+    expected = CELLS
+    if pipeline is CELL_NOTATION_STEPS:
+        # The notation steps run on cleaned cells
+        expected = CELL_CLEANUP_STEPS.apply(CELLS).fillna('')
+    cells = expected
+    for step in pipeline.steps:
+        expected = expected.map(step)
+
+    timings = {}
+    result = pipeline.apply(cells, timings)
+
+    assert result.equals(expected)
+    assert list(timings) == pipeline.names
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_failing_step_is_named():
+    def broken(value):
+        raise ValueError("bad cell")
+
+    with pytest.raises(CellStepError) as info:
+        CellPipeline(str.strip, broken).apply(pd.DataFrame([[" a "]]))
+
+    assert info.value.step == "broken"
+    assert isinstance(info.value.cause, ValueError)
+
+
+def test_superscripts_are_parenthesized_per_digit():
+    assert convert_and_parenthesize_superscripts("Total¹² shares³") == "Total(1)(2) shares(3)"
+    assert convert_and_parenthesize_superscripts("no marks") == "no marks"
+
+
+def test_footnote_pattern_is_built_once_per_set_of_marks():
+    pattern = footnote_values_regex({0: '1', 1: '2'})
+
+    assert footnote_values_regex({5: '2', 6: '1', 7: '1'}) is pattern
+    assert footnote_remover("Total (1), (2)", {0: '1', 1: '2'}) == "Total"
+    assert table_footnote_extractor("Total ( 2 )", {0: '1', 1: '2'}) == ['2']
+
+
+def test_every_helper_has_a_benchmark():
+    cells = ["January 1 - 31, 2024 (1)", "$ 12.50", "(in thousands)"]
+
+    results = bench_helpers.bench(cells, repeat=1, number=1)
+
+    assert [name for name, _ in results] == [name for name, _ in bench_helpers.HELPERS]
+    assert all(micros > 0 for _, micros in results)
+
+
+def test_tokenizer_types_every_piece():
+    tokens = tokenize_cell("Sept 1 - 30, 2024: 12,500 shares")
+
+    assert [(t.kind, t.text) for t in tokens] == [
+        ('month_name', 'Sept'), ('num_label_dm', '1'), ('punctuation', '-'), ('num_label_dm', '30'),
+        ('punctuation', ','), ('num_label_y', '2024'), ('punctuation', ':'), ('num_label_dm', '12'),
+        ('punctuation', ','), ('number', '500'), ('word', 'shares')]
+    assert {t.kind for t in tokens} <= set(CELL_TOKEN_KINDS)
+    # Years are a fixed range
+    assert [t.kind for t in tokenize_cell("1989 1990 2025 2026")] == ['number', 'num_label_y', 'num_label_y', 'number']
+    assert tokenize_cell("  ") == () and tokenize_cell(np.nan) == ()
+
+
+@pytest.mark.parametrize("text", ["January 1 - 31, 2024", "Oct. 1-31", "Total (1)(2)", "__init__ - x",
+                                  "Period: 2/1/2024 – 2/29/2024", "1,000 shares", "Mar"])
+def test_pattern_views_are_projections_of_the_tokens(text):
+    tokens = tokenize_cell(text)
+
+    assert convert_to_pattern(text) == token_patterns(tokens)
+    assert convert_to_pattern_words(text) == token_words(tokens)
+    assert convert_to_pattern_without_comma(text) == [p for p in convert_to_pattern(text)
+                                                      if p not in [',', ':', '.', '-', '_', '–']]
+    assert convert_to_pattern_words_without_comma(text) == [w for w in convert_to_pattern_words(text)
+                                                            if w not in [',', ':', '.', '-', '_', '–']]
+
+
+def test_period_rows_matched_without_commas():
+    with open(os.path.join(FIXTURES, "dfs_part2item2.html")) as f:
+        section = f.read()
+    expected = RepurchaseExtractor.from_html(section, "2024-03-31")
+    # One period row without its comma only matches the others in the no-comma views
+    extractor = RepurchaseExtractor.from_html(section.replace("March 1 - 31, 2024", "March 1 - 31 2024"),
+                                              "2024-03-31")
+    for e in (expected, extractor):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            e.extract()
+
+    assert extractor.repurchase_data.equals(expected.repurchase_data)
@@ -0,0 +1,92 @@
+"""
+Tests for retrying failed sec-api requests
+"""
+
+from unittest import mock
+
+import pytest
+import requests
+
+from src import retry
+from src.batch import BatchFetcher, TokenBucket
+from src.clients import ApiError, SecApiClient
+from src.main import RepurchaseExtractor
+from src.retry import FetchFailed, RetryPolicy
+
+
+URL = "https://www.sec.gov/Archives/edgar/data/17843/000001784325000011/crs-20250331.htm"
+
+
+@pytest.mark.parametrize("exc, kind", [
+    (ApiError(429, "too many"), retry.THROTTLED),
+    (ApiError(503, "unavailable"), retry.RETRYABLE),
+    (requests.Timeout(), retry.RETRYABLE),
+    (requests.ConnectionError(), retry.RETRYABLE),
+    (ApiError(404, "not found"), retry.PERMANENT),
+    (ValueError("bad input"), retry.PERMANENT),
+])
+def test_classify(exc, kind):
+    assert RetryPolicy.classify(exc) == kind
+
+
+def test_call_retries_transient_errors_only():
+    fn = mock.Mock(side_effect=[ApiError(429, "x"), requests.Timeout(), "ok"])
+    with mock.patch.object(retry.time, "sleep") as sleep:
+        assert RetryPolicy(seed=0).call(fn) == ("ok", 3)
+    assert sleep.call_count == 2
+
+    with pytest.raises(FetchFailed) as excinfo:
+        RetryPolicy().call(mock.Mock(side_effect=ApiError(404, "gone")))
+    assert (excinfo.value.kind, excinfo.value.attempts) == (retry.PERMANENT, 1)
+
+    with mock.patch.object(retry.time, "sleep"), pytest.raises(FetchFailed) as excinfo:
+        RetryPolicy(max_attempts=3).call(mock.Mock(side_effect=ApiError(503, "down")))
+    assert (excinfo.value.kind, excinfo.value.attempts) == ('exhausted', 3)
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, seed=0)
+    delays = [policy.backoff(attempt) for attempt in range(1, 8)]
+    assert all(0 <= delay <= min(5.0, 2 ** (attempt - 1)) for attempt, delay in enumerate(delays, 1))
+    assert policy.backoff(1, ApiError(429, "x", retry_after=60)) == 5.0
+
+
+def test_failed_fetch_is_reported_as_rerunnable(monkeypatch):
+    monkeypatch.setenv("SEC_API_KEY", "test-key")
+    monkeypatch.delenv("SEC_USER_AGENT", raising=False)
+    client = mock.Mock()
+    client.get_section.side_effect = ApiError(503, "unavailable")
+    client.xbrl_to_json.return_value = {'CoverPage': {'DocumentPeriodEndDate': '2025-03-31'}}
+
+    with mock.patch("src.utils.get_client", return_value=client), mock.patch.object(retry.time, "sleep"):
+        extractor = RepurchaseExtractor(URL)
+        extractor.extract()
+
+    metadata = extractor.extraction_metadata
+    assert metadata['error_term_re'] == 'fetch_failed'
+    assert metadata['html_fetch_attempts'] == 5
+    assert metadata['period_fetch_attempts'] == 1
+    assert 'period_fetch_error' not in metadata
+
+
+def test_batch_throttling_slows_the_limiter(monkeypatch):
+    monkeypatch.setenv("SEC_USER_AGENT", "Research Bot research@example.com")
+    bucket = TokenBucket(rate=8)
+    bucket.throttle()
+    bucket.throttle()
+    assert bucket.rate == 2
+    for _ in range(200):
+        bucket.recover()
+    assert bucket.rate == 8
+
+    session = mock.Mock()
+    session.get.side_effect = [mock.Mock(status_code=429, text="slow down", headers={'Retry-After': '0'}),
+                               mock.Mock(status_code=200, text="<table></table>")]
+    fetcher = BatchFetcher(SecApiClient("test-key", session=session), api_rate=100)
+    with mock.patch.object(fetcher, "_fetch_period_from_edgar", return_value='2025-03-31'):
+        [result] = fetcher.fetch_all([URL])
+
+    assert (result.html_content, result.html_attempts, result.error) == ("<table></table>", 2, None)
+    assert fetcher.stats['throttled'] == 1
+    assert fetcher._api_bucket.rate < 100
+    assert result.to_extractor().extraction_metadata['html_fetch_attempts'] == 2
@@ -0,0 +1,87 @@
+"""
+Tests for the streaming section scanner
+"""
+
+import io
+import os
+import warnings
+
+import pytest
+
+from src.main import RepurchaseExtractor
+from src.scanner import compact_section, scan_candidate_tables
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+CORPUS = [
+    ("crs_part2item2.html", "2025-03-31"),
+    ("dfs_part2item2.html", "2024-03-31"),
+    ("acme_10k_item5.html", "2023-12-31"),
+    ("beta_10k_item5.html", "2023-12-31"),
+]
+
+FILLER = "".join(
+    f"<div><p>Paragraph {i} about nothing in particular.</p><table><tr><td>Item {i}</td><td>{i}.0</td></tr></table></div>\n"
+    for i in range(200)
+)
+
+
+def run(extractor):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            extractor.extract()
+        except Exception:
+            pass
+    # Dropped tables are screened out as empty rather than for lack of words
+    metadata = {key: value for key, value in extractor.extraction_metadata.items()
+                if not key.startswith('screen_') and not key.endswith('_seconds')}
+    return str(metadata), extractor.repurchase_data, extractor._section_split.text_before
+
+
+@pytest.mark.parametrize("fixture, period_date", CORPUS)
+def test_stream_matches_full_section(fixture, period_date):
+    path = os.path.join(FIXTURES, fixture)
+    expected = run(RepurchaseExtractor.from_html(path, period_date))
+
+    # A tiny chunk size puts chunk boundaries inside tags, entities and multi-byte characters
+    with open(path, "rb") as f:
+        extractor = RepurchaseExtractor.from_html(compact_section(f, chunk_size=7), period_date)
+    metadata, repurchase_data, text_before = run(extractor)
+
+    assert metadata == expected[0]
+    assert repurchase_data.equals(expected[1])
+    assert text_before == expected[2]
+
+
+def test_distant_text_is_dropped_and_table_indexes_kept():
+    with open(os.path.join(FIXTURES, "dfs_part2item2.html")) as f:
+        table_section = f.read()
+    section = FILLER + table_section + FILLER
+
+    compact = compact_section(section, window_chars=500)
+
+    # The table section, a 500 character window on each side and a placeholder per dropped table
+    assert len(compact) < len(table_section) + 2 * 1000 + 400 * len("<table></table>")
+    assert compact.count("<table") == section.count("<table")
+    assert "Paragraph 0 " not in compact and "Paragraph 199 " in compact
+    # Every dropped table leaves a placeholder, so the table of interest keeps its index
+    expected = run(RepurchaseExtractor.from_html(section, "2024-03-31"))
+    metadata, repurchase_data, _ = run(RepurchaseExtractor.from_stream(io.StringIO(section), "2024-03-31",
+                                                                        window_chars=500))
+    assert metadata == expected[0]
+    assert repurchase_data.equals(expected[1])
+
+
+def test_candidates_come_with_text_windows():
+    section = ("<p>Issuer purchases (in thousands)</p>"
+               "<table><tr><td>Period</td><td>Total number of shares purchased</td>"
+               "<td>Average price paid per share</td></tr></table>"
+               "<p>(1) Footnote text</p>" + FILLER)
+
+    candidates = list(scan_candidate_tables(section, window_chars=40))
+
+    assert [c.index for c in candidates] == [0]
+    assert candidates[0].text_before == "Issuer purchases (in thousands)"
+    assert candidates[0].text_after.startswith("(1) Footnote text Paragraph 0")
+    assert candidates[0].html.startswith("<table>")
@@ -0,0 +1,63 @@
+"""
+Tests for the local sec-api stand-in server
+"""
+
+import json
+import os
+import shutil
+import warnings
+
+import pytest
+
+from src.batch import BatchFetcher
+from src.clients import SecApiClient
+from src.retry import RetryPolicy
+from src.standin import StandInServer
+from src.utils import fetch_repurchases_html_section
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+URLS = [f"https://www.sec.gov/Archives/edgar/data/17843/{i:018d}/crs-20250331.htm" for i in range(6)]
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("SEC_USER_AGENT", raising=False)
+    shutil.copy(os.path.join(FIXTURES, "crs_part2item2.html"), tmp_path / "crs-20250331.part2item2.html")
+    (tmp_path / "crs-20250331.json").write_text(json.dumps({'CoverPage': {'DocumentPeriodEndDate': '2025-03-31'}}))
+    return str(tmp_path)
+
+
+def test_batch_extraction_against_standin(fixtures_dir):
+    with StandInServer(fixtures_dir, latency=0.01) as server:
+        fetcher = BatchFetcher(SecApiClient("any-key", base_url=server.base_url), max_concurrency=3)
+        results = fetcher.fetch_all(URLS)
+    assert server.stats['ok'] == 12
+
+    assert all(result.error is None and result.period_report_date == '2025-03-31' for result in results)
+    extractor = results[0].to_extractor()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        extractor.extract()
+    assert list(extractor.repurchase_data['remaining_auth']) == [359.7, 359.7, 322.2, 322.2]
+
+
+def test_error_and_rate_limit_injection(fixtures_dir):
+    with StandInServer(fixtures_dir, error_rate=1.0) as server:
+        with pytest.raises(Exception, match="API error: 500"):
+            SecApiClient("any-key", base_url=server.base_url).xbrl_to_json(URLS[0])
+
+    with StandInServer(fixtures_dir, rate_limit=2) as server:
+        client = SecApiClient("any-key", base_url=server.base_url)
+        fetch_log = {}
+        for _ in range(3):
+            html = fetch_repurchases_html_section(URLS[0], client=client, fetch_log=fetch_log,
+                                                  retry_policy=RetryPolicy(base_delay=1.0, seed=1))
+        # The third request inside the same second is throttled, then retried after the backoff pause
+        assert html.startswith("<")
+        assert fetch_log['attempts'] >= 2
+    assert server.stats['throttled'] >= 1
+
+    with StandInServer(fixtures_dir) as server:
+        with pytest.raises(Exception, match="API error: 404"):
+            SecApiClient("any-key", base_url=server.base_url).get_section("https://www.sec.gov/unknown.htm")
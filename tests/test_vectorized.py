@@ -0,0 +1,99 @@
+"""
+Parity of the whole-table cell cleaners with the per-cell functions
+"""
+
+import os
+import random
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+import pytest
+from bs4 import BeautifulSoup
+
+from src import vectorized
+from src.main import CELL_CLEANUP_STEPS
+from src.utils import (convert_to_number, dollar_extractor, inner_cell_health_checker, text_reducer,
+                       text_reducer2)
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+ODD_CELLS = ["", " ", "\xa0$​ 1,234 ", "Total [1]", "(in thousands) Shares", "Issuer (a) purchases",
+             "Oct 1 – 31, 2024¹²", "n/a", "!p", "!o", "1e3", "nan", "(1)\n(2)", "(open\nparen)", "$ in millions",
+             "a\x1fb", "THOUSANDS of shares", np.nan, None]
+
+
+def fixture_tables():
+    tables = []
+    for name in sorted(os.listdir(FIXTURES)):
+        with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+            soup = BeautifulSoup(f.read(), "lxml")
+        for table in soup.find_all("table"):
+            try:
+                tables.append(pd.read_html(StringIO(str(table)))[0])
+            except ValueError:
+                pass
+    return tables
+
+
+def odd_tables(count=60, seed=0):
+    rnd = random.Random(seed)
+    return [pd.DataFrame([[rnd.choice(ODD_CELLS) for _ in range(rnd.randint(1, 5))]
+                          for _ in range(rnd.randint(1, 6))]) for _ in range(count)]
+
+
+def assert_same(result, expected):
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(result.dtypes) == list(expected.dtypes)
+
+
+RAW_TABLES = fixture_tables()
+CLEAN_TABLES = [CELL_CLEANUP_STEPS.apply(df).replace("", np.nan) for df in RAW_TABLES] + odd_tables()
+
+
+def test_clean_cells_matches_cleanup_steps():
+    for df in RAW_TABLES + odd_tables(seed=1):
+        assert_same(vectorized.clean_cells(df), CELL_CLEANUP_STEPS.apply(df))
+
+
+@pytest.mark.parametrize("whole_table, per_cell", [
+    (vectorized.text_reducer_cells, text_reducer),
+    (vectorized.text_reducer2_cells, text_reducer2),
+    (vectorized.dollar_extractor_cells, dollar_extractor),
+    (vectorized.convert_to_number_cells, convert_to_number),
+    (vectorized.inner_cell_health_checker_cells, inner_cell_health_checker),
+])
+def test_whole_table_matches_map(whole_table, per_cell):
+    for df in CLEAN_TABLES:
+        assert_same(whole_table(df), df.map(per_cell))
+
+
+def test_cells_do_not_run_into_each_other():
+    df = pd.DataFrame([["Shares (open", "close) purchased", "in"], ["thousands", np.nan, "$"]])
+
+    # The parentheses are not closed within the first cell, so nothing is removed as parenthetical
+    assert vectorized.text_reducer_cells(df).values.tolist() == [["Shares open", "close purchased", "in"],
+                                                                  ["", np.nan, ""]]
+    assert_same(vectorized.text_reducer_cells(df), df.map(text_reducer))
+
+
+def test_tables_the_fast_path_cannot_take_fall_back_to_map():
+    separator = pd.DataFrame([["a\x00(b)", "c"]])
+    assert_same(vectorized.text_reducer_cells(separator), separator.map(text_reducer))
+
+    # Numbers are not text: the per-cell function's error comes through
+    with pytest.raises(TypeError):
+        vectorized.text_reducer_cells(pd.DataFrame([["Total", 1.5]]))
+    with pytest.raises(TypeError):
+        vectorized.dollar_extractor_cells(pd.DataFrame([["$", 2]]))
+
+
+@pytest.mark.parametrize("df", [RAW_TABLES[0], pd.DataFrame([["a\x00(b)", 1.5]])])
+def test_clean_cells_is_timed_per_cleanup_step(df):
+    timings = {}
+
+    vectorized.clean_cells(df, timings)
+
+    assert list(timings) == CELL_CLEANUP_STEPS.names
+    assert all(seconds >= 0 for seconds in timings.values())